@@ -13,19 +13,27 @@ The pipeline:
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 import spacy
 import yaml
 from unstructured.partition.auto import partition
 from unstructured.partition.common import UnsupportedFileFormatError
 from llama_index.core import Document
-from llama_index.embeddings.ollama import (
-    OllamaEmbedding,
-)
 
 # Add src to Python path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -88,11 +96,45 @@ def parse_yaml_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
         return {}, content
 
 
-def parse_documents(source_dir: Path) -> List[Document]:  # noqa: D401
-    """Parse files in the directory into LlamaIndex Document objects."""
+def _cancelled(cancel_event: Optional[threading.Event]) -> bool:
+    """Return whether the caller has asked ingestion to stop."""
+    return cancel_event is not None and cancel_event.is_set()
+
+
+def _listed_paths(files: Iterable[Union[str, os.PathLike]]) -> Iterator[Path]:
+    """Yield the listed files that ``rglob("*.*")`` would have matched."""
+    for file in files:
+        path = Path(file)
+        if "." in path.name:
+            yield path
+
+
+def parse_documents(
+    source_dir: Path,
+    files: Optional[Iterable[Union[str, os.PathLike]]] = None,
+    cancel_event: Optional[threading.Event] = None,
+    progress_cb: Optional[Callable[[int, str], None]] = None,
+) -> List[Document]:  # noqa: D401
+    """Parse files in the directory into LlamaIndex Document objects.
+
+    Callers that already listed the directory, such as the TUI ingest
+    screen, can pass the paths (or ``os.DirEntry`` objects) as ``files``
+    so the tree is not walked a second time; they are filtered the same
+    way as the walk. Parsing stops before the next file once
+    ``cancel_event`` is set. ``progress_cb`` is given the number of files
+    handled so far and the name of the next one before it is parsed.
+    """
 
     docs: List[Document] = []
-    for file_path in source_dir.rglob("*.*"):
+    paths = source_dir.rglob("*.*") if files is None else _listed_paths(files)
+    for handled, file_path in enumerate(paths):
+        if _cancelled(cancel_event):
+            logger.info("Parsing cancelled after %d documents", len(docs))
+            break
+
+        if progress_cb is not None:
+            progress_cb(handled, file_path.name)
+
         if file_path.is_dir():
             continue
 
@@ -179,23 +221,36 @@ def extract_entities(
     return [(ent.text, ent.label_) for ent in doc.ents]
 
 
-def ingest(source_dir: Path) -> None:  # noqa: D401
+def ingest(
+    source_dir: Path,
+    files: Optional[Iterable[Union[str, os.PathLike]]] = None,
+    cancel_event: Optional[threading.Event] = None,
+    progress_cb: Optional[Callable[[int, str], None]] = None,
+) -> None:  # noqa: D401
+    """Run the ingestion pipeline over ``source_dir``.
+
+    ``files`` and ``progress_cb`` are passed on to :func:`parse_documents`.
+    The pipeline runs on whatever thread calls it, which nothing can
+    interrupt from outside. Callers that need to abandon it pass
+    ``cancel_event``; once set, ingestion stops at the next file or
+    before the next storage stage.
+    """
     nlp = _load_spacy()
-    docs = parse_documents(source_dir)
+    docs = parse_documents(source_dir, files, cancel_event, progress_cb)
+    if _cancelled(cancel_event):
+        logger.info("Ingestion cancelled before storing documents")
+        return
 
     # ------------------------------------
     # Embedding + ChromaDB via LlamaIndex
     # ------------------------------------
-    embed_model = OllamaEmbedding(
-        model_name=settings.ollama_embedding_model,
-        base_url=settings.ollama_host,
-    )
-
-    # Create ChromaDB agent and get the collection
+    # The collection embeds documents with its registered Ollama embedding
+    # function, one batch per ChromaDBAgent.add_documents chunk.
     chroma_agent = ChromaDBAgent()
-    collection = chroma_agent._collection
 
-    # Create embeddings for each document and add to ChromaDB
+    ids: List[str] = []
+    texts: List[str] = []
+    metadatas: List[Dict[str, Any]] = []
     for i, doc in enumerate(docs):
         # Skip empty documents
         if not doc.text or len(doc.text.strip()) == 0:
@@ -204,39 +259,34 @@ def ingest(source_dir: Path) -> None:  # noqa: D401
                 f"{doc.metadata.get('filename', 'unknown')}"
             )
             continue
+        ids.append(f"doc_{i}")
+        texts.append(doc.text)
+        metadatas.append(doc.metadata)
 
-        try:
-            # Generate embedding for the document
-            embedding = embed_model.get_text_embedding(doc.text)
-
-            # Add document to ChromaDB collection
-            collection.add(
-                documents=[doc.text],
-                embeddings=[embedding],
-                metadatas=[doc.metadata],
-                ids=[f"doc_{i}"]
-            )
-            logger.debug(
-                f"Added document {i} to ChromaDB: "
-                f"{doc.metadata.get('filename', 'unknown')}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to process document {i}: {e}")
-            continue
+    # Failures are handled per batch and then per document inside
+    # add_documents, so only the documents that were stored are counted
+    stored = chroma_agent.add_documents(ids, texts, metadatas)
+
+    logger.info("Embedded %d of %d documents into ChromaDB", stored, len(ids))
 
-    logger.info("Embedded %d documents into ChromaDB", len(docs))
+    if _cancelled(cancel_event):
+        logger.info("Ingestion cancelled before entity extraction")
+        return
 
     # ------------------------------------
     # Entity extraction + Neo4j
     # ------------------------------------
     neo = Neo4jAgent()
     for doc in docs:
+        if _cancelled(cancel_event):
+            logger.info("Entity extraction cancelled")
+            break
         ents = extract_entities(doc.text, nlp)
         for ent_text, label in ents:
             cypher = (
                 "MERGE (e:Entity {name:$name, label:$label}) RETURN e"
             )
-            neo.query(cypher, {"name": ent_text, "label": label})
+            neo.query(cypher, {"name": ent_text, "label": label}, write=True)
     neo.close()
     logger.info("Inserted entities into Neo4j")
 
@@ -61,7 +61,7 @@ async def readiness_check() -> Dict[str, Any]:
     # Check Neo4j connectivity
     try:
         neo4j_agent = _get_neo4j_agent()
-        neo4j_agent.query("MATCH RETURN 1")
+        neo4j_agent.query("RETURN 1")
         checks["neo4j"]["status"] = "healthy"
     except Exception as e:
         checks["neo4j"]["status"] = "unhealthy"
@@ -4,7 +4,8 @@ LangGraph workflow definition for the research pipeline.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Callable, Dict, Optional
 
 from langgraph.graph import END, StateGraph
 
@@ -48,12 +49,22 @@ def create_research_graph() -> StateGraph:
     return create_graph()
 
 
-def run_research_job(topic: str, job_id: Optional[str] = None) -> Dict[str, Any]:
+def run_research_job(
+    topic: str,
+    job_id: Optional[str] = None,
+    cancel_event: Optional[threading.Event] = None,
+    progress_cb: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
     """Run a complete research job using the ARIS workflow.
 
     Args:
         topic: The research topic
         job_id: Optional job ID (will be generated if not provided)
+        cancel_event: Optional event checked between workflow steps; once
+            set, the job stops before its next step and reports
+            ``"cancelled"``
+        progress_cb: Optional callback given the name of each workflow node
+            as soon as it finishes, for reporting progress while the job runs
 
     Returns:
         Dictionary containing job results and metadata
@@ -82,8 +93,25 @@ def run_research_job(topic: str, job_id: Optional[str] = None) -> Dict[str, Any]
     graph = create_research_graph()
 
     try:
-        # Run the workflow
-        final_state = graph.invoke(initial_state)
+        # Run the workflow step by step so cancellation takes effect
+        # between nodes instead of only after the whole graph finishes
+        final_state: Dict[str, Any] = {}
+        for mode, chunk in graph.stream(
+            initial_state, stream_mode=["updates", "values"]
+        ):
+            if mode == "values":
+                final_state = chunk
+            elif progress_cb is not None:
+                for node in chunk:
+                    progress_cb(node)
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"Research job {job_id} cancelled")
+                return {
+                    "job_id": job_id,
+                    "topic": topic,
+                    "status": "cancelled",
+                    "error": None,
+                }
 
         result = {
             "job_id": job_id,
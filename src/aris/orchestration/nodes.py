@@ -27,6 +27,10 @@ import ollama  # noqa: E402
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Per-job scratch directories live under the project workspace
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_SCRATCH_BASE = _PROJECT_ROOT / "scratch"
+
 # Lazy initialization to avoid connection attempts during import
 OLLAMA_CLIENT: ollama.Client | None = None
 
@@ -316,11 +320,7 @@ def initialize_job(state: ResearchState) -> ResearchState:
     logger.info(f"Initializing job {state.job_id} for topic: {state.topic}")
 
     # Create scratch directory within the project workspace
-    project_root = Path(__file__).parent.parent.parent.parent
-    scratch_base = project_root / "scratch"
-    scratch_base.mkdir(exist_ok=True)
-
-    scratch_dir = scratch_base / f"aris_{state.job_id}"
+    scratch_dir = _SCRATCH_BASE / f"aris_{state.job_id}"
     state.job_scratch_dir = scratch_dir
     scratch_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Created scratch directory: {scratch_dir}")
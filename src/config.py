@@ -57,12 +57,22 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str
+    # Bolt connections per driver; also sizes the Neo4j worker thread pool
+    neo4j_pool_size: int = max(50, 4 * (os.cpu_count() or 1))
+    # Seconds to wait for a free pooled connection before failing a query
+    neo4j_acq_timeout: float = 60.0
+    # Seconds before a pooled connection is retired and reopened
+    neo4j_max_connection_lifetime: int = 3600
 
     # --- Ollama Model Configuration ---
     ollama_host: str = "http://localhost:11434"
     ollama_model: str = "llama3"
     ollama_embedding_model: str  # This was the missing field
 
+    # --- ChromaDB Configuration ---
+    # Directory of the persistent vector store shared across runs
+    chroma_path: str = "./chroma_db"
+
     # --- Search API Configuration (Optional) ---
     # SerpAPI (Primary - multiple search engines, language filtering)
     serpapi_key: Optional[str] = None
@@ -99,6 +109,15 @@ class Settings(BaseSettings):
 
         return data
 
+    # --- Orchestration Configuration ---
+    # Validator passes allowed before the agent graph stops without
+    # synthesizing.
+    max_iterations: int = 2
+    # ARIS research jobs allowed to run at once; further jobs wait their turn
+    aris_max_concurrent: int = 2
+    # Threads in the TUI's default executor, used by asyncio.to_thread calls
+    tui_thread_pool_size: int = 8
+
     # --- Miscellaneous Configuration ---
     app_env: str = "dev"
     log_level: str = "INFO"
@@ -2,36 +2,60 @@
 
 from __future__ import annotations
 
+import logging
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph
 
+from src.config import get_settings
 from src.utils.logger import get_logger
 
 from .nodes import (
     planner_node,
+    planner_node_async,
     synthesizer_node,
+    synthesizer_node_async,
     tool_executor_node,
+    tool_executor_node_async,
     validation_critique_node,
 )
 from .state import AgentState
 
 logger = get_logger(__name__)
 
+# Routing is a table lookup on the iteration counter: every index up to and
+# including MAX_ITERATIONS synthesizes, anything past the table finishes.
+MAX_ITERATIONS = get_settings().max_iterations
+_EDGE_TABLE = ("synth",) * (MAX_ITERATIONS + 1)
+
 
 def _edge_selector(state: AgentState) -> str:
     """Route based on iteration count to prevent infinite loops."""
-    if state.iteration > 2:
+    iteration = state.iteration
+    route = _EDGE_TABLE[iteration] if iteration < len(_EDGE_TABLE) else "finish"
+    if route == "finish":
         logger.warning("Max iterations reached. Finishing.")
-        return "finish"
-    logger.info("Plan execution complete. Proceeding to synthesize.")
-    return "synth"
+    elif logger.isEnabledFor(logging.INFO):
+        logger.info("Plan execution complete. Proceeding to synthesize.")
+    return route
 
 
-# Single unified graph that handles both sync and async nodes
+# Single unified graph that handles both sync and async nodes. The LLM-bound
+# nodes carry an async implementation so that .ainvoke() awaits Ollama on the
+# caller's event loop while .invoke() keeps using the blocking client.
 builder = StateGraph(AgentState)
-builder.add_node("planner", planner_node)
-builder.add_node("executor", tool_executor_node)
+builder.add_node(
+    "planner", RunnableLambda(planner_node, afunc=planner_node_async, name="planner")
+)
+builder.add_node(
+    "executor",
+    RunnableLambda(tool_executor_node, afunc=tool_executor_node_async, name="executor"),
+)
 builder.add_node("validator", validation_critique_node)
-builder.add_node("synthesizer", synthesizer_node)
+builder.add_node(
+    "synthesizer",
+    RunnableLambda(synthesizer_node, afunc=synthesizer_node_async, name="synthesizer"),
+)
 
 builder.set_entry_point("planner")
 builder.add_edge("planner", "executor")
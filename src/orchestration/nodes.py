@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-import textwrap
-
+import asyncio
+import atexit
+import json
+import threading
+import time
+import uuid
+from typing import Any
+
+import chromadb
+import httpx
 import ollama
+from cachetools import TTLCache
 
 from src.config import get_settings
 from src.orchestration.state import AgentState
@@ -16,28 +25,107 @@ from src.utils.schema_validator import (
     sanitize_user_input,
 )
 
+# HTTP/2 needs the optional h2 package; without it httpx stays on HTTP/1.1.
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Lazy initialization to avoid connection attempts during import
+# Connection pool settings shared by the Ollama clients. Connections are kept
+# alive between planner and synthesizer calls instead of being re-opened per
+# request. Set OLLAMA_NUM_PARALLEL on the Ollama server so concurrent requests
+# are actually served in parallel.
+OLLAMA_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=40,
+    max_connections=100,
+    keepalive_expiry=30,
+)
+
+# Lazy initialization to avoid connection attempts during import. Tools run
+# on worker threads, so construction is double-checked under a lock to keep
+# concurrent first calls from building duplicate clients.
 OLLAMA_CLIENT: ollama.Client | None = None
+OLLAMA_ASYNC_CLIENT: ollama.AsyncClient | None = None
 neo4j_agent: Neo4jAgent | None = None
 chromadb_agent: ChromaDBAgent | None = None
 
+_ollama_client_lock = threading.Lock()
+_neo4j_agent_lock = threading.Lock()
+_chromadb_agent_lock = threading.Lock()
+
 
 def _get_ollama_client():
     """Get or create Ollama client lazily."""
     global OLLAMA_CLIENT
     if OLLAMA_CLIENT is None:
-        OLLAMA_CLIENT = ollama.Client(host=settings.ollama_host)
+        with _ollama_client_lock:
+            if OLLAMA_CLIENT is None:
+                OLLAMA_CLIENT = ollama.Client(
+                    host=settings.ollama_host, limits=OLLAMA_HTTP_LIMITS
+                )
     return OLLAMA_CLIENT
 
 
+def _get_ollama_async_client():
+    """Get or create the async Ollama client lazily."""
+    global OLLAMA_ASYNC_CLIENT
+    if OLLAMA_ASYNC_CLIENT is None:
+        with _ollama_client_lock:
+            if OLLAMA_ASYNC_CLIENT is None:
+                OLLAMA_ASYNC_CLIENT = ollama.AsyncClient(
+                    host=settings.ollama_host,
+                    http2=HTTP2_AVAILABLE,
+                    limits=OLLAMA_HTTP_LIMITS,
+                )
+    return OLLAMA_ASYNC_CLIENT
+
+
+@atexit.register
+def close_ollama_clients() -> None:
+    """Close the pooled Ollama connections."""
+    global OLLAMA_CLIENT, OLLAMA_ASYNC_CLIENT
+    if OLLAMA_CLIENT is not None:
+        OLLAMA_CLIENT.close()
+        OLLAMA_CLIENT = None
+    if OLLAMA_ASYNC_CLIENT is not None:
+        try:
+            asyncio.run(OLLAMA_ASYNC_CLIENT.close())
+        except Exception as e:
+            logger.debug("Failed to close async Ollama client: %s", e)
+        OLLAMA_ASYNC_CLIENT = None
+
+
+# Async tools called from the sync executor run on one long-lived event loop
+# in a daemon thread rather than spinning up a fresh loop per call.
+_BG_LOOP: asyncio.AbstractEventLoop | None = None
+_bg_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop lazily."""
+    global _BG_LOOP
+    with _bg_loop_lock:
+        if _BG_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="tool-executor-loop", daemon=True
+            ).start()
+            _BG_LOOP = loop
+    return _BG_LOOP
+
+
 def _get_neo4j_agent():
     """Get or create Neo4j agent lazily."""
     global neo4j_agent
     if neo4j_agent is None:
-        neo4j_agent = Neo4jAgent()
+        with _neo4j_agent_lock:
+            if neo4j_agent is None:
+                neo4j_agent = Neo4jAgent()
     return neo4j_agent
 
 
@@ -45,14 +133,47 @@ def _get_chromadb_agent():
     """Get or create ChromaDB agent lazily."""
     global chromadb_agent
     if chromadb_agent is None:
-        chromadb_agent = ChromaDBAgent()
+        with _chromadb_agent_lock:
+            if chromadb_agent is None:
+                chromadb_agent = ChromaDBAgent()
     return chromadb_agent
 
 
-# --- TOOL DEFINITIONS ---
+# --- TOOL RESULT CACHE ---
+
+# The graph search Cypher does not depend on the query at all, so its output
+# is memoized in a single slot. Vector searches are cached by ChromaDBAgent,
+# which drops them whenever documents are added.
+TOOL_CACHE_TTL = 300.0
+GRAPH_SEARCH_CYPHER = "MATCH (n) RETURN n.name AS name, n.label AS label LIMIT 5"
+
+_tool_cache_lock = threading.Lock()
+_graph_search_cache: TTLCache = TTLCache(maxsize=1, ttl=TOOL_CACHE_TTL)
 
 
-# In agent_stack/src/orchestration/nodes.py
+def _cache_get(cache: TTLCache, key: str) -> str | None:
+    """Return a cached tool output, or None on a miss."""
+    with _tool_cache_lock:
+        output = cache.get(key)
+    if output is not None:
+        increment("tool_cache_hits")
+    return output
+
+
+def _cache_put(cache: TTLCache, key: str, output: str) -> str:
+    """Store a tool output and return it."""
+    with _tool_cache_lock:
+        cache[key] = output
+    return output
+
+
+def clear_tool_caches() -> None:
+    """Drop all memoized tool outputs."""
+    with _tool_cache_lock:
+        _graph_search_cache.clear()
+
+
+# --- TOOL DEFINITIONS ---
 
 
 @timed("vector_search_duration")
@@ -61,10 +182,7 @@ def vector_search(state: AgentState) -> str:
     logger.info("Executing tool: vector_search")
     increment("vector_search_calls")
 
-    # This is the corrected line:
-    # It now calls .similarity_search() instead of .search()
     results = _get_chromadb_agent().similarity_search(state.query)
-
     return "\n".join(results)
 
 
@@ -83,8 +201,13 @@ def graph_search(state: AgentState) -> str:
     """Performs a graph query in Neo4j."""
     logger.info("Executing tool: graph_search")
     increment("graph_search_calls")
-    cypher_query = "MATCH (n) RETURN n.name AS name, n.label AS label LIMIT 5"
-    return str(_get_neo4j_agent().query(cypher_query))
+
+    cached_output = _cache_get(_graph_search_cache, GRAPH_SEARCH_CYPHER)
+    if cached_output is not None:
+        return cached_output
+
+    results = _get_neo4j_agent().query(GRAPH_SEARCH_CYPHER)
+    return _cache_put(_graph_search_cache, GRAPH_SEARCH_CYPHER, str(results))
 
 
 @timed("graph_search_async_duration")
@@ -92,9 +215,13 @@ async def graph_search_async(state: AgentState) -> str:
     """Async version of graph search for better performance."""
     logger.info("Executing tool: graph_search_async")
     increment("graph_search_async_calls")
-    cypher_query = "MATCH (n) RETURN n.name AS name, n.label AS label LIMIT 5"
-    results = await _get_neo4j_agent().query_async(cypher_query)
-    return str(results)
+
+    cached_output = _cache_get(_graph_search_cache, GRAPH_SEARCH_CYPHER)
+    if cached_output is not None:
+        return cached_output
+
+    results = await _get_neo4j_agent().query_async(GRAPH_SEARCH_CYPHER)
+    return _cache_put(_graph_search_cache, GRAPH_SEARCH_CYPHER, str(results))
 
 
 TOOL_MAP = {
@@ -106,8 +233,224 @@ TOOL_MAP = {
 
 # --- NODE IMPLEMENTATIONS ---
 
+PLANNER_MAX_RETRIES = 3
+FALLBACK_PLAN = ["vector_search"]
+
+
+# --- SEMANTIC PLAN CACHE ---
+
+# Plans are reused for queries whose embedding lies within this cosine
+# distance of an already planned query, so paraphrases skip the planner LLM.
+# The in-memory index is dropped and rebuilt once it reaches its size cap.
+PLAN_CACHE_MAX_DISTANCE = 0.05
+PLAN_CACHE_MAXSIZE = 1024
+PLAN_CACHE_COLLECTION = "plan_cache"
+
+# The lookup runs before every LLM-planned query, so its embedding call is
+# held to a short timeout. After a failure, lookups are skipped for a while
+# instead of every query waiting out the timeout against a slow or stopped
+# Ollama.
+PLAN_CACHE_EMBED_TIMEOUT = 2.0
+PLAN_CACHE_RETRY_AFTER = 30.0
+
+# Built once here rather than through ChromaDBAgent, whose first use opens
+# the persistent store and probes the embedding model
+plan_cache_client = chromadb.Client()
+plan_embed_client = ollama.Client(
+    host=settings.ollama_host, timeout=PLAN_CACHE_EMBED_TIMEOUT
+)
+plan_cache: Any = None
+_plan_cache_lock = threading.Lock()
+# time.monotonic() before which plan cache lookups are skipped
+_plan_embed_retry_at = 0.0
+
+
+def _get_plan_cache():
+    """Get or create the in-memory plan cache collection lazily."""
+    global plan_cache
+    with _plan_cache_lock:
+        if plan_cache is None:
+            plan_cache = plan_cache_client.get_or_create_collection(
+                PLAN_CACHE_COLLECTION,
+                embedding_function=None,
+                metadata={"hnsw:space": "cosine"},
+            )
+    return plan_cache
+
+
+def clear_plan_cache() -> None:
+    """Drop every cached plan."""
+    global plan_cache
+    with _plan_cache_lock:
+        if plan_cache is not None:
+            try:
+                plan_cache_client.delete_collection(PLAN_CACHE_COLLECTION)
+            except Exception as e:
+                logger.debug("Failed to delete plan cache: %s", e)
+            plan_cache = None
+
+
+def _embed_for_plan_cache(sanitized_query: str) -> list[float] | None:
+    """Return the query's embedding, or None when it failed recently."""
+    global _plan_embed_retry_at
+    if time.monotonic() < _plan_embed_retry_at:
+        return None
+    try:
+        response = plan_embed_client.embed(
+            model=settings.ollama_embedding_model, input=sanitized_query
+        )
+        return list(response["embeddings"][0])
+    except Exception as e:
+        _plan_embed_retry_at = time.monotonic() + PLAN_CACHE_RETRY_AFTER
+        logger.debug(
+            "Plan cache embedding failed, skipping lookups for %.0fs: %s",
+            PLAN_CACHE_RETRY_AFTER,
+            e,
+        )
+        return None
+
+
+def _lookup_cached_plan(
+    sanitized_query: str,
+) -> tuple[list[float] | None, list[str] | None]:
+    """Return the query embedding and a cached plan for a similar query.
+
+    Any failure is treated as a miss so the planner can still call the LLM;
+    the embedding is None when it could not be computed.
+    """
+    embedding = _embed_for_plan_cache(sanitized_query)
+    if embedding is None:
+        return None, None
+
+    try:
+        hit = _get_plan_cache().query(query_embeddings=[embedding], n_results=1)
+        distances = (hit.get("distances") or [[]])[0]
+        if distances and distances[0] <= PLAN_CACHE_MAX_DISTANCE:
+            plan = json.loads(hit["metadatas"][0][0]["plan"])
+            increment("plan_cache_hits")
+            logger.info("Reusing cached plan for a similar query: %s", plan)
+            return embedding, plan
+    except Exception as e:
+        logger.debug("Plan cache lookup failed: %s", e)
+    return embedding, None
+
+
+def _store_cached_plan(embedding: list[float] | None, plan: list[str] | None) -> None:
+    """Remember an LLM-generated plan under its query embedding."""
+    if embedding is None or plan is None:
+        return
+    try:
+        if _get_plan_cache().count() >= PLAN_CACHE_MAXSIZE:
+            clear_plan_cache()
+        _get_plan_cache().add(
+            ids=[uuid.uuid4().hex],
+            embeddings=[embedding],
+            metadatas=[{"plan": json.dumps(plan)}],
+        )
+    except Exception as e:
+        logger.debug("Failed to cache plan: %s", e)
+
+
+# Few-shot plans shown to the planner, serialized once at import so the
+# examples are always well-formed JSON.
+PLANNER_EXAMPLE_PLANS = (
+    ["vector_search"],
+    ["graph_search"],
+    ["vector_search", "graph_search"],
+    ["vector_search_async", "graph_search_async"],
+)
+_PLANNER_EXAMPLES = "\n".join(
+    json.dumps({"plan": plan}) for plan in PLANNER_EXAMPLE_PLANS
+)
+
+# Enhanced prompt with few-shot examples and stricter JSON requirements.
+# Literal braces in the examples are doubled for str.format.
+_PLANNER_TEMPLATE = (
+    "You are an expert AI planner. "
+    "Your task is to create a step-by-step plan to answer the user's "
+    "query. Choose from the available tools. Return ONLY valid JSON "
+    "with a single key 'plan' mapping to a list of tool names.\n\n"
+    "Available tools:\n"
+    "- 'vector_search': broad, semantic queries.\n"
+    "- 'graph_search': relationship queries.\n"
+    "- 'vector_search_async': async version of vector search.\n"
+    "- 'graph_search_async': async version of graph search.\n\n"
+    'User\'s query: "{query}"\n\n'
+    "IMPORTANT: Return ONLY valid JSON. No explanations, no markdown, "
+    "no additional text. Just the JSON object.\n\n"
+    "Examples of valid responses:\n"
+    + _PLANNER_EXAMPLES.replace("{", "{{").replace("}", "}}")
+    + "\n\nYour response:"
+)
+
+
+def _build_planner_prompt(sanitized_query: str) -> str:
+    """Return the planner prompt for an already sanitized query."""
+    return _PLANNER_TEMPLATE.format(query=sanitized_query)
+
+
+# Phrases that route a query without asking the planner LLM. A query that
+# matches only one group gets that group's tool; anything ambiguous, or
+# matching neither group, still goes to the LLM.
+_GRAPH_WORDS = frozenset(
+    {"relationship", "connected", "related to", "depends on", "graph"}
+)
+_VECTOR_WORDS = frozenset({"what is", "about", "describe", "summarize"})
+
+
+def _route_by_keywords(sanitized_query: str) -> list[str] | None:
+    """Return a plan for an obviously routable query, or None."""
+    ql = sanitized_query.lower()
+    graph = any(w in ql for w in _GRAPH_WORDS)
+    vector = any(w in ql for w in _VECTOR_WORDS)
+    if graph and not vector:
+        return ["graph_search"]
+    if vector and not graph:
+        return ["vector_search"]
+    return None
+
+
+def _parse_plan(response: Any, attempt: int) -> list[str] | None:
+    """Extract a validated plan from an LLM response, or None if unusable.
+
+    ``response`` may also be the exception raised by the LLM call, so that
+    results gathered with ``return_exceptions=True`` can be handled uniformly.
+    """
+    if isinstance(response, BaseException):
+        logger.error("Unexpected error on attempt %d: %s", attempt, response)
+        return None
+
+    try:
+        # Log the raw response for debugging
+        raw_response = response.get("response", "")
+        logger.debug("LLM raw response (attempt %d): %s", attempt, raw_response)
+
+        # Use safe JSON parser with schema validation
+        plan_data = SafeJSONParser.safe_parse_json(raw_response, "planner")
+        return plan_data["plan"]
+    except SchemaValidationError as e:
+        logger.error(
+            "Schema validation error on attempt %d: %s. " "Raw response: %s",
+            attempt,
+            e,
+            raw_response,
+        )
+    except Exception as e:
+        logger.error("Unexpected error on attempt %d: %s", attempt, e)
+    return None
+
+
+def _plan_result(state: AgentState, plan: list[str] | None) -> dict:
+    """Build the planner node update, falling back when no plan was parsed."""
+    if plan is None:
+        logger.error("All retry attempts failed. Using fallback plan.")
+        return {"plan": list(FALLBACK_PLAN)}
 
-# In agent_stack/src/orchestration/nodes.py
+    if state.ui:
+        state.ui("planning_complete")
+
+    logger.info("Generated plan: %s", plan)
+    return {"plan": plan}
 
 
 @timed("planner_duration")
@@ -120,110 +463,111 @@ def planner_node(state: AgentState) -> dict:
     logger.info("Planner received query: %s", sanitized_query)
     increment("planner_calls")
 
-    # Enhanced prompt with few-shot examples and stricter JSON requirements
-    prompt = textwrap.dedent(
-        (
-            "You are an expert AI planner. "
-            "Your task is to create a step-by-step plan to answer the user's "
-            "query. Choose from the available tools. Return ONLY valid JSON "
-            "with a single key 'plan' mapping to a list of tool names.\n\n"
-            "Available tools:\n"
-            "- 'vector_search': broad, semantic queries.\n"
-            "- 'graph_search': relationship queries.\n"
-            "- 'vector_search_async': async version of vector search.\n"
-            "- 'graph_search_async': async version of graph search.\n\n"
-            f'User\'s query: "{sanitized_query}"\n\n'
-            "IMPORTANT: Return ONLY valid JSON. No explanations, no markdown, "
-            "no additional text. Just the JSON object.\n\n"
-            "Examples of valid responses:\n"
-            '{"plan": ["vector_search"]}\n'
-            '{"plan": ["graph_search"]}\n'
-            '{"plan": ["vector_search", "graph_search"]}\n'
-            '{"plan": ["vector_search_async", "graph_search_async"]}\n\n'
-            "Your response:"
-        )
-    )
+    keyword_plan = _route_by_keywords(sanitized_query)
+    if keyword_plan is not None:
+        increment("planner_keyword_routes")
+        return _plan_result(state, keyword_plan)
+
+    embedding, cached_plan = _lookup_cached_plan(sanitized_query)
+    if cached_plan is not None:
+        return _plan_result(state, cached_plan)
+
+    prompt = _build_planner_prompt(sanitized_query)
 
-    max_retries = 3
-    for attempt in range(max_retries):
+    plan = None
+    for attempt in range(1, PLANNER_MAX_RETRIES + 1):
         try:
             # Call Ollama client directly (synchronous)
             response = _get_ollama_client().generate(settings.ollama_model, prompt)
+        except Exception as e:
+            response = e
+        plan = _parse_plan(response, attempt)
+        if plan is not None:
+            break
 
-            # Log the raw response for debugging
-            raw_response = response.get("response", "")
-            logger.debug("LLM raw response (attempt %d): %s", attempt + 1, raw_response)
+    _store_cached_plan(embedding, plan)
+    return _plan_result(state, plan)
 
-            # Use safe JSON parser with schema validation
-            try:
-                plan_data = SafeJSONParser.safe_parse_json(raw_response, "planner")
-                plan = plan_data["plan"]
 
-                if state.ui:
-                    state.ui("planning_complete")
+@timed("planner_duration")
+async def planner_node_async(state: AgentState) -> dict:
+    """
+    Async planner that keeps the event loop free while the LLM responds.
 
-                logger.info("Generated plan: %s", plan)
-                return {"plan": plan}
+    The first attempt is issued on its own. If it does not yield a valid plan,
+    the remaining retries are dispatched concurrently and the first
+    schema-valid plan wins, so a bad first answer costs one extra round-trip
+    instead of several.
+    """
+    sanitized_query = sanitize_user_input(state.query)
+    logger.info("Planner received query: %s", sanitized_query)
+    increment("planner_calls")
 
-            except SchemaValidationError as e:
-                logger.error(
-                    "Schema validation error on attempt %d: %s. " "Raw response: %s",
-                    attempt + 1,
-                    e,
-                    raw_response,
-                )
-                if attempt == max_retries - 1:
-                    logger.error("All retry attempts failed. Using fallback plan.")
-                    return {"plan": ["vector_search"]}
-                # Continue to next retry attempt
-                continue
+    keyword_plan = _route_by_keywords(sanitized_query)
+    if keyword_plan is not None:
+        increment("planner_keyword_routes")
+        return _plan_result(state, keyword_plan)
+
+    embedding, cached_plan = await asyncio.to_thread(
+        _lookup_cached_plan, sanitized_query
+    )
+    if cached_plan is not None:
+        return _plan_result(state, cached_plan)
+
+    prompt = _build_planner_prompt(sanitized_query)
+    client = _get_ollama_async_client()
+
+    plan = None
+    attempt = 0
+    for batch_size in (1, PLANNER_MAX_RETRIES - 1):
+        responses = await asyncio.gather(
+            *(
+                client.generate(model=settings.ollama_model, prompt=prompt)
+                for _ in range(batch_size)
+            ),
+            return_exceptions=True,
+        )
+        for response in responses:
+            attempt += 1
+            plan = _parse_plan(response, attempt)
+            if plan is not None:
+                break
+        if plan is not None:
+            break
+
+    await asyncio.to_thread(_store_cached_plan, embedding, plan)
+    return _plan_result(state, plan)
 
-        except Exception as e:
-            logger.error("Unexpected error on attempt %d: %s", attempt + 1, e)
-            if attempt == max_retries - 1:
-                logger.error("All retry attempts failed. Using fallback plan.")
-                return {"plan": ["vector_search"]}
-            # Continue to next retry attempt
-            continue
 
-    # This should never be reached due to the logic above, but just in case
-    logger.error("Unexpected fallback reached. Using default plan.")
-    return {"plan": ["vector_search"]}
+def _canonical_tool(tool_name: str) -> str:
+    """Map a tool name onto the name shared by its sync and async variants."""
+    return tool_name.removesuffix("_async")
 
 
 @timed("executor_duration")
 def tool_executor_node(state: AgentState) -> dict:
     """Synchronous version of tool executor."""
-    import asyncio
-    import concurrent.futures
-
     tool_outputs = []
+    # Outputs of tools already run, keyed on the canonical tool name
+    done: dict[str, str] = {}
 
     for tool_name in state.plan:
         if tool_name in TOOL_MAP:
             if state.ui:
                 state.ui(f"tool_start:{tool_name}")
+            key = _canonical_tool(tool_name)
             try:
-                output = TOOL_MAP[tool_name](state)
-                # Check if the output is a coroutine (async tool)
-                if asyncio.iscoroutine(output):
-                    # Try to get the current event loop
-                    try:
-                        asyncio.get_running_loop()
-                        # We're in an async context, use thread pool
-                        with concurrent.futures.ThreadPoolExecutor() as (executor):
-                            future = executor.submit(asyncio.run, output)
-                            output = future.result()
-                    except RuntimeError:
-                        # No event loop running, create a new one
-                        try:
-                            if asyncio.iscoroutine(output):
-                                output = asyncio.run(output)
-                        except Exception as e:
-                            logger.error(
-                                "Error running async tool %s: %s", tool_name, e
-                            )
-                            output = f"Error executing {tool_name}: {str(e)}"
+                if key in done:
+                    output = done[key]
+                else:
+                    output = TOOL_MAP[tool_name](state)
+                    # Async tools return a coroutine; run it on the background
+                    # loop
+                    if asyncio.iscoroutine(output):
+                        output = asyncio.run_coroutine_threadsafe(
+                            output, _get_background_loop()
+                        ).result()
+                    done[key] = output
                 tool_outputs.append(output)
             except Exception as e:
                 logger.error("Error executing tool %s: %s", tool_name, e)
@@ -236,53 +580,38 @@ def tool_executor_node(state: AgentState) -> dict:
 
 @timed("executor_duration")
 async def tool_executor_node_async(state: AgentState) -> dict:
-    """Async version of tool executor for better performance."""
-    tool_outputs = []
-
-    # Check if any tools are async
-    async_tools = []
-    sync_tools = []
+    """Async version of tool executor for better performance.
 
-    for tool_name in state.plan:
-        if tool_name in TOOL_MAP:
-            if tool_name.endswith("_async"):
-                async_tools.append(tool_name)
-            else:
-                sync_tools.append(tool_name)
+    Sync tools run in worker threads so that every tool in the plan, sync or
+    async, executes concurrently. Outputs keep the order of the plan.
+    """
+    tool_names = [name for name in state.plan if name in TOOL_MAP]
 
-    # Execute sync tools first
-    for tool_name in sync_tools:
+    # Repeated tools, and sync/async variants of one tool, share a single run
+    tasks = {}
+    for tool_name in tool_names:
         if state.ui:
             state.ui(f"tool_start:{tool_name}")
-        try:
-            output = TOOL_MAP[tool_name](state)
-            tool_outputs.append(output)
-        except Exception as e:
-            logger.error("Error executing sync tool %s: %s", tool_name, e)
-            tool_outputs.append(f"Error executing {tool_name}: {str(e)}")
-        if state.ui:
-            state.ui(f"tool_done:{tool_name}")
+        key = _canonical_tool(tool_name)
+        if key in tasks:
+            continue
+        if tool_name.endswith("_async"):
+            tasks[key] = TOOL_MAP[tool_name](state)
+        else:
+            tasks[key] = asyncio.to_thread(TOOL_MAP[tool_name], state)
 
-    # Execute async tools concurrently (moved outside sync loop)
-    if async_tools:
-        async_tasks = []
-        for tool_name in async_tools:
-            if state.ui:
-                state.ui(f"tool_start:{tool_name}")
-            task = TOOL_MAP[tool_name](state)
-            async_tasks.append((tool_name, task))
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    outputs = dict(zip(tasks, results))
 
-        # Wait for all async tools to complete
-        for tool_name, task in async_tasks:
-            # task is a coroutine from async tool functions
-            try:
-                output = await task  # type: ignore[misc]
-                tool_outputs.append(output)
-            except Exception as e:
-                logger.error("Error executing async tool %s: %s", tool_name, e)
-                tool_outputs.append(f"Error executing {tool_name}: {str(e)}")
-            if state.ui:
-                state.ui(f"tool_done:{tool_name}")
+    tool_outputs = []
+    for tool_name in tool_names:
+        output = outputs[_canonical_tool(tool_name)]
+        if isinstance(output, Exception):
+            logger.error("Error executing tool %s: %s", tool_name, output)
+            output = f"Error executing {tool_name}: {str(output)}"
+        tool_outputs.append(output)
+        if state.ui:
+            state.ui(f"tool_done:{tool_name}")
 
     return {"tool_output": tool_outputs}
 
@@ -292,15 +621,11 @@ def validation_critique_node(state: AgentState) -> dict:
     return {"iteration": state.iteration + 1}
 
 
-# In agent_stack/src/orchestration/nodes.py
+_SYNTH_PREFIX = "You are an expert AI assistant.\n\nContext from tools:\n"
 
 
-@timed("synthesizer_duration")
-def synthesizer_node(state: AgentState) -> dict:
-    logger.info("Synthesizing final response.")
-    increment("synthesizer_calls")
-    if state.ui:
-        state.ui("synth_start")
+def _build_synthesizer_prompt(state: AgentState) -> str:
+    """Return the synthesizer prompt for the collected tool outputs."""
     context = "\n---\n".join(state.tool_output)
 
     # ADD THIS LINE to see what the agent is thinking
@@ -308,19 +633,15 @@ def synthesizer_node(state: AgentState) -> dict:
 
     # Sanitize user query for synthesizer as well
     sanitized_query = sanitize_user_input(state.query)
-    prompt = (
-        "You are an expert AI assistant.\n\nContext from tools:\n"
-        + context
-        + f"\n\nUser's original query: {sanitized_query}\n\n"
-        + "Provide your final, synthesized answer now."
+    return (
+        f"{_SYNTH_PREFIX}{context}\n\n"
+        f"User's original query: {sanitized_query}\n\n"
+        "Provide your final, synthesized answer now."
     )
-    # Call Ollama client directly (synchronous)
-    try:
-        response = _get_ollama_client().generate(settings.ollama_model, prompt)
-        final_response = response["response"]
-    except Exception as e:
-        logger.error("Error in synthesizer: %s", e)
-        final_response = f"Error generating response: {str(e)}"
+
+
+def _synthesis_result(state: AgentState, final_response: str) -> dict:
+    """Log and report the synthesized answer."""
     # Log truncated response to avoid duplicate full answer in console.
     trunc_resp = final_response[:100].replace("\n", " ")
     if len(final_response) > 100:
@@ -330,3 +651,53 @@ def synthesizer_node(state: AgentState) -> dict:
         state.ui("Answer ready ✨")
 
     return {"response": final_response}
+
+
+@timed("synthesizer_duration")
+def synthesizer_node(state: AgentState) -> dict:
+    logger.info("Synthesizing final response.")
+    increment("synthesizer_calls")
+    if state.ui:
+        state.ui("synth_start")
+    prompt = _build_synthesizer_prompt(state)
+    # Stream tokens so the UI can render the answer as it is generated
+    try:
+        stream = _get_ollama_client().generate(
+            settings.ollama_model, prompt, stream=True
+        )
+        chunks = []
+        for part in stream:
+            token = part["response"]
+            chunks.append(token)
+            if state.ui:
+                state.ui(f"token:{token}")
+        final_response = "".join(chunks)
+    except Exception as e:
+        logger.error("Error in synthesizer: %s", e)
+        final_response = f"Error generating response: {str(e)}"
+    return _synthesis_result(state, final_response)
+
+
+@timed("synthesizer_duration")
+async def synthesizer_node_async(state: AgentState) -> dict:
+    """Async synthesizer using the shared Ollama async client."""
+    logger.info("Synthesizing final response.")
+    increment("synthesizer_calls")
+    if state.ui:
+        state.ui("synth_start")
+    prompt = _build_synthesizer_prompt(state)
+    try:
+        stream = await _get_ollama_async_client().generate(
+            model=settings.ollama_model, prompt=prompt, stream=True
+        )
+        chunks = []
+        async for part in stream:
+            token = part["response"]
+            chunks.append(token)
+            if state.ui:
+                state.ui(f"token:{token}")
+        final_response = "".join(chunks)
+    except Exception as e:
+        logger.error("Error in synthesizer: %s", e)
+        final_response = f"Error generating response: {str(e)}"
+    return _synthesis_result(state, final_response)
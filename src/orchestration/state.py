@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Callable, List, Optional
 
-from pydantic import BaseModel, Field
 
+@dataclass(slots=True)
+class AgentState:
+    """State shared across LangGraph nodes.
 
-class AgentState(BaseModel):
-    """State shared across LangGraph nodes."""
+    A slotted dataclass rather than a pydantic model: LangGraph rebuilds the
+    state on every node transition, and the fields are only ever set by our
+    own nodes, so per-hop validation buys nothing.
+    """
 
-    query: str = Field(..., description="Original user query")
-    plan: List[str] = Field(default_factory=list, description="Execution plan")
-    tool_output: List[str] = Field(default_factory=list, description="Tool results")
-    response: str = Field("", description="Final response to the user")
-    iteration: int = Field(0, description="Self-correction loop counter")
-    ui: Optional[Callable[[str], None]] = Field(
-        default=None,
-        exclude=True,
-        repr=False,
-        description="Callback for UI updates",
+    # Original user query
+    query: str
+    # Execution plan
+    plan: List[str] = field(default_factory=list)
+    # Tool results
+    tool_output: List[str] = field(default_factory=list)
+    # Final response to the user
+    response: str = ""
+    # Self-correction loop counter
+    iteration: int = 0
+    # Callback for UI updates
+    ui: Optional[Callable[[str], None]] = field(
+        default=None, repr=False, compare=False
     )
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache
-from typing import List
+import hashlib
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 import chromadb
+from cachetools import TTLCache
+from chromadb.config import Settings as ChromaSettings
 from llama_index.embeddings.ollama import OllamaEmbedding
 
 from src.config import get_settings
@@ -13,50 +17,129 @@ from src.utils.logger import get_logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Search results expire so that documents ingested by another process show
+# up promptly.
+CACHE_MAXSIZE = 1024
+CACHE_TTL = 300.0
+
+# HNSW index parameters applied when a collection is created. Cosine distance
+# suits the normalized Ollama embeddings; a larger graph degree and build-time
+# candidate list trade slower inserts for better recall on larger corpora.
+HNSW_METADATA: Dict[str, Any] = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+}
+
+# Documents per collection.add call when ingesting.
+INSERT_BATCH_SIZE = 2048
+
+
+# Search results shared by every agent in the process, so documents added
+# through any agent invalidate what the others have cached.
+_search_cache: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+_search_cache_lock = threading.Lock()
+
+
+def _cache_key(
+    collection_name: str, query: str, n_results: int
+) -> Tuple[str, bytes, int]:
+    """Key a search on its collection and whitespace/case-normalized query
+    text."""
+    normalized = " ".join(query.split()).lower()
+    digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+    return collection_name, digest, n_results
+
+
+class OllamaEmbeddingFunction(chromadb.EmbeddingFunction):
+    """Expose a llama-index OllamaEmbedding as a ChromaDB embedding function.
+
+    Registering it on the collection lets ChromaDB embed ``query_texts``
+    itself, batching every text of a query into one Ollama request.
+    """
+
+    def __init__(self, embed_model: OllamaEmbedding) -> None:
+        self._embed_model = embed_model
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        return self._embed_model.get_text_embedding_batch(input)
+
 
 class ChromaDBAgent:
-    """Wrapper around ChromaDB client for similarity search with LRU
+    """Wrapper around ChromaDB client for similarity search with TTL
     caching."""
 
     _client: chromadb.Client | None = None
     _embedding_function: OllamaEmbedding | None = None
+    # Collections already checked for matching embedding dimensions
+    _collections: Dict[Tuple[str, str], Any] = {}
+    # Guards creation of the shared client across threads
+    _client_lock = threading.Lock()
 
     def __init__(self, collection_name: str = "default") -> None:
         # Use singleton client for connection pooling
-        if ChromaDBAgent._client is None:
-            # Use persistent database instead of in-memory
-            ChromaDBAgent._client = chromadb.PersistentClient(path="./chroma_db")
-            ChromaDBAgent._embedding_function = OllamaEmbedding(
-                model_name=settings.ollama_embedding_model,
-                base_url=settings.ollama_host,
-            )
-            logger.info(
-                "ChromaDB persistent client initialized with connection pooling"
-            )
+        with ChromaDBAgent._client_lock:
+            if ChromaDBAgent._client is None:
+                # Use persistent database instead of in-memory
+                ChromaDBAgent._client = chromadb.PersistentClient(
+                    path=settings.chroma_path,
+                    settings=ChromaSettings(anonymized_telemetry=False),
+                )
+                ChromaDBAgent._embedding_function = OllamaEmbedding(
+                    model_name=settings.ollama_embedding_model,
+                    base_url=settings.ollama_host,
+                )
+                ChromaDBAgent._collections.clear()
+                logger.info(
+                    "ChromaDB persistent client initialized with connection pooling"
+                )
 
         self._client = ChromaDBAgent._client
         self._embedding_function = ChromaDBAgent._embedding_function
+        collection_embedding = OllamaEmbeddingFunction(self._embedding_function)
+        self._collection_name = collection_name
+        # Async searches queued for the next batched embedding round-trip,
+        # kept per event loop so a batch only resolves futures of the loop
+        # it runs on. The agent is shared across threads, hence the lock.
+        self._pending: Dict[
+            asyncio.AbstractEventLoop, List[Tuple[str, int, asyncio.Future]]
+        ] = {}
+        self._pending_lock = threading.Lock()
+        # Running batch tasks; the event loop only keeps weak references
+        self._batch_tasks: set[asyncio.Task] = set()
 
+        # The dimension probe costs an embedding round-trip, so each
+        # collection is verified once per process and then shared.
+        key = (collection_name, settings.ollama_embedding_model)
+        with ChromaDBAgent._client_lock:
+            collection = ChromaDBAgent._collections.get(key)
+            if collection is None:
+                collection = self._open_collection(
+                    collection_name, collection_embedding
+                )
+                ChromaDBAgent._collections[key] = collection
+        self._collection = collection
+
+    def _open_collection(
+        self, collection_name: str, collection_embedding: OllamaEmbeddingFunction
+    ):
+        """Open a collection, recreating it if its dimensions do not match."""
         # Check if collection exists and has correct dimensions
         try:
-            existing_collection = self._client.get_collection(collection_name)
-            # Test embedding dimensions by creating a test embedding
-            if self._embedding_function is None:
-                raise RuntimeError("Embedding function not initialized")
-            test_embedding = self._embedding_function.get_text_embedding("test")
+            existing_collection = self._client.get_collection(
+                collection_name, embedding_function=collection_embedding
+            )
 
-            # Try to query with test embedding to check dimensions
+            # Try a test query to check the embedding dimensions
             try:
-                existing_collection.query(
-                    query_embeddings=[test_embedding], n_results=1
-                )
+                existing_collection.query(query_texts=["test"], n_results=1)
                 # If successful, use existing collection
-                self._collection = existing_collection
                 logger.info(
                     "Using existing ChromaDB collection '%s' with correct "
                     "dimensions",
                     collection_name,
                 )
+                return existing_collection
             except Exception as e:
                 if "dimension" in str(e).lower():
                     logger.warning(
@@ -65,51 +148,196 @@ class ChromaDBAgent:
                         collection_name,
                     )
                     self._client.delete_collection(collection_name)
-                    self._collection = self._client.create_collection(collection_name)
+                    collection = self._client.create_collection(
+                        collection_name,
+                        embedding_function=collection_embedding,
+                        metadata=HNSW_METADATA,
+                    )
                     logger.info(
                         "Created new ChromaDB collection '%s' with correct "
                         "dimensions",
                         collection_name,
                     )
+                    return collection
                 else:
                     raise e
         except Exception:
             # Collection doesn't exist, create it
-            self._collection = self._client.create_collection(collection_name)
+            collection = self._client.create_collection(
+                collection_name,
+                embedding_function=collection_embedding,
+                metadata=HNSW_METADATA,
+            )
             logger.info("Created new ChromaDB collection '%s'", collection_name)
+            return collection
+
+    def embed_query(self, query: str) -> List[float]:
+        """Return the embedding of ``query`` from the shared Ollama model."""
+        if self._embedding_function is None:
+            raise RuntimeError("Embedding function not initialized")
+        return self._embedding_function.get_text_embedding(query)
 
     def similarity_search(self, query: str, n_results: int = 5) -> List[str]:
-        """Return the content of the most similar documents with LRU
+        """Return the content of the most similar documents with TTL
         caching."""
         return self._cached_search(query, n_results)
 
-    @lru_cache(maxsize=128)
     def _cached_search(self, query: str, n_results: int) -> List[str]:
-        """Cached search function using LRU cache."""
-        logger.debug("Cache miss for query: %s", query[:50])
-        # 1. Manually create embeddings for the query using our model
-        if self._embedding_function is None:
-            raise RuntimeError("Embedding function not initialized")
-        query_embeddings = self._embedding_function.get_text_embedding(query)
+        """Cached search function using the TTL cache."""
+        return self.similarity_search_many([query], n_results)[0]
+
+    def similarity_search_many(
+        self, queries: List[str], n_results: int = 5
+    ) -> List[List[str]]:
+        """Return the most similar documents for several queries at once.
 
-        # 2. Query the collection using the generated embeddings
-        results = self._collection.query(
-            query_embeddings=[query_embeddings], n_results=n_results
-        )
+        Cached queries are answered directly; the remaining ones go to ChromaDB
+        in a single collection query, which embeds them in one batch.
+        """
+        keys = [
+            _cache_key(self._collection_name, query, n_results) for query in queries
+        ]
+        with _search_cache_lock:
+            found = [_search_cache.get(key) for key in keys]
+
+        misses = [i for i, documents in enumerate(found) if documents is None]
+        if misses:
+            logger.debug("Cache miss for %d of %d queries", len(misses), len(queries))
+            if self._embedding_function is None:
+                raise RuntimeError("Embedding function not initialized")
+            # The collection's embedding function embeds the query texts
+            results = self._collection.query(
+                query_texts=[queries[i] for i in misses], n_results=n_results
+            )
 
-        # 3. Return the actual document text
-        documents = results["documents"][0] if results.get("documents") else []
-        logger.debug("Cached results for query: %s", query[:50])
+            # Cache the actual document text per query
+            documents = results.get("documents") or []
+            with _search_cache_lock:
+                for row, i in enumerate(misses):
+                    found[i] = tuple(documents[row]) if row < len(documents) else ()
+                    _search_cache[keys[i]] = found[i]
 
-        return documents
+        return [list(documents) for documents in found]
 
     async def similarity_search_async(
         self, query: str, n_results: int = 5
     ) -> List[str]:
-        """Async version of similarity search for better performance."""
-        # Run the cached search in a thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._cached_search, query, n_results)
+        """Async version of similarity search for better performance.
+
+        Searches issued concurrently on the same event loop are coalesced so
+        that their queries share one embedding round-trip.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        with self._pending_lock:
+            pending = self._pending.setdefault(loop, [])
+            pending.append((query, n_results, future))
+            first = len(pending) == 1
+        if first:
+            loop.call_soon(self._flush_pending, loop)
+        return await future
+
+    def _flush_pending(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Hand the async searches queued on ``loop`` to a single batch task."""
+        with self._pending_lock:
+            batch = self._pending.pop(loop, [])
+        if batch:
+            task = loop.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, int, asyncio.Future]]) -> None:
+        """Resolve a batch of queued async searches."""
+        loop = asyncio.get_running_loop()
+        grouped: dict[int, List[Tuple[str, asyncio.Future]]] = defaultdict(list)
+        for query, n_results, future in batch:
+            grouped[n_results].append((query, future))
+
+        for n_results, items in grouped.items():
+            queries = list(dict.fromkeys(query for query, _ in items))
+            try:
+                results = await loop.run_in_executor(
+                    None, self.similarity_search_many, queries, n_results
+                )
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            by_query = dict(zip(queries, results))
+            for query, future in items:
+                if not future.done():
+                    future.set_result(by_query[query])
+
+    def add_documents(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        embeddings: Optional[List[List[float]]] = None,
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> int:
+        """Add documents to the collection in batches of ``batch_size``.
+
+        Without precomputed embeddings the collection's embedding function
+        embeds each batch in one request. When a batch fails, its documents
+        are retried one at a time so a single bad document only loses
+        itself.
+
+        Returns:
+            The number of documents actually stored
+        """
+        stored = 0
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            try:
+                self._collection.add(
+                    ids=ids[start:end],
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end] if metadatas else None,
+                    embeddings=embeddings[start:end] if embeddings else None,
+                )
+                stored += len(ids[start:end])
+            except Exception as e:
+                logger.warning(
+                    "Failed to add batch of %d documents, retrying one at a "
+                    "time: %s",
+                    len(ids[start:end]),
+                    e,
+                )
+                stored += self._add_one_by_one(
+                    ids[start:end],
+                    documents[start:end],
+                    metadatas[start:end] if metadatas else None,
+                    embeddings[start:end] if embeddings else None,
+                )
+        logger.info("Added %d of %d documents to ChromaDB", stored, len(ids))
+        # Newly added documents may change any cached search result
+        self.clear_cache()
+        return stored
+
+    def _add_one_by_one(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: Optional[List[Dict[str, Any]]],
+        embeddings: Optional[List[List[float]]],
+    ) -> int:
+        """Add documents individually, skipping those that fail."""
+        stored = 0
+        for i, doc_id in enumerate(ids):
+            try:
+                self._collection.add(
+                    ids=[doc_id],
+                    documents=[documents[i]],
+                    metadatas=[metadatas[i]] if metadatas else None,
+                    embeddings=[embeddings[i]] if embeddings else None,
+                )
+                stored += 1
+            except Exception as e:
+                logger.error("Failed to add document %s to ChromaDB: %s", doc_id, e)
+        return stored
 
     def get_collections(self) -> List[str]:
         """Get list of available collections."""
@@ -123,15 +351,18 @@ class ChromaDBAgent:
             return []
 
     def clear_cache(self) -> None:
-        """Clear the LRU cache."""
-        self._cached_search.cache_clear()
-        logger.info("ChromaDB LRU cache cleared")
+        """Clear the search result cache shared by every agent."""
+        with _search_cache_lock:
+            _search_cache.clear()
+        logger.info("ChromaDB search cache cleared")
 
     def close(self) -> None:
         """Close the shared client connection."""
-        if ChromaDBAgent._client is not None:
-            # Note: ChromaDB client doesn't have explicit close method
-            # but we can clear the reference for cleanup
-            ChromaDBAgent._client = None
-            ChromaDBAgent._embedding_function = None
-            logger.info("ChromaDB client closed")
+        with ChromaDBAgent._client_lock:
+            if ChromaDBAgent._client is not None:
+                # Note: ChromaDB client doesn't have explicit close method
+                # but we can clear the reference for cleanup
+                ChromaDBAgent._client = None
+                ChromaDBAgent._embedding_function = None
+                ChromaDBAgent._collections.clear()
+                logger.info("ChromaDB client closed")
@@ -3,51 +3,304 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Iterator, Mapping
 
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, GraphDatabase, Query, unit_of_work
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
 
 from src.config import get_settings
 from src.utils.logger import get_logger
-from src.utils.retry import retry
+from src.utils.metrics import timing
+from src.utils.retry import retry_on
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Blocking queries issued from async code run on their own pool, sized to
+# the driver's connection pool so threads never queue for a connection and
+# never starve the default executor used by the rest of the process.
+_NEO4J_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.neo4j_pool_size, thread_name_prefix="neo4j"
+)
+
+
+# Seconds shutdown() waits for an async driver to close on its own loop
+ASYNC_CLOSE_TIMEOUT = 5.0
+
+# Shared read-only stand-in for omitted query parameters, so parameterless
+# queries do not allocate a fresh dict each call.
+_EMPTY_PARAMETERS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _pool_config() -> dict:
+    """Connection pool options shared by the sync and async drivers."""
+    return {
+        "max_connection_pool_size": settings.neo4j_pool_size,
+        "connection_acquisition_timeout": settings.neo4j_acq_timeout,
+        "max_connection_lifetime": settings.neo4j_max_connection_lifetime,
+    }
+
+
+def _collect_records(tx, cypher: str, parameters: Mapping[str, Any]) -> list:
+    """Transaction function returning every record of a query as a dict."""
+    return tx.run(cypher, parameters).data()
+
+
+async def _collect_records_async(
+    tx, cypher: str, parameters: Mapping[str, Any]
+) -> list:
+    """Async transaction function returning every record as a dict."""
+    result = await tx.run(cypher, parameters)
+    return await result.data()
+
+
+def _with_timeout(work, timeout: float | None):
+    """Return ``work`` as a transaction function limited to ``timeout``
+    seconds, or unchanged when no timeout is given."""
+    if timeout is None:
+        return work
+    return unit_of_work(timeout=timeout)(work)
+
+
+def _streaming_query(cypher: str, timeout: float | None) -> str | Query:
+    """Wrap ``cypher`` in a Query carrying ``timeout`` when one is given."""
+    cypher = cypher.strip()
+    return cypher if timeout is None else Query(cypher, timeout=timeout)
+
+
+def _session_config(fetch_size: int | None) -> dict:
+    """Session options for a streaming query."""
+    return {} if fetch_size is None else {"fetch_size": fetch_size}
+
 
 class Neo4jAgent:
-    def __init__(self):
+    # Bolt driver and connection pool shared by every agent in the process
+    _shared_driver = None
+    # Process-wide agent handed out by instance()
+    _instance: Neo4jAgent | None = None
+    # Guard creation of the shared driver and instance across threads
+    _driver_lock = threading.Lock()
+    _instance_lock = threading.Lock()
+    # Agents holding an open async driver, for shutdown() to close
+    _async_agents: weakref.WeakSet[Neo4jAgent] = weakref.WeakSet()
+
+    def __init__(self, eager: bool = False):
+        """Create an agent; the Bolt connection is opened on first use.
+
+        Args:
+            eager: Connect and verify connectivity now instead of on the
+                first query
+        """
+        self._driver = None
+        # Native async driver, created on the first query_async call and
+        # bound to the event loop it was created on
+        self._async_driver = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        if eager:
+            self._ensure_driver(verify=True)
+
+    def _ensure_driver(self, verify: bool = False):
+        """Return the shared driver, creating it on first use.
+
+        Connectivity is only verified when ``verify`` is set; otherwise a
+        broken connection surfaces on the first query.
+        """
+        # A shutdown() since this agent last connected leaves it holding a
+        # closed driver, so compare against the shared one
+        if self._driver is None or self._driver is not Neo4jAgent._shared_driver:
+            with Neo4jAgent._driver_lock:
+                if Neo4jAgent._shared_driver is None:
+                    try:
+                        driver = GraphDatabase.driver(
+                            settings.neo4j_uri,
+                            auth=(
+                                settings.neo4j_user,
+                                settings.neo4j_password,
+                            ),
+                            **_pool_config(),
+                        )
+                        if verify:
+                            driver.verify_connectivity()
+                        logger.info("Connected to Neo4j at %s", settings.neo4j_uri)
+                    except Exception as e:
+                        logger.error("Failed to connect to Neo4j: %s", e)
+                        raise
+                    Neo4jAgent._shared_driver = driver
+                self._driver = Neo4jAgent._shared_driver
+        return self._driver
+
+    @classmethod
+    def instance(cls) -> Neo4jAgent:
+        """Return the process-wide agent, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def close(self):
+        """Release this agent's hold on the shared driver.
+
+        The driver and its connection pool stay open for the other agents
+        in the process; see shutdown() to close them.
+        """
         self._driver = None
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close the shared driver, every agent's async driver, and forget
+        the process-wide agent.
+
+        Agents created earlier reconnect through new drivers on their next
+        query. Must not be called from the event loop of an async driver,
+        which it blocks on; use aclose() there.
+        """
+        with cls._driver_lock:
+            driver, cls._shared_driver = cls._shared_driver, None
+            cls._instance = None
+            async_agents = list(cls._async_agents)
+        for agent in async_agents:
+            agent._close_async_driver()
+        if driver is not None:
+            try:
+                driver.close()
+            except Exception as e:
+                logger.debug("Failed to close Neo4j driver: %s", e)
+                return
+            logger.info("Neo4j driver closed")
+
+    async def aclose(self) -> None:
+        """Close this agent's async driver, then release the sync driver.
+
+        The async driver is closed on the loop that created it; from any
+        other loop the close runs in a thread so this loop is not blocked.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_driver is not None:
+            if self._async_loop is loop:
+                driver, self._async_driver = self._async_driver, None
+                self._async_loop = None
+                Neo4jAgent._async_agents.discard(self)
+                await driver.close()
+                logger.info("Neo4j async driver closed")
+            else:
+                await loop.run_in_executor(None, self._close_async_driver)
+        self.close()
+
+    def _close_async_driver(self) -> None:
+        """Close the async driver from outside its loop, waiting until done.
+
+        The driver's connections belong to the loop that created it, so the
+        close is handed to that loop while it runs, or run on it directly
+        once it has stopped.
+        """
+        driver, loop = self._async_driver, self._async_loop
+        self._async_driver = None
+        self._async_loop = None
+        Neo4jAgent._async_agents.discard(self)
+        if driver is None:
+            return
         try:
-            # Use connection pooling (pool size 10 by default)
-            self._driver = GraphDatabase.driver(
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(driver.close(), loop).result(
+                    ASYNC_CLOSE_TIMEOUT
+                )
+            elif not loop.is_closed():
+                loop.run_until_complete(driver.close())
+            else:
+                logger.debug("Neo4j async driver's event loop is already closed")
+                return
+        except Exception as e:
+            logger.debug("Failed to close Neo4j async driver: %s", e)
+            return
+        logger.info("Neo4j async driver closed")
+
+    def _get_async_driver(self):
+        """Return the async driver for the running loop, or None.
+
+        The async driver may only be used on the loop that created it, so
+        calls from any other loop get None and fall back to the sync driver.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(
                 settings.neo4j_uri,
                 auth=(
                     settings.neo4j_user,
                     settings.neo4j_password,
                 ),
-                max_connection_pool_size=10,
+                **_pool_config(),
             )
-            self._driver.verify_connectivity()
-            logger.info("Connected to Neo4j at %s", settings.neo4j_uri)
-        except Exception as e:
-            logger.error("Failed to connect to Neo4j: %s", e)
-            raise
+            self._async_loop = loop
+            with Neo4jAgent._driver_lock:
+                Neo4jAgent._async_agents.add(self)
+        elif self._async_loop is not loop:
+            return None
+        return self._async_driver
 
-    def close(self):
-        if self._driver is not None:
-            self._driver.close()
-            logger.info("Neo4j driver closed")
+    # The driver retries transient failures inside a managed transaction,
+    # but gives up when the connection itself is lost. Those failures are
+    # retried here on a fresh session; anything else fails straight away.
+    @retry_on(ServiceUnavailable, SessionExpired)
+    def _run(
+        self,
+        cypher: str,
+        parameters: Mapping[str, Any],
+        write: bool = False,
+        timeout: float | None = None,
+    ) -> list:
+        """Run a query in a managed transaction on a session of its own.
 
-    # In agent_stack/src/tools/neo4j_agent.py
+        Sessions are not thread-safe but cheap to open; the connections
+        behind them come from the driver's pool.
+        """
+        cypher = cypher.strip()
+        start = time.perf_counter()
+        session = self._ensure_driver().session()
+        try:
+            execute = session.execute_write if write else session.execute_read
+            records = execute(
+                _with_timeout(_collect_records, timeout), cypher, parameters
+            )
+        finally:
+            session.close()
+        duration_ms = (time.perf_counter() - start) * 1000
+        timing("neo4j_query_duration", duration_ms)
+        logger.debug(
+            "Cypher %x returned %d records in %.2fms",
+            hash(cypher),
+            len(records),
+            duration_ms,
+        )
+        return records
 
-    @retry
-    def query(self, cypher: str, parameters: dict | None = None) -> list:
+    def query(
+        self,
+        cypher: str,
+        parameters: dict | None = None,
+        write: bool = False,
+        timeout: float | None = None,
+    ) -> list:
         """
         Execute a Cypher query with parameters.
 
+        The query runs as a managed read (or write) transaction, which the
+        driver retries on transient errors; a query whose session is lost
+        is retried on a fresh one. Cypher that changes the graph must pass
+        ``write=True``, as read transactions reject writes.
+
         Args:
             cypher: The Cypher query template with parameter placeholders
             parameters: Dictionary of parameters to substitute in the query
+            write: Run in a write transaction instead of a read transaction
+            timeout: Seconds before the server aborts the transaction;
+                None uses the server default
 
         Returns:
             List of records from the query result
@@ -58,17 +311,90 @@ class Neo4jAgent:
             All user input should be passed via the parameters dict, not
             embedded directly in the cypher string.
         """
-        with self._driver.session() as session:
-            result = session.run(cypher, parameters or {})
-            return [record.data() for record in result]
+        return self._run(cypher, parameters or _EMPTY_PARAMETERS, write, timeout)
+
+    def query_iter(
+        self,
+        cypher: str,
+        parameters: dict | None = None,
+        fetch_size: int | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[dict]:
+        """
+        Yield the records of a Cypher query one at a time.
+
+        Records are streamed from the server as the caller consumes them, so
+        large results are never held in memory at once. The query runs on its
+        own session, closed when the generator is exhausted or closed.
+
+        Args:
+            cypher: The Cypher query template with parameter placeholders
+            parameters: Dictionary of parameters to substitute in the query
+            fetch_size: Records pulled from the server per batch; -1 pulls
+                the whole result at once, None keeps the driver default
+            timeout: Seconds before the server aborts the query; None uses
+                the server default
+
+        Yields:
+            Each record of the query result as a dictionary
+        """
+        query = _streaming_query(cypher, timeout)
+        session = self._ensure_driver().session(**_session_config(fetch_size))
+        try:
+            for record in session.run(query, parameters or _EMPTY_PARAMETERS):
+                yield record.data()
+        finally:
+            session.close()
+
+    async def query_iter_async(
+        self,
+        cypher: str,
+        parameters: dict | None = None,
+        fetch_size: int | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Async version of query_iter.
+
+        Off the async driver's loop the full result is fetched through the
+        sync driver and then yielded.
+        """
+        driver = self._get_async_driver()
+        if driver is None:
+            loop = asyncio.get_running_loop()
+            for record in await loop.run_in_executor(
+                _NEO4J_EXECUTOR,
+                self._execute_query_sync,
+                cypher,
+                parameters or _EMPTY_PARAMETERS,
+                False,
+                timeout,
+            ):
+                yield record
+            return
+
+        query = _streaming_query(cypher, timeout)
+        async with driver.session(**_session_config(fetch_size)) as session:
+            result = await session.run(query, parameters or _EMPTY_PARAMETERS)
+            async for record in result:
+                yield record.data()
 
-    async def query_async(self, cypher: str, parameters: dict | None = None) -> list:
+    async def query_async(
+        self,
+        cypher: str,
+        parameters: dict | None = None,
+        write: bool = False,
+        timeout: float | None = None,
+    ) -> list:
         """
         Async version of query method for better performance.
 
         Args:
             cypher: The Cypher query template with parameter placeholders
             parameters: Dictionary of parameters to substitute in the query
+            write: Run in a write transaction instead of a read transaction
+            timeout: Seconds before the server aborts the transaction;
+                None uses the server default
 
         Returns:
             List of records from the query result
@@ -79,18 +405,42 @@ class Neo4jAgent:
             All user input should be passed via the parameters dict, not
             embedded directly in the cypher string.
         """
-        # Run the synchronous query in a thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self._execute_query_sync, cypher, parameters or {}
-        )
+        driver = self._get_async_driver()
+        if driver is None:
+            return await asyncio.get_running_loop().run_in_executor(
+                _NEO4J_EXECUTOR,
+                self._execute_query_sync,
+                cypher,
+                parameters or _EMPTY_PARAMETERS,
+                write,
+                timeout,
+            )
+
+        # Each query gets its own session, so concurrent queries run in
+        # parallel over the driver's connection pool
+        async with driver.session() as session:
+            execute = session.execute_write if write else session.execute_read
+            return await execute(
+                _with_timeout(_collect_records_async, timeout),
+                cypher.strip(),
+                parameters or _EMPTY_PARAMETERS,
+            )
+
+    def _execute_query_sync(
+        self,
+        cypher: str,
+        parameters: Mapping[str, Any],
+        write: bool = False,
+        timeout: float | None = None,
+    ) -> list:
+        """Synchronous query execution for use in thread pool.
+
+        Only used by query_async when called off the async driver's loop.
+        """
+        return self._run(cypher, parameters, write, timeout)
 
-    def _execute_query_sync(self, cypher: str, parameters: dict) -> list:
-        """Synchronous query execution for use in thread pool."""
-        with self._driver.session() as session:
-            result = session.run(cypher, parameters)
-            return [record.data() for record in result]
 
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
+@atexit.register
+def _close_shared_driver() -> None:
+    """Close the Neo4j drivers when the interpreter exits."""
+    Neo4jAgent.shutdown()
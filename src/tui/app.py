@@ -1,24 +1,48 @@
 """Main application entry point for the Cognitive Orchestration Stack TUI."""
 
+import asyncio
 import logging
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
 
 from textual.app import App
 from textual.logging import TextualHandler
 
-from .screens.aris import ArisScreen
-from .screens.ingest import IngestScreen
-from .screens.main_menu import MainMenuScreen
-from .screens.query import QueryScreen
-from .screens.status import StatusScreen
+from src.config import get_settings
+
+from .screens import (
+    ArisScreen,
+    IngestScreen,
+    MainMenuScreen,
+    QueryScreen,
+    StatusScreen,
+)
 from .widgets.clipboard_input import ClipboardInput
 
+# uvloop's libuv event loop dispatches callbacks and socket I/O faster than
+# the default selector loop; use it when installed.
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+settings = get_settings()
+
+# Stylesheet read once at import rather than by every CosApp instance
+_CSS_TEXT = Path(__file__).with_name("cos.tcss").read_text(encoding="utf-8")
+
 
 class CosApp(App):
     """The main application for the Cognitive Orchestration Stack TUI."""
 
-    CSS_PATH = "cos.tcss"  # Load the stylesheet
+    CSS = _CSS_TEXT
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -44,6 +68,13 @@ class CosApp(App):
 
     def on_mount(self) -> None:
         """Called when the app is first mounted."""
+        # asyncio.to_thread calls from the screens share a pool of known size
+        # instead of the interpreter's cpu-derived default
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=settings.tui_thread_pool_size, thread_name_prefix="tui"
+            )
+        )
         # Start at the main menu
         self.push_screen("main_menu")
 
@@ -87,18 +118,34 @@ class CosApp(App):
         logging.info("TUI application closed")
 
 
+# Background thread that writes queued log records to the log file
+_log_listener: Optional[QueueListener] = None
+
+
 def setup_logging() -> None:
-    """Set up logging for the TUI application."""
+    """Set up logging for the TUI application.
+
+    File writes happen on a QueueListener thread so that logging from the
+    event loop never blocks on disk.
+    """
+    global _log_listener
+
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
+    # The queue handler formats each record before queueing it, so the file
+    # handler writes the message as is.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, logging.FileHandler(log_dir / "tui.log"))
+    _log_listener.start()
+
     # Configure logging - only show WARNING and above in TUI, INFO goes to file only
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
-            logging.FileHandler(log_dir / "tui.log"),
+            QueueHandler(log_queue),
             # Only show WARNING and above in the TUI interface
             TextualHandler(),
         ],
@@ -115,12 +162,34 @@ def setup_logging() -> None:
         textual_handler.setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """Flush queued log records to the file and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def install_event_loop_policy() -> bool:
+    """Make uvloop the asyncio event loop when available.
+
+    Returns True if uvloop was installed. Windows is skipped because
+    uvloop does not support it.
+    """
+    if not UVLOOP_AVAILABLE or sys.platform == "win32":
+        return False
+    uvloop.install()
+    return True
+
+
 def main() -> None:
     """Main entry point for the TUI application."""
     try:
         # Set up logging
         setup_logging()
         logging.info("Starting Cognitive Orchestration Stack TUI")
+        if install_event_loop_policy():
+            logging.info("Using uvloop event loop")
 
         # Create and run the app
         app = CosApp()
@@ -133,6 +202,8 @@ def main() -> None:
         logging.error(f"TUI failed to start: {e}")
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
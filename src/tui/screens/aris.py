@@ -1,19 +1,55 @@
 """ARIS screen for running research tasks."""
 
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import Button, Input, RichLog, Static
 from textual.worker import Worker, get_current_worker
 
-# Import the actual ARIS backend
-from src.aris.orchestration.graph import run_research_job
+from src.config import get_settings
 
 from ..widgets.clipboard_input import ClipboardInput
 from .base_screen import BaseScreen
 
+settings = get_settings()
+
+# Research log line shown as each ARIS workflow node finishes
+_STEP_MESSAGES = {
+    "planner": "🧭 Research plan ready",
+    "tool_executor": "🌐 Sources gathered",
+    "validator": "🔎 Sources validated",
+    "synthesizer": "📝 Report written",
+}
+
+# Repository root, against which saved research output paths are shown
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Research jobs block for minutes, so they get their own threads instead of
+# tying up the default executor shared with the rest of the process. The
+# semaphore keeps repeated submissions from piling up behind them.
+_ARIS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.aris_max_concurrent, thread_name_prefix="aris"
+)
+_ARIS_SEMAPHORE = asyncio.Semaphore(settings.aris_max_concurrent)
+
+
+def _run_research_job(*args) -> dict:
+    """Run an ARIS research job, importing the backend on first use.
+
+    The import pulls in the scraping and LLM stack, so it is left out of
+    TUI startup and happens on the research thread rather than the UI
+    loop.
+    """
+    from src.aris.orchestration.graph import run_research_job
+
+    return run_research_job(*args)
+
 
 class ArisScreen(BaseScreen):
     """The screen for running ARIS research tasks."""
@@ -22,13 +58,20 @@ class ArisScreen(BaseScreen):
         """Initialize the ARIS screen."""
         super().__init__()
         self._current_worker: Optional[Worker] = None
+        # Widgets cached on mount so logging skips the selector lookup
+        self._aris_log: Optional[RichLog] = None
+        self._topic_input: Optional[ClipboardInput] = None
         # Disable auto-refresh for ARIS screen
         self.disable_auto_refresh()
 
     def get_main_content(self) -> ComposeResult:
         """Compose the ARIS screen content."""
         # Topic input section
-        yield Static("Enter research topic:", id="topic-label")
+        yield Static(
+            Text("Enter research topic:", no_wrap=True),
+            id="topic-label",
+            classes="static-label",
+        )
         yield ClipboardInput(
             placeholder="Enter your research topic...", id="topic-input"
         )
@@ -39,14 +82,38 @@ class ArisScreen(BaseScreen):
             yield Button("Clear", id="clear-button")
 
         # Research log
-        yield Static("Research Progress:", id="log-label")
+        yield Static(
+            Text("Research Progress:", no_wrap=True),
+            id="log-label",
+            classes="static-label",
+        )
         yield RichLog(id="aris-log", wrap=True, highlight=True, max_lines=50)
 
     def on_mount(self) -> None:
         """Called when the screen is mounted."""
         super().on_mount()
+        self._aris_log = self.query_one("#aris-log", RichLog)
+        self._topic_input = self.query_one("#topic-input", ClipboardInput)
         # Focus on the topic input
-        self.query_one("#topic-input", ClipboardInput).focus()
+        self._topic_input.focus()
+
+    def on_unmount(self) -> None:
+        """Called when the screen is unmounted."""
+        super().on_unmount()
+        self._aris_log = None
+        self._topic_input = None
+
+    def _get_aris_log(self) -> RichLog:
+        """Return the research log, looking it up if not cached yet."""
+        if self._aris_log is None:
+            return self.query_one("#aris-log", RichLog)
+        return self._aris_log
+
+    def _get_topic_input(self) -> ClipboardInput:
+        """Return the topic input, looking it up if not cached yet."""
+        if self._topic_input is None:
+            return self.query_one("#topic-input", ClipboardInput)
+        return self._topic_input
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle when the user submits a topic."""
@@ -62,8 +129,7 @@ class ArisScreen(BaseScreen):
 
     def _start_research(self) -> None:
         """Start the ARIS research process."""
-        topic_input = self.query_one("#topic-input", ClipboardInput)
-        topic = topic_input.value.strip()
+        topic = self._get_topic_input().value.strip()
 
         if not topic:
             self._log_message("Error: Please enter a research topic")
@@ -80,119 +146,121 @@ class ArisScreen(BaseScreen):
 
     def _clear_form(self) -> None:
         """Clear the form and log."""
-        self.query_one("#topic-input", ClipboardInput).value = ""
-        log = self.query_one("#aris-log", RichLog)
-        log.clear()
+        self._get_topic_input().value = ""
+        self._get_aris_log().clear()
 
     def _log_message(self, message: str, level: str = "info") -> None:
         """Log a message to the ARIS log."""
-        log = self.query_one("#aris-log", RichLog)
-        log.write(message)
+        self._log_messages([message])
+
+    def _log_messages(self, messages: list[str]) -> None:
+        """Log several messages to the ARIS log in one UI update."""
+        # A single write renders and scrolls the log once for all lines
+        self._get_aris_log().write("\n".join(messages))
         # Don't duplicate in status log - keep ARIS log for detailed progress
 
+    def _log_both(self, messages: list[str], status: str, level: str) -> None:
+        """Log detail lines to the ARIS log and a summary to the status log
+        in one UI update."""
+        self._log_messages(messages)
+        # BaseScreen's version writes to the status log; ours is the ARIS log
+        super()._log_message(status, level)
+
     async def run_aris_research(self, topic: str) -> None:
         """
         Run the actual ARIS research process in a background worker.
+
+        The worker runs on the UI event loop, so log lines are written
+        directly, collected per phase into a single write and repaint.
         """
+        worker = get_current_worker()
         try:
-            # Log detailed progress to ARIS log
-            self.call_later(
-                self._log_message,
-                f"🔬 Starting ARIS research for: {topic}",
-            )
-
-            # Show initial progress
-            self.call_later(
-                self._log_message,
-                "📋 Initializing research environment...",
-            )
-
-            # Log only high-level status to status log
-            self.call_later(
-                self._log_status, f"ARIS research started for: {topic}", "info"
+            # Log detailed progress to ARIS log, high-level status to status log
+            self._log_both(
+                [
+                    f"🔬 Starting ARIS research for: {topic}",
+                    "📋 Initializing research environment...",
+                    "🔍 Executing research workflow...",
+                ],
+                f"ARIS research started for: {topic}",
+                "info",
             )
 
             # Don't show demo mode message by default - let the actual scraping
             # results determine this
 
             # Check for cancellation before starting heavy work
-            if get_current_worker().is_cancelled:
+            if worker.is_cancelled:
                 return
 
-            # Run the actual ARIS research job in a thread to prevent blocking
-            self.call_later(
-                self._log_message,
-                "🔍 Executing research workflow...",
-            )
+            if _ARIS_SEMAPHORE.locked():
+                self._log_message("⏳ Waiting for a running research job to finish...")
 
-            # Run the research job in a thread pool to prevent UI blocking
-            results = await asyncio.get_event_loop().run_in_executor(
-                None, run_research_job, topic
-            )
+            # Run the research job in a thread pool to prevent UI blocking.
+            # Cancelling the worker cannot interrupt the thread, so the job
+            # is told to stop at its next step through the event.
+            cancel_event = threading.Event()
+            loop = asyncio.get_running_loop()
+
+            def report_step(node: str) -> None:
+                # Runs on the research thread; hand the line to the UI loop
+                message = _STEP_MESSAGES.get(node, f"✔️ {node} finished")
+                loop.call_soon_threadsafe(self._log_message, message)
+
+            try:
+                async with _ARIS_SEMAPHORE:
+                    results = await loop.run_in_executor(
+                        _ARIS_EXECUTOR,
+                        _run_research_job,
+                        topic,
+                        None,
+                        cancel_event,
+                        report_step,
+                    )
+            except asyncio.CancelledError:
+                cancel_event.set()
+                raise
 
             # Check for cancellation after work
-            if get_current_worker().is_cancelled:
+            if worker.is_cancelled:
                 return
 
             # Display results
-            if results["status"] == "completed":
-                self.call_later(
-                    self._log_message,
+            if results["status"] == "cancelled":
+                self._log_message("⏹️ Research cancelled")
+            elif results["status"] == "completed":
+                lines = [
                     "✅ Research completed successfully!",
-                )
-                # Log success to status log
-                self.call_later(
-                    self._log_status, "ARIS research completed successfully", "success"
-                )
-                self.call_later(
-                    self._log_message,
                     "📊 Results:",
-                )
-                self.call_later(
-                    self._log_message,
                     f"  • Job ID: {results['job_id']}",
-                )
-                self.call_later(
-                    self._log_message,
                     f"  • Sources found: {results['sources_found']}",
-                )
-                self.call_later(
-                    self._log_message,
                     f"  • Validated sources: {results['validated_sources']}",
-                )
+                ]
                 if results.get("output_path"):
                     # Show relative path from project root
-                    from pathlib import Path
-
                     output_path = Path(results["output_path"])
-                    project_root = Path(__file__).parent.parent.parent.parent
                     try:
-                        relative_path = output_path.relative_to(project_root)
-                        self.call_later(
-                            self._log_message,
-                            f"  • Output saved to: {relative_path}",
-                        )
+                        relative_path = output_path.relative_to(_PROJECT_ROOT)
+                        lines.append(f"  • Output saved to: {relative_path}")
                     except ValueError:
                         # If path is not relative to project root, show full
-                        self.call_later(
-                            self._log_message,
-                            f"  • Output saved to: {output_path}",
-                        )
-            else:
-                self.call_later(
-                    self._log_message,
-                    f"❌ Research failed: " f"{results.get('error', 'Unknown error')}",
+                        lines.append(f"  • Output saved to: {output_path}")
+                self._log_both(
+                    lines,
+                    "ARIS research completed successfully",
+                    "success",
                 )
-                # Also log to status log
-                self.call_later(
-                    self._log_status,
-                    f"ARIS research failed: {results.get('error', 'Unknown error')}",
+            else:
+                error = results.get("error", "Unknown error")
+                self._log_both(
+                    [f"❌ Research failed: {error}"],
+                    f"ARIS research failed: {error}",
                     "error",
                 )
 
         except Exception as e:
-            self.call_later(self._log_message, f"❌ Research failed: {str(e)}")
-            # Also log to status log
-            self.call_later(
-                self._log_status, f"ARIS research failed: {str(e)}", "error"
+            self._log_both(
+                [f"❌ Research failed: {str(e)}"],
+                f"ARIS research failed: {str(e)}",
+                "error",
             )
@@ -1,15 +1,28 @@
 """Base screen class with common functionality for all TUI screens."""
 
-import asyncio
+import time
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
 from textual.app import ComposeResult
 from textual.containers import ScrollableContainer, Vertical
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Footer, Header, RichLog, Static
 from textual.worker import Worker
 
+# Info lines kept for a screen while it is not being shown
+HIDDEN_LOG_LIMIT = 100
+
+# Marker written before each status log line, by level
+_LEVEL_PREFIX = {
+    "error": "❌",
+    "warning": "⚠️",
+    "success": "✅",
+    "info": "ℹ️",
+}
+
 
 class BaseScreen(Screen):
     """Base screen class with common functionality for scrolling and updates."""
@@ -30,7 +43,12 @@ class BaseScreen(Screen):
         self._refresh_worker: Optional[Worker] = None
         self._last_update: Optional[datetime] = None
         self._auto_refresh_interval: float = 5.0  # 5 seconds default
-        self._auto_refresh_task: Optional[asyncio.Task] = None
+        self._refresh_timer: Optional[Timer] = None
+        # Log widget found on first use, so each log line skips the lookup
+        self._status_log: Optional[RichLog] = None
+        # Info lines logged while another screen is showing, written in one
+        # go when this screen is shown again
+        self._hidden_logs: deque[str] = deque(maxlen=HIDDEN_LOG_LIMIT)
 
     def compose(self) -> ComposeResult:
         """Compose the base screen layout."""
@@ -59,57 +77,79 @@ class BaseScreen(Screen):
         """Called when the screen is unmounted."""
         # Stop auto-refresh
         self._stop_auto_refresh()
+        self._status_log = None
 
-    def _start_auto_refresh(self) -> None:
-        """Start the auto-refresh task."""
-        if self._auto_refresh_task and not self._auto_refresh_task.done():
-            self._auto_refresh_task.cancel()
+    def on_screen_resume(self) -> None:
+        """Write the info lines logged while the screen was hidden."""
+        if self._hidden_logs:
+            log = self._get_status_log()
+            if log is not None:
+                self._flush_hidden_logs(log)
+            self._hidden_logs.clear()
 
-        self._auto_refresh_task = asyncio.create_task(self._auto_refresh_loop())
+    def _flush_hidden_logs(self, log: RichLog) -> None:
+        """Write the held-back info lines in one go."""
+        log.write("\n".join(self._hidden_logs), scroll_end=True)
+        self._hidden_logs.clear()
+
+    def _start_auto_refresh(self) -> None:
+        """Start the auto-refresh timer."""
+        self._stop_auto_refresh()
+        self._refresh_timer = self.set_interval(
+            self._auto_refresh_interval, self._maybe_refresh
+        )
 
     def _stop_auto_refresh(self) -> None:
-        """Stop the auto-refresh task."""
-        if self._auto_refresh_task and not self._auto_refresh_task.done():
-            self._auto_refresh_task.cancel()
+        """Stop the auto-refresh timer."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
 
-    async def _auto_refresh_loop(self) -> None:
-        """Auto-refresh loop that runs in the background."""
-        while True:
+    def _maybe_refresh(self) -> None:
+        """Refresh on a timer tick unless the previous refresh is running."""
+        try:
+            if not self._refresh_worker or self._refresh_worker.is_finished:
+                self.action_refresh()
+        except Exception as e:
+            self._log_message(f"Auto-refresh error: {e}", "error")
+
+    def _get_status_log(self) -> Optional[RichLog]:
+        """Return the status log, looking it up once and caching it."""
+        if self._status_log is None:
+            # Try to find a status log, but don't fail if it doesn't exist
             try:
-                await asyncio.sleep(self._auto_refresh_interval)
-                if not self._refresh_worker or self._refresh_worker.is_finished:
-                    self.action_refresh()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self._log_message(f"Auto-refresh error: {e}", "error")
+                self._status_log = self.query_one("#status-log", RichLog)
+            except Exception:
+                # If no status log exists, try to find any RichLog widget
+                try:
+                    self._status_log = self.query_one(RichLog)
+                except Exception:
+                    return None
+        return self._status_log
 
     def _log_message(self, message: str, level: str = "info") -> None:
         """Log a message to the status log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
+        prefix = _LEVEL_PREFIX.get(level, _LEVEL_PREFIX["info"])
+        line = f"[{timestamp}] {prefix} {message}"
 
-        # Try to find a status log, but don't fail if it doesn't exist
-        try:
-            log = self.query_one("#status-log", RichLog)
-        except Exception:
-            # If no status log exists, try to find any RichLog widget
-            try:
-                log = self.query_one(RichLog)
-            except Exception:
-                # If no RichLog exists, just return without logging
-                return
-
-        if level == "error":
-            log.write(f"[{timestamp}] ❌ {message}")
-        elif level == "warning":
-            log.write(f"[{timestamp}] ⚠️ {message}")
-        elif level == "success":
-            log.write(f"[{timestamp}] ✅ {message}")
-        else:
-            log.write(f"[{timestamp}] ℹ️ {message}")
+        # Nobody sees the log of a hidden screen; hold routine lines back
+        # instead of re-rendering it for each one
+        if level not in ("error", "warning", "success") and not self.is_current:
+            self._hidden_logs.append(line)
+            return
+
+        log = self._get_status_log()
+        if log is None:
+            # If no RichLog exists, just return without logging
+            return
+
+        # Info lines held back while hidden came first, so they go first
+        if self._hidden_logs:
+            self._flush_hidden_logs(log)
 
-        # Auto-scroll to bottom
-        log.scroll_end()
+        # Scroll to the bottom as part of the write rather than separately
+        log.write(line, scroll_end=True)
 
     def _log_status(self, message: str, level: str = "info") -> None:
         """Log a status message to the status log (for system-level info)."""
@@ -121,7 +161,11 @@ class BaseScreen(Screen):
 
     def action_refresh(self) -> None:
         """Refresh the screen data."""
-        # Override in subclasses for specific refresh logic
+        # Override in subclasses for specific refresh logic. Screens that
+        # turned auto-refresh off have nothing to refresh, so a held "r"
+        # must not flood the log.
+        if self._auto_refresh_interval <= 0:
+            return
         self._log_message("Refresh requested", "info")
 
     def action_back(self) -> None:
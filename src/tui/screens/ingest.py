@@ -1,9 +1,14 @@
 """Ingest screen for data ingestion operations."""
 
 import asyncio
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.widgets import Button, OptionList, ProgressBar, Static
 
@@ -11,6 +16,81 @@ from src.tui.widgets.clipboard_input import ClipboardInput
 
 from .base_screen import BaseScreen
 
+# Seconds between progress redraws during ingestion
+PROGRESS_REFRESH_INTERVAL = 0.1
+
+# Directory walks and ingestion runs happen one at a time on their own
+# thread, so a large tree never holds threads of the pool shared with the
+# rest of the TUI, and a restarted ingestion simply queues behind the
+# cancelled one.
+_INGEST_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest")
+
+# Version control, cache and virtualenv directories never hold documents to
+# ingest, and are often the bulk of a project tree
+_SKIP_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", "venv"})
+
+
+def _stat_path(path: Path) -> tuple[bool, bool]:
+    """Return whether ``path`` exists and whether it is a directory, from a
+    single stat() call."""
+    try:
+        st = path.stat()
+    except (OSError, ValueError):
+        return False, False
+    return True, stat.S_ISDIR(st.st_mode)
+
+
+def _walk_files(
+    root: Path, cancel_event: Optional[threading.Event] = None
+) -> Iterator[os.DirEntry]:
+    """Yield every file below ``root``.
+
+    Uses os.scandir so file types come from the directory listing itself
+    rather than a stat() call per entry. Symlinked directories are not
+    followed; unreadable directories and those named in ``_SKIP_DIRS``
+    are skipped. The walk stops before the next directory once
+    ``cancel_event`` is set.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _run_ingest(*args) -> None:
+    """Run the ingestion pipeline, importing it on first use.
+
+    The import pulls in spaCy, unstructured and the storage agents, so it
+    is left out of TUI startup and happens on the ingest thread rather
+    than the UI loop.
+    """
+    from scripts.ingest_data import ingest
+
+    ingest(*args)
+
+
+def _list_files(
+    directory: Path, cancel_event: Optional[threading.Event] = None
+) -> list[os.DirEntry]:
+    """Return every file below ``directory``, sorted by path.
+
+    Sorting keeps files of the same directory together, so ingesting them
+    in order revisits each directory while it is still cached.
+    """
+    files = list(_walk_files(directory, cancel_event))
+    files.sort(key=lambda entry: entry.path)
+    return files
+
 
 class IngestScreen(BaseScreen):
     """The screen for data ingestion operations."""
@@ -22,60 +102,119 @@ class IngestScreen(BaseScreen):
         self._progress_total: int = 0
         self._progress_current: int = 0
         self._progress_message: str = ""
+        # Set when the progress fields change; the UI picks them up on its
+        # next redraw tick instead of once per processed file
+        self._progress_dirty: bool = False
+        # Widgets cached on mount so progress updates skip the selector lookup
+        self._progress_bar: Optional[ProgressBar] = None
+        self._status_text: Optional[Static] = None
+        self._dir_input: Optional[ClipboardInput] = None
+        self._file_list: Optional[OptionList] = None
         # Disable auto-refresh for ingest screen
         self.disable_auto_refresh()
 
     def get_main_content(self) -> ComposeResult:
         """Compose the ingest screen content."""
         # Directory input section
-        yield Static("Select directory to ingest:", id="dir-label")
+        yield Static(
+            Text("Select directory to ingest:", no_wrap=True),
+            id="dir-label",
+            classes="static-label",
+        )
         yield ClipboardInput(placeholder="Enter directory path...", id="dir-input")
 
         # Action buttons
         yield Button("Start Ingestion", id="start-button", variant="primary")
 
         # Progress section
-        yield Static("Progress:", id="progress-label")
+        yield Static(
+            Text("Progress:", no_wrap=True),
+            id="progress-label",
+            classes="static-label",
+        )
         yield ProgressBar(id="progress-bar", show_eta=True)
 
         # Status display
         yield Static("Status: Ready", id="status-text")
 
         # File list
-        yield Static("Files to process:", id="files-label")
+        yield Static(
+            Text("Files to process:", no_wrap=True),
+            id="files-label",
+            classes="static-label",
+        )
         yield OptionList(id="file-list")
 
     def on_mount(self) -> None:
         """Called when the screen is mounted."""
         super().on_mount()
+        self._progress_bar = self.query_one("#progress-bar", ProgressBar)
+        self._status_text = self.query_one("#status-text", Static)
+        self._dir_input = self.query_one("#dir-input", ClipboardInput)
+        self._file_list = self.query_one("#file-list", OptionList)
+        self.set_interval(PROGRESS_REFRESH_INTERVAL, self._drain_progress)
         # Focus on the directory input
-        self.query_one("#dir-input", ClipboardInput).focus()
-
-    def on_input_submitted(self, event) -> None:
+        self._dir_input.focus()
+
+    def on_unmount(self) -> None:
+        """Called when the screen is unmounted."""
+        super().on_unmount()
+        self._progress_bar = None
+        self._status_text = None
+        self._dir_input = None
+        self._file_list = None
+
+    def _get_progress_bar(self) -> ProgressBar:
+        """Return the progress bar, looking it up if not cached yet."""
+        if self._progress_bar is None:
+            return self.query_one("#progress-bar", ProgressBar)
+        return self._progress_bar
+
+    def _get_dir_input(self) -> ClipboardInput:
+        """Return the directory input, looking it up if not cached yet."""
+        if self._dir_input is None:
+            return self.query_one("#dir-input", ClipboardInput)
+        return self._dir_input
+
+    def _get_file_list(self) -> OptionList:
+        """Return the file list, looking it up if not cached yet."""
+        if self._file_list is None:
+            return self.query_one("#file-list", OptionList)
+        return self._file_list
+
+    def _get_status_text(self) -> Static:
+        """Return the status text, looking it up if not cached yet."""
+        if self._status_text is None:
+            return self.query_one("#status-text", Static)
+        return self._status_text
+
+    async def on_input_submitted(self, event) -> None:
         """Handle when the user submits a directory path."""
         if event.input.id == "dir-input":
-            self._start_ingestion()
+            await self._start_ingestion()
 
-    def on_button_pressed(self, event) -> None:
+    async def on_button_pressed(self, event) -> None:
         """Handle button presses."""
         if event.button.id == "start-button":
-            self._start_ingestion()
+            await self._start_ingestion()
 
-    def _start_ingestion(self) -> None:
+    async def _start_ingestion(self) -> None:
         """Start the ingestion process."""
-        dir_input = self.query_one("#dir-input", ClipboardInput)
-        directory = dir_input.value.strip()
+        directory = self._get_dir_input().value.strip()
 
         if not directory:
             self._log_message("Error: Please enter a directory path", "error")
             return
 
+        # Stat calls can block for seconds on network drives, so they run
+        # off the event loop
         directory_path = Path(directory)
-        if not directory_path.exists():
+        exists, is_dir = await asyncio.to_thread(_stat_path, directory_path)
+        if not exists:
             self._log_message(f"Error: Directory '{directory}' does not exist", "error")
             return
 
-        if not directory_path.is_dir():
+        if not is_dir:
             self._log_message(f"Error: '{directory}' is not a directory", "error")
             return
 
@@ -91,134 +230,97 @@ class IngestScreen(BaseScreen):
         Run the actual ingestion process in a background worker.
         """
         try:
-            # Update UI to show we're starting
-            self.call_later(
-                self._update_status_text,
-                "Initializing ingestion...",
-            )
-
-            # Get list of files to process
-            files = list(directory.rglob("*"))
-            files = [f for f in files if f.is_file()]
+            # Update UI to show we're starting; the bar stays indeterminate
+            # until there is a count to measure progress against
+            self._update_status_text("Initializing ingestion...")
+            self._get_progress_bar().update(total=None)
+
+            # Get list of files to process without blocking the UI. Neither
+            # the walk nor the pipeline thread can be interrupted, so a
+            # cancelled ingestion tells them to stop through the event.
+            loop = asyncio.get_running_loop()
+            cancel_event = threading.Event()
+            try:
+                files = await loop.run_in_executor(
+                    _INGEST_EXECUTOR, _list_files, directory, cancel_event
+                )
+            except asyncio.CancelledError:
+                cancel_event.set()
+                raise
 
             if not files:
-                self.call_later(
-                    self._update_status_text,
-                    "No files found to process",
-                )
+                self._reset_progress_bar()
+                self._update_status_text("No files found to process")
                 return
 
             # Update file list
-            self.call_later(
-                self._update_file_list,
-                files,
-            )
-
-            # Initialize progress
-            self.call_later(
-                self._update_progress,
-                0,
-                len(files),
-                f"Processing {len(files)} files...",
-            )
-
-            # Log start
-            self.call_later(
-                self._log_message,
-                f"Starting ingestion of {len(files)} files from {directory}",
-                "info",
-            )
-
-            # Simulate processing with real progress updates
-            for i, file_path in enumerate(files):
-                # Check for cancellation
-                if self._current_worker and self._current_worker.cancelled():
-                    self.call_later(
-                        self._update_status_text,
-                        "Ingestion cancelled",
-                    )
-                    return
-
-                # Update progress
-                self.call_later(
-                    self._update_progress,
-                    i + 1,
-                    len(files),
-                    f"Processing {file_path.name}...",
+            total = len(files)
+            self._update_file_list(files)
+            self._log_message(f"Found {total} files to ingest in {directory}", "info")
+            self._set_progress(0, total, f"Processing {total} files...")
+            self._drain_progress()
+
+            def report_file(handled: int, name: str) -> None:
+                # Runs on the ingest thread; the refresh timer redraws
+                loop.call_soon_threadsafe(
+                    self._set_progress, handled, None, f"Processing {name}..."
                 )
 
-                # Simulate processing time based on file size
-                processing_time = min(
-                    0.1, max(0.01, file_path.stat().st_size / 1000000)
+            # Parse, embed and store the listed files, reusing the listing
+            # rather than walking the tree again
+            try:
+                await loop.run_in_executor(
+                    _INGEST_EXECUTOR,
+                    _run_ingest,
+                    directory,
+                    files,
+                    cancel_event,
+                    report_file,
                 )
-                await asyncio.sleep(processing_time)
-
-                # Log progress
-                if (i + 1) % 10 == 0 or i == len(files) - 1:
-                    self.call_later(
-                        self._log_message,
-                        f"Processed {i + 1}/{len(files)} files",
-                        "info",
-                    )
-
-            # Complete
-            self.call_later(
-                self._update_progress,
-                len(files),
-                len(files),
-                "Ingestion completed!",
-            )
-
-            self.call_later(
-                self._update_status_text,
-                f"Successfully processed {len(files)} files",
-            )
-
-            self.call_later(
-                self._log_message,
-                f"Ingestion completed successfully: {len(files)} files processed",
-                "success",
+            except asyncio.CancelledError:
+                cancel_event.set()
+                raise
+
+            # Keep a queued progress redraw from replacing the final status
+            self._progress_dirty = False
+            self._update_progress(total, total, "Ingestion completed")
+            self._log_message(
+                f"Ingestion completed: {total} files from {directory}", "success"
             )
 
         except asyncio.CancelledError:
-            self.call_later(
-                self._update_status_text,
-                "Ingestion cancelled",
-            )
-            self.call_later(
-                self._log_message,
-                "Ingestion was cancelled",
-                "warning",
-            )
+            # Keep a queued progress redraw from replacing the final status
+            self._progress_dirty = False
+            self._reset_progress_bar()
+            self._update_status_text("Ingestion cancelled")
+            self._log_message("Ingestion was cancelled", "warning")
         except Exception as e:
-            self.call_later(
-                self._update_status_text,
-                f"Ingestion failed: {str(e)}",
-            )
-            self.call_later(
-                self._log_message,
-                f"Ingestion failed: {str(e)}",
-                "error",
-            )
+            self._progress_dirty = False
+            self._reset_progress_bar()
+            self._update_status_text(f"Ingestion failed: {str(e)}")
+            self._log_message(f"Ingestion failed: {str(e)}", "error")
 
-    def _update_file_list(self, files: list[Path]) -> None:
+    def _reset_progress_bar(self) -> None:
+        """Stop an indeterminate progress bar by giving it an empty total."""
+        self._get_progress_bar().update(total=100, progress=0)
+
+    def _update_file_list(self, files: list[os.DirEntry]) -> None:
         """Update the file list display."""
-        file_list = self.query_one("#file-list", OptionList)
+        file_list = self._get_file_list()
 
         # Clear existing options
         file_list.clear_options()
 
-        # Add files to the list (limit to first 50 for performance)
-        for file_path in files[:50]:
-            file_list.add_option(file_path.name)
-
+        # Add files to the list (limit to first 50 for performance) in one
+        # call, so the list lays out and repaints once
+        names = [entry.name for entry in files[:50]]
         if len(files) > 50:
-            file_list.add_option(f"... and {len(files) - 50} more files")
+            names.append(f"... and {len(files) - 50} more files")
+        file_list.add_options(names)
 
     def _update_status_text(self, message: str) -> None:
         """Update the status text display."""
-        status_text = self.query_one("#status-text", Static)
-        status_text.update(f"Status: {message}")
+        self._get_status_text().update(f"Status: {message}")
 
         # Also log to status log for important messages
         if "error" in message.lower() or "failed" in message.lower():
@@ -232,6 +334,23 @@ class IngestScreen(BaseScreen):
             if "processing" in message.lower() or "initializing" in message.lower():
                 self._log_message(message, "info")
 
+    def _set_progress(
+        self, current: int, total: Optional[int] = None, message: Optional[str] = None
+    ) -> None:
+        """Record ingestion progress for the next redraw tick."""
+        if total is not None:
+            self._progress_total = total
+        if message is not None:
+            self._progress_message = message
+        self._progress_current = current
+        self._progress_dirty = True
+
+    def _drain_progress(self) -> None:
+        """Redraw the progress widgets if the progress changed."""
+        if self._progress_dirty:
+            self._progress_dirty = False
+            self._update_progress(self._progress_current)
+
     def _update_progress(
         self, current: int, total: Optional[int] = None, message: Optional[str] = None
     ) -> None:
@@ -245,22 +364,20 @@ class IngestScreen(BaseScreen):
         self._progress_current = current
 
         # Update progress bar
-        progress_bar = self.query_one("#progress-bar", ProgressBar)
         if self._progress_total > 0:
-            progress = current / self._progress_total
-            progress_bar.update(progress=progress)
+            self._get_progress_bar().update(
+                total=self._progress_total, progress=current
+            )
 
         # Update status with current progress
         if self._progress_total > 0:
             percentage = int((current / self._progress_total) * 100)
-            status_text = self.query_one("#status-text", Static)
-            status_text.update(
+            self._get_status_text().update(
                 f"Status: {self._progress_message} "
                 f"({current}/{self._progress_total} - {percentage}%)"
             )
         else:
-            status_text = self.query_one("#status-text", Static)
-            status_text.update(f"Status: {self._progress_message}")
+            self._get_status_text().update(f"Status: {self._progress_message}")
 
     def _log_status(self, message: str, level: str = "info") -> None:
         """Log a message to the status log."""
@@ -18,6 +18,15 @@ class MainMenuScreen(Screen):
         ("ctrl+a", "select_all", "Select All"),
     ]
 
+    # Built once for the class; the menu never disables or edits its options
+    _OPTIONS = (
+        Option("Query the Agent", id="query"),
+        Option("Ingest Data", id="ingest"),
+        Option("Run ARIS Research Task", id="aris"),
+        Option("System Status", id="status"),
+        Option("Quit", id="quit"),
+    )
+
     def compose(self) -> ComposeResult:
         """Compose the main menu screen."""
         yield Header()
@@ -25,14 +34,7 @@ class MainMenuScreen(Screen):
         with Vertical(id="main-menu-container"):
             yield Static("Cognitive Orchestration Stack", id="main-title")
             yield Static("Select a feature to continue", id="main-subtitle")
-            yield OptionList(
-                Option("Query the Agent", id="query"),
-                Option("Ingest Data", id="ingest"),
-                Option("Run ARIS Research Task", id="aris"),
-                Option("System Status", id="status"),
-                Option("Quit", id="quit"),
-                id="main-options",
-            )
+            yield OptionList(*self._OPTIONS, id="main-options")
         yield Footer()
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
@@ -1,6 +1,7 @@
 """Query screen for interacting with the AI agent."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from textual.app import ComposeResult
@@ -14,6 +15,13 @@ from src.orchestration.state import AgentState
 from ..widgets.clipboard_input import ClipboardInput
 from .base_screen import BaseScreen
 
+# Seconds to collect conversation log lines before writing them as one batch
+LOG_FLUSH_INTERVAL = 0.05
+
+# Graph runs block on LLM calls, so they get a small pool of their own that
+# keeps its threads across queries instead of the shared default executor
+_GRAPH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="graph")
+
 
 class QueryScreen(BaseScreen):
     """The screen for interacting with the AI agent."""
@@ -22,6 +30,12 @@ class QueryScreen(BaseScreen):
         """Initialize the query screen."""
         super().__init__()
         self._current_worker: Optional[Worker] = None
+        # Log cached on mount so each message skips the selector lookup
+        self._conversation_log: Optional[RichLog] = None
+        # Lines waiting for the next flush, so a burst of progress messages
+        # is written, laid out and repainted once
+        self._pending_log: list[str] = []
+        self._flush_scheduled: bool = False
         # Disable auto-refresh for query screen
         self.disable_auto_refresh()
 
@@ -34,91 +48,125 @@ class QueryScreen(BaseScreen):
     def on_mount(self) -> None:
         """Called when the screen is mounted."""
         super().on_mount()
+        self._conversation_log = self.query_one("#conversation-log", RichLog)
         # Focus on the input field
         self.query_one("#query-input", ClipboardInput).focus()
 
-    async def on_input_submitted(self, event: Input.Submitted) -> None:
+    def on_unmount(self) -> None:
+        """Called when the screen is unmounted."""
+        super().on_unmount()
+        self._conversation_log = None
+        self._pending_log = []
+        self._flush_scheduled = False
+
+    def _get_conversation_log(self) -> RichLog:
+        """Return the conversation log, looking it up if not cached yet."""
+        if self._conversation_log is None:
+            return self.query_one("#conversation-log", RichLog)
+        return self._conversation_log
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle when the user submits a query."""
         query_text = event.value.strip()
         if not query_text:
             return
 
-        log = self.query_one("#conversation-log", RichLog)
-
         # Display the user's query
-        log.write(f"👤 You: {query_text}")
+        self._update_conversation_log(f"👤 You: {query_text}")
 
         # Clear the input for the next query
         event.input.clear()
 
         # Show a thinking indicator and run the backend call in a worker thread
-        log.write("🤔 Agent is thinking...")
+        self._update_conversation_log("🤔 Agent is thinking...")
 
         # Cancel any existing worker
         if self._current_worker and not self._current_worker.is_finished:
             self._current_worker.cancel()
 
-        # Start new worker - create a callable that captures the query
-        async def worker_func():
-            await self.run_backend_query(query_text)
-
-        self._current_worker = self.run_worker(worker_func, exclusive=True)
+        # Start new worker
+        self._current_worker = self.run_worker(
+            self.run_backend_query(query_text), exclusive=True
+        )
 
     async def run_backend_query(self, query: str) -> None:
         """
         Run the actual backend orchestration graph.
         This method runs in a background worker to avoid freezing the UI.
+
+        The worker runs on the UI event loop, so its own log lines are
+        queued directly; the graph's callback fires on the executor thread
+        and hands its lines to the loop with call_soon_threadsafe, which
+        keeps them ahead of the final answer.
         """
         try:
             # Update UI to show we're starting
-            self.call_later(
-                self._update_conversation_log,
-                "🤖 Initializing AI agent...",
-            )
+            self._update_conversation_log("🤖 Initializing AI agent...")
+
+            loop = asyncio.get_running_loop()
+            # Streamed answer: every token received so far, and the text of
+            # the line that has not been completed and written yet
+            answer_parts: list[str] = []
+            partial_line: list[str] = []
+
+            def post(message: str) -> None:
+                loop.call_soon_threadsafe(self._update_conversation_log, message)
 
             # Create UI callback for progress updates
             def ui_callback(msg: str) -> None:
-                if msg == "planning_complete":
-                    self.call_later(
-                        self._update_conversation_log,
-                        "📋 Planning complete, executing tools...",
-                    )
+                if msg.startswith("token:"):
+                    token = msg[len("token:") :]
+                    if not answer_parts:
+                        partial_line.append("🤖 Agent: ")
+                    answer_parts.append(token)
+                    # Only whole lines are handed over, so a burst of tokens
+                    # costs one log message per line rather than per token
+                    if "\n" in token:
+                        *lines, rest = ("".join(partial_line) + token).split("\n")
+                        partial_line[:] = [rest]
+                        post("\n".join(lines))
+                    else:
+                        partial_line.append(token)
+                elif msg == "planning_complete":
+                    post("📋 Planning complete, executing tools...")
                 elif msg.startswith("tool_start:"):
                     tool = msg.split(":", 1)[1]
-                    self.call_later(
-                        self._update_conversation_log,
-                        f"🔧 Executing: {tool}",
-                    )
+                    post(f"🔧 Executing: {tool}")
                 elif msg == "synth_start":
-                    self.call_later(
-                        self._update_conversation_log,
-                        "🧠 Synthesizing response...",
-                    )
+                    post("🧠 Synthesizing response...")
 
             # Create the agent state with UI callback
             state = AgentState(query=query, ui=ui_callback)
 
             # Run the orchestration graph in a thread executor to prevent blocking
-            final_state = await asyncio.get_event_loop().run_in_executor(
-                None, GRAPH.invoke, state
+            final_state = await loop.run_in_executor(
+                _GRAPH_EXECUTOR, GRAPH.invoke, state
             )
 
             # Get the final response
             response = final_state.get("response", "No response generated")
 
-            # Display the response
-            self.call_later(
-                self._update_conversation_log,
-                f"🤖 Agent: {response}",
-            )
+            # Display the response; a streamed answer only lacks its last line
+            if answer_parts and "".join(answer_parts) == response:
+                tail = "".join(partial_line)
+                if tail:
+                    self._update_conversation_log(tail)
+            else:
+                self._update_conversation_log(f"🤖 Agent: {response}")
 
         except Exception as e:
-            self.call_later(
-                self._update_conversation_log,
-                f"❌ Error: {str(e)}",
-            )
+            self._update_conversation_log(f"❌ Error: {str(e)}")
 
     def _update_conversation_log(self, message: str) -> None:
-        """Update the conversation log with a message."""
-        log = self.query_one("#conversation-log", RichLog)
-        log.write(message)
+        """Queue a message for the conversation log's next flush."""
+        self._pending_log.append(message)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.set_timer(LOG_FLUSH_INTERVAL, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Write the queued messages to the conversation log in one call."""
+        batch, self._pending_log = self._pending_log, []
+        self._flush_scheduled = False
+        if batch:
+            self._get_conversation_log().write("\n".join(batch))
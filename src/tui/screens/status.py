@@ -1,8 +1,9 @@
 """Status screen for system health monitoring."""
 
 import asyncio
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import psutil
 from textual.app import ComposeResult
@@ -17,6 +18,17 @@ from src.tools.neo4j_agent import Neo4jAgent
 
 from .base_screen import BaseScreen
 
+# Seconds within which further refresh requests are ignored
+REFRESH_DEBOUNCE = 0.5
+
+# Components checked by the concurrent probes, in the order they are shown
+_PROBED_COMPONENTS = (
+    "API Server",
+    "Neo4j Database",
+    "ChromaDB",
+    "System Resources",
+)
+
 
 class StatusScreen(BaseScreen):
     """The screen for system status monitoring."""
@@ -28,6 +40,13 @@ class StatusScreen(BaseScreen):
         self.disable_auto_refresh()
         # Explicitly type the worker for mypy
         self._refresh_worker: Optional[Worker] = None
+        self._last_refresh_ts: float = 0.0
+        # Reused across refreshes; dropped after a failed check so the next
+        # refresh starts from a fresh agent
+        self._chroma_agent: Optional[ChromaDBAgent] = None
+        # Component, status and details last drawn in the table, so an
+        # unchanged refresh only updates the check times
+        self._last_status_rows: Optional[Tuple[Tuple[str, str, str], ...]] = None
 
     def get_main_content(self) -> ComposeResult:
         """Compose the status screen content."""
@@ -48,7 +67,9 @@ class StatusScreen(BaseScreen):
         super().on_mount()
         # Set up the data table
         table = self.query_one("#status-table", DataTable)
-        table.add_columns("Component", "Status", "Details", "Last Check")
+        table.add_columns("Component", "Status", "Details")
+        table.add_column("Last Check", key="last_check")
+        self._last_status_rows = None
 
         # Start initial health check
         self.action_refresh()
@@ -79,6 +100,12 @@ class StatusScreen(BaseScreen):
 
     def action_refresh(self) -> None:
         """Refresh the system status."""
+        # Rapid clicks would otherwise cancel and restart the checks each time
+        now = time.monotonic()
+        if now - self._last_refresh_ts < REFRESH_DEBOUNCE:
+            return
+        self._last_refresh_ts = now
+
         # Cancel any existing worker
         if self._refresh_worker and not self._refresh_worker.is_finished:
             self._refresh_worker.cancel()
@@ -102,7 +129,21 @@ class StatusScreen(BaseScreen):
 
     def _update_status_table(self, status_data: Dict[str, Dict[str, Any]]) -> None:
         """Update the status table with new data."""
+        rows = tuple(
+            (component, data.get("status", "Unknown"), data.get("details", ""))
+            for component, data in status_data.items()
+        )
         table = self.query_one("#status-table", DataTable)
+        # Rebuilding the table is the bulk of a refresh; when no component
+        # changed, only the check times are updated in place
+        if rows == self._last_status_rows:
+            for component, data in status_data.items():
+                table.update_cell(
+                    component, "last_check", data.get("last_check", "")
+                )
+            return
+        self._last_status_rows = rows
+
         table.clear()
 
         for component, data in status_data.items():
@@ -120,7 +161,9 @@ class StatusScreen(BaseScreen):
             else:
                 status_display = status
 
-            table.add_row(component, status_display, details, last_check)
+            table.add_row(
+                component, status_display, details, last_check, key=component
+            )
 
     async def run_health_checks(self) -> None:
         """
@@ -128,77 +171,28 @@ class StatusScreen(BaseScreen):
         This runs in a background worker to avoid freezing the UI.
         """
         try:
-            # Simulate health check delay
-            await asyncio.sleep(0.5)
-
-            status_data = {}
             current_time = datetime.now().strftime("%H:%M:%S")
 
-            # Check API Server
-            try:
-                # Use liveness check for basic API status
-                api_health = await liveness_check()
-                api_status = (
-                    "Healthy" if api_health.get("status") == "alive" else "Error"
-                )
-                service_name = api_health.get("service", "Unknown")
-                status_data["API Server"] = {
-                    "status": api_status,
-                    "details": f"Service: {service_name}",
-                    "last_check": current_time,
-                }
-            except Exception as e:
-                status_data["API Server"] = {
-                    "status": "Error",
-                    "details": f"Failed to check: {str(e)}",
-                    "last_check": current_time,
-                }
-
-            # Check Neo4j Database
-            try:
-                neo4j_agent = Neo4jAgent()
-                neo4j_agent.query("RETURN 1 as test")
-                status_data["Neo4j Database"] = {
-                    "status": "Healthy",
-                    "details": "Connected successfully",
-                    "last_check": current_time,
-                }
-            except Exception as e:
-                status_data["Neo4j Database"] = {
-                    "status": "Error",
-                    "details": f"Connection failed: {str(e)}",
-                    "last_check": current_time,
-                }
-
-            # Check ChromaDB
-            try:
-                chroma_agent = ChromaDBAgent()
-                # Try to get collection info
-                collections = chroma_agent.get_collections()
-                collection_count = len(collections)
-                status_data["ChromaDB"] = {
-                    "status": "Healthy",
-                    "details": (
-                        f"Vector store operational ({collection_count} " f"collections)"
-                    ),
-                    "last_check": current_time,
-                }
-            except Exception as e:
-                status_data["ChromaDB"] = {
-                    "status": "Error",
-                    "details": f"Connection failed: {str(e)}",
-                    "last_check": current_time,
-                }
+            # The probes are independent, so they run concurrently and the
+            # refresh takes as long as the slowest one rather than their sum.
+            # The database and psutil probes block, so they run in threads.
+            results = await asyncio.gather(
+                self._check_api(current_time),
+                asyncio.to_thread(self._check_neo4j, current_time),
+                asyncio.to_thread(self._check_chroma, current_time),
+                asyncio.to_thread(self._check_system, current_time),
+                return_exceptions=True,
+            )
 
-            # Check System Resources
-            status_data["System Resources"] = {
-                "status": self._get_system_status(),
-                "details": (
-                    f"CPU: {psutil.cpu_percent()}%, "
-                    f"Memory: {psutil.virtual_memory().percent}%"
-                ),
-                "last_check": current_time,
-            }
+            status_data = {}
+            for component, result in zip(_PROBED_COMPONENTS, results):
+                if isinstance(result, BaseException):
+                    result = {
+                        "status": "Error",
+                        "details": f"Failed to check: {str(result)}",
+                        "last_check": current_time,
+                    }
+                status_data[component] = result
 
             # Check Logging System
             status_data["Logging System"] = {
@@ -223,14 +217,82 @@ class StatusScreen(BaseScreen):
             self.call_later(self._update_status_table, error_data)
             self.call_later(self._update_last_update_time)
 
-    def _get_system_status(self) -> str:
-        """Get system resource status."""
+    async def _check_api(self, current_time: str) -> Dict[str, Any]:
+        """Check the API server through its liveness probe."""
+        try:
+            # Use liveness check for basic API status
+            api_health = await liveness_check()
+            api_status = "Healthy" if api_health.get("status") == "alive" else "Error"
+            service_name = api_health.get("service", "Unknown")
+            return {
+                "status": api_status,
+                "details": f"Service: {service_name}",
+                "last_check": current_time,
+            }
+        except Exception as e:
+            return {
+                "status": "Error",
+                "details": f"Failed to check: {str(e)}",
+                "last_check": current_time,
+            }
+
+    def _check_neo4j(self, current_time: str) -> Dict[str, Any]:
+        """Check the Neo4j database with a trivial query."""
+        try:
+            neo4j_agent = Neo4jAgent.instance()
+            neo4j_agent.query("RETURN 1 as test")
+            return {
+                "status": "Healthy",
+                "details": "Connected successfully",
+                "last_check": current_time,
+            }
+        except Exception as e:
+            return {
+                "status": "Error",
+                "details": f"Connection failed: {str(e)}",
+                "last_check": current_time,
+            }
+
+    def _check_chroma(self, current_time: str) -> Dict[str, Any]:
+        """Check ChromaDB by listing its collections."""
+        try:
+            if self._chroma_agent is None:
+                self._chroma_agent = ChromaDBAgent()
+            # Try to get collection info
+            collections = self._chroma_agent.get_collections()
+            collection_count = len(collections)
+            return {
+                "status": "Healthy",
+                "details": (
+                    f"Vector store operational ({collection_count} " f"collections)"
+                ),
+                "last_check": current_time,
+            }
+        except Exception as e:
+            self._chroma_agent = None
+            return {
+                "status": "Error",
+                "details": f"Connection failed: {str(e)}",
+                "last_check": current_time,
+            }
+
+    def _check_system(self, current_time: str) -> Dict[str, Any]:
+        """Check CPU and memory usage."""
+        # Sample once: cpu_percent() reports usage since its previous call,
+        # so a second call here would show a different, near-zero figure
         cpu_percent = psutil.cpu_percent()
         memory_percent = psutil.virtual_memory().percent
-
-        if cpu_percent > 90 or memory_percent > 90:
-            return "Warning"
-        elif cpu_percent > 95 or memory_percent > 95:
+        return {
+            "status": self._get_system_status(cpu_percent, memory_percent),
+            "details": f"CPU: {cpu_percent}%, Memory: {memory_percent}%",
+            "last_check": current_time,
+        }
+
+    def _get_system_status(self, cpu_percent: float, memory_percent: float) -> str:
+        """Get system resource status from CPU and memory usage."""
+        if cpu_percent > 95 or memory_percent > 95:
             return "Error"
+        elif cpu_percent > 90 or memory_percent > 90:
+            return "Warning"
         else:
             return "Healthy"
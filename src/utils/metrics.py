@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import inspect
 import threading
 import time
 from collections import defaultdict, deque
@@ -147,6 +148,19 @@ def timed(timer_name: str) -> Callable[[Callable[..., _R]], Callable[..., _R]]:
     """Decorator to automatically time function execution."""
 
     def decorator(func: Callable[..., _R]) -> Callable[..., _R]:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start_time = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    timing(timer_name, duration_ms)
+
+            return async_wrapper  # type: ignore[return-value]
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> _R:
             start_time = time.perf_counter()
@@ -10,7 +10,7 @@ from __future__ import annotations
 from typing import Callable, TypeVar
 
 from tenacity import retry as _retry
-from tenacity import stop_after_attempt, wait_exponential
+from tenacity import retry_if_exception_type, stop_after_attempt, wait_exponential
 
 _R = TypeVar("_R")
 
@@ -21,3 +21,19 @@ def retry(func: Callable[..., _R]) -> Callable[..., _R]:  # noqa: D401
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
     )(func)
+
+
+def retry_on(
+    *exception_types: type[BaseException],
+) -> Callable[[Callable[..., _R]], Callable[..., _R]]:
+    """Apply the default retry policy to ``exception_types`` only.
+
+    Any other error, and the last one once the attempts run out, propagates
+    unchanged instead of being wrapped in tenacity's RetryError.
+    """
+    return _retry(
+        retry=retry_if_exception_type(exception_types),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
+        reraise=True,
+    )
@@ -3,16 +3,32 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Any, Dict, List
 
-import jsonschema
-from jsonschema import ValidationError
+from jsonschema import Draft202012Validator, ValidationError
+from jsonschema.exceptions import best_match
 
 from src.utils.logger import get_logger
 
+# orjson is markedly faster than the stdlib parser; fall back when missing.
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 
+def _loads(json_string: str | bytes) -> Any:
+    """Parse JSON with orjson when available, else the stdlib parser."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(json_string)
+    return json.loads(json_string)
+
+
 class SchemaValidationError(ValueError):
     """Raised when JSON schema validation fails."""
 
@@ -46,6 +62,9 @@ class SafeJSONParser:
         "additionalProperties": True,
     }
 
+    # Compiled once; jsonschema.validate re-checks the schema on every call
+    _PLANNER_VALIDATOR = Draft202012Validator(PLANNER_RESPONSE_SCHEMA)
+
     @classmethod
     def validate_planner_response(cls, data: Dict[str, Any]) -> Dict[str, List[str]]:
         """
@@ -62,7 +81,9 @@ class SafeJSONParser:
         """
         try:
             # Validate against schema
-            jsonschema.validate(data, cls.PLANNER_RESPONSE_SCHEMA)
+            error = best_match(cls._PLANNER_VALIDATOR.iter_errors(data))
+            if error is not None:
+                raise error
 
             # Additional business logic validation
             plan = data.get("plan", [])
@@ -92,13 +113,13 @@ class SafeJSONParser:
 
     @classmethod
     def safe_parse_json(
-        cls, json_string: str, schema_type: str = "planner"
+        cls, json_string: str | bytes, schema_type: str = "planner"
     ) -> Dict[str, Any]:
         """
         Safely parse JSON string with schema validation.
 
         Args:
-            json_string: The JSON string to parse
+            json_string: The JSON text to parse, as str or UTF-8 bytes
             schema_type: Type of schema to validate against
 
         Returns:
@@ -109,7 +130,7 @@ class SafeJSONParser:
         """
         try:
             # Parse JSON
-            data = json.loads(json_string)
+            data = _loads(json_string)
 
             # Validate based on schema type
             if schema_type == "planner":
@@ -126,6 +147,24 @@ class SafeJSONParser:
             raise SchemaValidationError(f"Invalid JSON: {str(e)}")
 
 
+# Common prompt injection patterns, matched case-insensitively
+INJECTION_PATTERNS = (
+    "ignore previous instructions",
+    "forget everything",
+    "you are now",
+    "pretend to be",
+    "act as if",
+    "system:",
+    "assistant:",
+    "user:",
+    "human:",
+    "ai:",
+)
+_INJECTION_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in INJECTION_PATTERNS), re.IGNORECASE
+)
+
+
 def sanitize_user_input(user_input: str) -> str:
     """
     Sanitize user input to prevent prompt injection attacks.
@@ -141,30 +180,14 @@ def sanitize_user_input(user_input: str) -> str:
     if not user_input:
         return ""
 
-    # Remove or escape potentially dangerous characters
-    # This is a basic implementation - in production, you might want more
-    # sophisticated sanitization
-    sanitized = user_input
-
-    # Remove common prompt injection patterns
-    injection_patterns = [
-        "ignore previous instructions",
-        "forget everything",
-        "you are now",
-        "pretend to be",
-        "act as if",
-        "system:",
-        "assistant:",
-        "user:",
-        "human:",
-        "ai:",
-    ]
-
-    for pattern in injection_patterns:
-        if pattern.lower() in sanitized.lower():
-            logger.warning("Potential prompt injection detected: %s", pattern)
-            # Remove the pattern and everything after it
-            sanitized = sanitized[: sanitized.lower().find(pattern.lower())].strip()
+    # Remove the first injection pattern and everything after it. A single
+    # compiled alternation finds the earliest match in one pass.
+    match = _INJECTION_RE.search(user_input)
+    if match:
+        logger.warning("Potential prompt injection detected: %s", match.group(0))
+        sanitized = user_input[: match.start()].strip()
+    else:
+        sanitized = user_input
 
     # Limit length to prevent extremely long inputs
     max_length = 10000
@@ -58,11 +58,24 @@ def _create_mock_module(name: str, **attrs) -> ModuleType:
 if "chromadb" not in sys.modules:
     chromadb_module = _create_mock_module("chromadb")
 
+    class MockEmbeddingFunction:
+        """Mock ChromaDB EmbeddingFunction base class."""
+
+        def __call__(self, input: List[str]) -> List[List[float]]:
+            raise NotImplementedError
+
     class MockCollection:
         """Mock ChromaDB Collection."""
 
-        def __init__(self, name: str):
+        def __init__(
+            self,
+            name: str,
+            embedding_function: Any = None,
+            metadata: Dict[str, Any] | None = None,
+        ):
             self.name = name
+            self.metadata = metadata
+            self._embedding_function = embedding_function
             self._documents: List[str] = []
             self._embeddings: List[List[float]] = []
             self._metadatas: List[Dict[str, Any]] = []
@@ -70,25 +83,32 @@ if "chromadb" not in sys.modules:
 
         def add(
             self,
-            documents: List[str],
-            embeddings: List[List[float]],
-            metadatas: List[Dict[str, Any]],
-            ids: List[str],
+            documents: List[str] | None = None,
+            embeddings: List[List[float]] | None = None,
+            metadatas: List[Dict[str, Any]] | None = None,
+            ids: List[str] | None = None,
         ) -> None:
             """Add documents to the collection."""
-            self._documents.extend(documents)
-            self._embeddings.extend(embeddings)
-            self._metadatas.extend(metadatas)
+            ids = ids or []
+            self._documents.extend(documents or ["" for _ in ids])
+            self._embeddings.extend(embeddings or [])
+            self._metadatas.extend(metadatas or [{} for _ in ids])
             self._ids.extend(ids)
 
         def query(
-            self, query_embeddings: List[List[float]], n_results: int = 5
+            self,
+            query_embeddings: List[List[float]] | None = None,
+            query_texts: List[str] | None = None,
+            n_results: int = 5,
         ) -> Dict[str, Any]:
             """Query the collection."""
+            if query_texts is not None and self._embedding_function is not None:
+                query_embeddings = self._embedding_function(query_texts)
+            rows = len(query_embeddings or query_texts or [None])
             return {
-                "documents": [self._documents[:n_results]],
-                "metadatas": [self._metadatas[:n_results]],
-                "ids": [self._ids[:n_results]],
+                "documents": [self._documents[:n_results]] * rows,
+                "metadatas": [self._metadatas[:n_results]] * rows,
+                "ids": [self._ids[:n_results]] * rows,
             }
 
         def count(self) -> int:
@@ -98,19 +118,37 @@ if "chromadb" not in sys.modules:
     class MockChromaDBClient:
         """Mock ChromaDB Client."""
 
-        def __init__(self, path: str | None = None):
+        def __init__(self, path: str | None = None, settings: Any = None):
             self._collections: Dict[str, MockCollection] = {}
 
-        def create_collection(self, name: str) -> MockCollection:
+        def create_collection(
+            self,
+            name: str,
+            embedding_function: Any = None,
+            metadata: Dict[str, Any] | None = None,
+        ) -> MockCollection:
             """Create a new collection."""
-            collection = MockCollection(name)
+            collection = MockCollection(name, embedding_function, metadata)
             self._collections[name] = collection
             return collection
 
-        def get_collection(self, name: str) -> MockCollection:
+        def get_collection(
+            self, name: str, embedding_function: Any = None
+        ) -> MockCollection:
             """Get an existing collection."""
             if name not in self._collections:
-                return self.create_collection(name)
+                return self.create_collection(name, embedding_function)
+            return self._collections[name]
+
+        def get_or_create_collection(
+            self,
+            name: str,
+            embedding_function: Any = None,
+            metadata: Dict[str, Any] | None = None,
+        ) -> MockCollection:
+            """Get a collection, creating it if needed."""
+            if name not in self._collections:
+                return self.create_collection(name, embedding_function, metadata)
             return self._collections[name]
 
         def list_collections(self) -> List[MockCollection]:
@@ -125,14 +163,26 @@ if "chromadb" not in sys.modules:
     class MockPersistentClient(MockChromaDBClient):
         """Mock PersistentClient for ChromaDB."""
 
-        def __init__(self, path: str | None = None):
-            super().__init__(path)
+        def __init__(self, path: str | None = None, settings: Any = None):
+            super().__init__(path, settings)
             # Reset collections on each new instance
             self._collections.clear()
 
     # Set both Client and PersistentClient
     setattr(chromadb_module, "Client", MockChromaDBClient)
     setattr(chromadb_module, "PersistentClient", MockPersistentClient)
+    setattr(chromadb_module, "EmbeddingFunction", MockEmbeddingFunction)
+
+    class MockChromaSettings:
+        """Mock chromadb.config.Settings."""
+
+        def __init__(self, **kwargs: Any):
+            self.__dict__.update(kwargs)
+
+    chromadb_config_module = _create_mock_module(
+        "chromadb.config", Settings=MockChromaSettings
+    )
+    setattr(chromadb_module, "config", chromadb_config_module)
 
 
 # Mock Neo4j
@@ -186,7 +236,83 @@ if "neo4j" not in sys.modules:
         def driver(uri: str, auth: tuple[Any, ...] | None = None, **kwargs):
             return MockNeo4jDriver(uri, auth or ())
 
+    class MockAsyncNeo4jResult:
+        def __init__(self):
+            self._records = [MockNeo4jResult()]
+
+        def __aiter__(self):
+            return self._iterate()
+
+        async def _iterate(self):
+            for record in self._records:
+                yield record
+
+    class MockAsyncNeo4jSession:
+        async def run(self, query: str, parameters: Dict[str, Any] | None = None):
+            return MockAsyncNeo4jResult()
+
+        async def close(self) -> None:
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            await self.close()
+
+    class MockAsyncNeo4jDriver:
+        def __init__(self, uri: str, auth: tuple):
+            self.uri = uri
+            self.auth = auth
+
+        async def close(self) -> None:
+            pass
+
+        def session(self, **kwargs):
+            return MockAsyncNeo4jSession()
+
+    class MockAsyncGraphDatabase:
+        @staticmethod
+        def driver(uri: str, auth: tuple[Any, ...] | None = None, **kwargs):
+            return MockAsyncNeo4jDriver(uri, auth or ())
+
+    class MockQuery:
+        def __init__(self, text: str, metadata: Any = None, timeout: Any = None):
+            self.text = text
+            self.metadata = metadata
+            self.timeout = timeout
+
+    def mock_unit_of_work(metadata: Any = None, timeout: Any = None):
+        def wrapper(f):
+            def wrapped(*args, **kwargs):
+                return f(*args, **kwargs)
+
+            wrapped.metadata = metadata
+            wrapped.timeout = timeout
+            return wrapped
+
+        return wrapper
+
     setattr(sys.modules["neo4j"], "GraphDatabase", MockGraphDatabase)
+    setattr(sys.modules["neo4j"], "AsyncGraphDatabase", MockAsyncGraphDatabase)
+    setattr(sys.modules["neo4j"], "Query", MockQuery)
+    setattr(sys.modules["neo4j"], "unit_of_work", mock_unit_of_work)
+
+    neo4j_exceptions_module = _create_mock_module("neo4j.exceptions")
+
+    class MockServiceUnavailable(Exception):
+        pass
+
+    class MockSessionExpired(Exception):
+        pass
+
+    class MockTransientError(Exception):
+        pass
+
+    setattr(neo4j_exceptions_module, "ServiceUnavailable", MockServiceUnavailable)
+    setattr(neo4j_exceptions_module, "SessionExpired", MockSessionExpired)
+    setattr(neo4j_exceptions_module, "TransientError", MockTransientError)
+    setattr(sys.modules["neo4j"], "exceptions", neo4j_exceptions_module)
 
 
 # Mock Ollama
@@ -194,10 +320,19 @@ if "ollama" not in sys.modules:
     _create_mock_module("ollama")
 
     class MockOllamaClient:
-        def __init__(self, host: str = "http://localhost:11434"):
+        def __init__(self, host: str = "http://localhost:11434", **kwargs):
             self.host = host
 
-        def generate(self, model: str, prompt: str, **kwargs):
+        def close(self):
+            pass
+
+        def generate(self, model: str, prompt: str, stream: bool = False, **kwargs):
+            response = self._generate(model, prompt)
+            if stream:
+                return iter([response])
+            return response
+
+        def _generate(self, model: str, prompt: str):
             # Check if we're in an E2E test context
             import inspect
             frame = inspect.currentframe()
@@ -229,7 +364,27 @@ if "ollama" not in sys.modules:
                 "done": True,
             }
 
+    class MockOllamaAsyncClient:
+        def __init__(self, host: str = "http://localhost:11434", **kwargs):
+            self.host = host
+
+        async def generate(
+            self, model: str, prompt: str, stream: bool = False, **kwargs
+        ):
+            response = MockOllamaClient(self.host).generate(model, prompt)
+            if stream:
+
+                async def _stream():
+                    yield response
+
+                return _stream()
+            return response
+
+        async def close(self):
+            pass
+
     setattr(sys.modules["ollama"], "Client", MockOllamaClient)
+    setattr(sys.modules["ollama"], "AsyncClient", MockOllamaAsyncClient)
 
 
 # Mock LlamaIndex
@@ -276,12 +431,23 @@ if "unstructured" not in sys.modules:
         def __init__(self, text: str):
             self.text = text
 
-    class MockPartition:
-        @staticmethod
-        def auto(file_path: str):
-            return [MockElement(f"Mock content from {file_path}")]
+    class MockUnsupportedFileFormatError(Exception):
+        pass
 
-    setattr(sys.modules["unstructured"], "partition", MockPartition)
+    def mock_partition(filename: str, **kwargs):
+        return [MockElement(f"Mock content from {filename}")]
+
+    unstructured_partition_module = _create_mock_module("unstructured.partition")
+    unstructured_partition_auto_module = _create_mock_module(
+        "unstructured.partition.auto", partition=mock_partition
+    )
+    unstructured_partition_common_module = _create_mock_module(
+        "unstructured.partition.common",
+        UnsupportedFileFormatError=MockUnsupportedFileFormatError,
+    )
+    unstructured_partition_module.auto = unstructured_partition_auto_module
+    unstructured_partition_module.common = unstructured_partition_common_module
+    setattr(sys.modules["unstructured"], "partition", unstructured_partition_module)
 
 
 # Mock spaCy
@@ -349,6 +515,10 @@ if "httpx" not in sys.modules:
     class MockBaseTransport:
         pass
 
+    class MockLimits:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
     # Create httpx submodules
     httpx_client_module = _create_mock_module("httpx._client")
     httpx_types_module = _create_mock_module("httpx._types")
@@ -363,6 +533,7 @@ if "httpx" not in sys.modules:
     setattr(httpx_module, "Client", MockClient)
     setattr(httpx_module, "AsyncClient", MockAsyncClient)
     setattr(httpx_module, "BaseTransport", MockBaseTransport)
+    setattr(httpx_module, "Limits", MockLimits)
     setattr(httpx_module, "_client", httpx_client_module)
     setattr(httpx_module, "_types", httpx_types_module)
 
@@ -375,6 +546,8 @@ if "tenacity" not in sys.modules:
             import functools
             import time
 
+            should_retry = kwargs.get("retry")
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
                 max_attempts = 3
@@ -386,6 +559,8 @@ if "tenacity" not in sys.modules:
                     except Exception as e:
                         if attempt == max_attempts - 1:
                             raise e
+                        if should_retry is not None and not should_retry(e):
+                            raise e
                         # Simple exponential backoff
                         delay = base_delay * (2 ** attempt)
                         time.sleep(delay)
@@ -400,8 +575,8 @@ if "tenacity" not in sys.modules:
     def mock_wait_exponential(multiplier, min=0.5, max=4, **kwargs):
         return None
 
-    def mock_retry_if_exception_type(*args, **kwargs):
-        return None
+    def mock_retry_if_exception_type(exception_types=Exception):
+        return lambda error: isinstance(error, exception_types)
 
     def mock_retry_if_exception(*args, **kwargs):
         return None
@@ -842,6 +1017,22 @@ class MockCompiledGraph:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def reset_tool_caches():
+    """Reset memoized tool outputs, plans and searches so mocks never leak
+    across tests."""
+    nodes = sys.modules.get("src.orchestration.nodes")
+    if nodes is not None:
+        nodes.clear_tool_caches()
+        nodes.clear_plan_cache()
+        nodes._plan_embed_retry_at = 0.0
+    chromadb_agent = sys.modules.get("src.tools.chromadb_agent")
+    if chromadb_agent is not None:
+        chromadb_agent._search_cache.clear()
+    yield
+
+
+
 @pytest.fixture
 def mock_chromadb():
     """Provide a mock ChromaDB client for testing."""
@@ -909,7 +1100,7 @@ def sample_documents():
 @pytest.fixture
 def sample_query():
     """Provide a sample query for testing."""
-    return "What is machine learning?"
+    return "How does machine learning work?"
 
 
 @pytest.fixture
@@ -941,6 +1132,9 @@ def mock_settings():
     settings.neo4j_uri = "bolt://localhost:7687"
     settings.neo4j_user = "neo4j"
     settings.neo4j_password = "test_password"
+    settings.neo4j_pool_size = 10
+    settings.neo4j_acq_timeout = 60.0
+    settings.neo4j_max_connection_lifetime = 3600
     settings.chroma_host = "localhost"
     settings.chroma_port = 8000
     return settings
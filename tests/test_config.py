@@ -50,6 +50,13 @@ class TestSettings:
             assert settings.ollama_host == "http://localhost:11434"
             assert settings.ollama_model == "llama3"
             assert settings.log_level == "INFO"
+            assert settings.max_iterations == 2
+            assert settings.chroma_path == "./chroma_db"
+            assert settings.neo4j_pool_size >= 50
+            assert settings.neo4j_acq_timeout == 60.0
+            assert settings.neo4j_max_connection_lifetime == 3600
+            assert settings.aris_max_concurrent == 2
+            assert settings.tui_thread_pool_size == 8
 
     def test_settings_validation_insecure_password(self):
         """Test Settings validation with insecure password."""
@@ -0,0 +1,79 @@
+"""Tests for the offline ingestion pipeline."""
+
+from __future__ import annotations
+
+import os
+import threading
+from unittest.mock import patch
+
+from scripts.ingest_data import ingest, parse_documents
+
+
+class TestParseDocuments:
+    """Test parse_documents."""
+
+    def test_parse_documents_accepts_listed_dir_entries(self, tmp_path):
+        """Test that a listing of DirEntry objects is filtered like the walk."""
+        (tmp_path / "notes.txt").write_text("text")
+        (tmp_path / "LICENSE").write_text("no extension")
+        (tmp_path / "draft.tmp").write_text("temporary")
+        with os.scandir(tmp_path) as entries:
+            files = sorted(entries, key=lambda entry: entry.name)
+
+        reported = []
+        docs = parse_documents(
+            tmp_path,
+            files,
+            progress_cb=lambda handled, name: reported.append((handled, name)),
+        )
+
+        assert [doc.metadata["filename"] for doc in docs] == ["notes.txt"]
+        assert reported == [(0, "draft.tmp"), (1, "notes.txt")]
+
+    def test_parse_documents_walks_source_dir_without_listing(self, tmp_path):
+        """Test that the directory is walked when no files are passed."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "report.pdf").write_text("pdf")
+        (tmp_path / "LICENSE").write_text("no extension")
+
+        docs = parse_documents(tmp_path)
+
+        assert [doc.metadata["filename"] for doc in docs] == ["report.pdf"]
+
+    def test_parse_documents_stops_once_cancelled(self, tmp_path):
+        """Test that parsing stops before the next file once cancelled."""
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (tmp_path / name).write_text(name)
+        cancel_event = threading.Event()
+
+        def cancel_after_first(handled, name):
+            if handled == 1:
+                cancel_event.set()
+
+        docs = parse_documents(
+            tmp_path,
+            sorted(tmp_path.iterdir()),
+            cancel_event,
+            cancel_after_first,
+        )
+
+        # The file being reported when the event is set is still parsed
+        assert [doc.metadata["filename"] for doc in docs] == ["a.txt", "b.txt"]
+
+
+class TestIngest:
+    """Test the ingest pipeline."""
+
+    def test_ingest_cancelled_before_storing(self, tmp_path):
+        """Test that a cancelled ingestion stores nothing."""
+        (tmp_path / "notes.txt").write_text("text")
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        with patch("scripts.ingest_data.ChromaDBAgent") as mock_chroma, patch(
+            "scripts.ingest_data.Neo4jAgent"
+        ) as mock_neo4j:
+            ingest(tmp_path, cancel_event=cancel_event)
+
+        mock_chroma.assert_not_called()
+        mock_neo4j.assert_not_called()
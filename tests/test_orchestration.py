@@ -67,7 +67,9 @@ async def test_executor_dispatch(mock_vs, mock_get_client):
 @patch("src.orchestration.nodes._get_ollama_client")
 async def test_synthesizer_calls_llm(mock_get_client):
     mock_client = mock_get_client.return_value
-    mock_client.generate.return_value = {"response": "AI is …"}
+    mock_client.generate.return_value = iter(
+        [{"response": "AI is "}, {"response": "…"}]
+    )
 
     st = AgentState(query="What is AI?", tool_output=["context"])
     res_state = synthesizer_node(st)
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.orchestration import graph as graph_module
 from src.orchestration.graph import GRAPH, _edge_selector
 from src.orchestration.state import AgentState
 
 
+async def _astream(*parts):
+    """Yield chunks the way AsyncClient.generate(stream=True) does."""
+    for part in parts:
+        yield part
+
+
 class TestEdgeSelector:
     """Test the edge selector function."""
 
@@ -31,6 +39,23 @@ class TestEdgeSelector:
         state3 = AgentState(query="test", response="Some response")
         assert _edge_selector(state3) == "synth"
 
+    def test_edge_selector_follows_log_level_set_after_import(self):
+        """Test that the INFO gate reads the level configured at call time."""
+        graph_logger = logging.getLogger("src.orchestration.graph")
+        original_level = graph_logger.level
+        state = AgentState(query="test", iteration=0)
+        try:
+            with patch.object(graph_module.logger, "info") as mock_info:
+                graph_logger.setLevel(logging.WARNING)
+                _edge_selector(state)
+                mock_info.assert_not_called()
+
+                graph_logger.setLevel(logging.INFO)
+                _edge_selector(state)
+                mock_info.assert_called_once()
+        finally:
+            graph_logger.setLevel(original_level)
+
 
 class TestGraphCompilation:
     """Test graph compilation and structure."""
@@ -59,16 +84,19 @@ class TestGraphExecution:
     async def test_graph_execution_with_mocks(self, sample_agent_state):
         """Test full graph execution with mocked dependencies."""
         with (
-            patch("src.orchestration.nodes._get_ollama_client") as mock_get_client,
+            patch(
+                "src.orchestration.nodes._get_ollama_async_client"
+            ) as mock_get_client,
             patch("src.orchestration.nodes._get_chromadb_agent") as mock_get_chromadb,
             patch("src.orchestration.nodes._get_neo4j_agent") as mock_get_neo4j,
         ):
 
             # Setup mocks
             mock_client = MagicMock()
+            mock_client.generate = AsyncMock()
             mock_client.generate.side_effect = [
                 {"response": '{"plan": ["vector_search"]}'},  # planner
-                {"response": "Final synthesized response"},  # synthesizer
+                _astream({"response": "Final synthesized response"}),  # synthesizer
             ]
             mock_get_client.return_value = mock_client
 
@@ -103,7 +131,7 @@ class TestGraphExecution:
             mock_client = MagicMock()
             mock_client.generate.side_effect = [
                 {"response": '{"plan": ["vector_search"]}'},  # planner
-                {"response": "Final synthesized response"},  # synthesizer
+                iter([{"response": "Final synthesized response"}]),  # synthesizer
             ]
             mock_get_client.return_value = mock_client
 
@@ -137,16 +165,19 @@ class TestGraphExecution:
         sample_agent_state.ui = ui_callback
 
         with (
-            patch("src.orchestration.nodes._get_ollama_client") as mock_get_client,
+            patch(
+                "src.orchestration.nodes._get_ollama_async_client"
+            ) as mock_get_client,
             patch("src.orchestration.nodes._get_chromadb_agent") as mock_get_chromadb,
             patch("src.orchestration.nodes._get_neo4j_agent") as mock_get_neo4j,
         ):
 
             # Setup mocks
             mock_client = MagicMock()
+            mock_client.generate = AsyncMock()
             mock_client.generate.side_effect = [
                 {"response": '{"plan": ["vector_search"]}'},  # planner
-                {"response": "Final synthesized response"},  # synthesizer
+                _astream({"response": "Final synthesized response"}),  # synthesizer
             ]
             mock_get_client.return_value = mock_client
 
@@ -175,13 +206,16 @@ class TestGraphExecution:
     async def test_graph_execution_error_handling(self, sample_agent_state):
         """Test graph execution error handling."""
         with (
-            patch("src.orchestration.nodes._get_ollama_client") as mock_get_client,
+            patch(
+                "src.orchestration.nodes._get_ollama_async_client"
+            ) as mock_get_client,
             patch("src.orchestration.nodes._get_chromadb_agent") as mock_get_chromadb,
             patch("src.orchestration.nodes._get_neo4j_agent") as mock_get_neo4j,
         ):
 
             # Setup mocks to raise exceptions
             mock_client = MagicMock()
+            mock_client.generate = AsyncMock()
             mock_client.generate.side_effect = Exception("LLM error")
             mock_get_client.return_value = mock_client
 
@@ -209,17 +243,20 @@ class TestGraphStateTransitions:
     async def test_state_evolution_through_graph(self, sample_agent_state):
         """Test how state evolves through graph execution."""
         with (
-            patch("src.orchestration.nodes._get_ollama_client") as mock_get_client,
+            patch(
+                "src.orchestration.nodes._get_ollama_async_client"
+            ) as mock_get_client,
             patch("src.orchestration.nodes._get_chromadb_agent") as mock_get_chromadb,
             patch("src.orchestration.nodes._get_neo4j_agent") as mock_get_neo4j,
         ):
 
             # Setup mocks
             mock_client = MagicMock()
+            mock_client.generate = AsyncMock()
             mock_client.generate.side_effect = [
                 {"response": '{"plan": ["vector_search", "graph_search"]}'},
                 # planner
-                {"response": "Final synthesized response"},  # synthesizer
+                _astream({"response": "Final synthesized response"}),  # synthesizer
             ]
             mock_get_client.return_value = mock_client
 
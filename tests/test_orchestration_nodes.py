@@ -2,20 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.orchestration.nodes import (
+    OLLAMA_HTTP_LIMITS,
+    PLAN_CACHE_RETRY_AFTER,
+    PLANNER_EXAMPLE_PLANS,
     TOOL_MAP,
+    _build_planner_prompt,
+    _get_background_loop,
+    _get_ollama_async_client,
+    _get_ollama_client,
+    clear_tool_caches,
+    close_ollama_clients,
     graph_search,
     graph_search_async,
     planner_node,
+    planner_node_async,
     synthesizer_node,
+    synthesizer_node_async,
+    tool_executor_node,
     tool_executor_node_async,
     vector_search,
     vector_search_async,
 )
+from src.orchestration.state import AgentState
+from src.utils.schema_validator import SafeJSONParser
 
 
 class TestPlannerNode:
@@ -36,6 +54,23 @@ class TestPlannerNode:
             assert result["plan"] == ["vector_search", "graph_search"]
             mock_ollama_client.generate.assert_called_once()
 
+    def test_planner_prompt_template(self):
+        """The precomputed template keeps the query and the JSON examples."""
+        prompt = _build_planner_prompt('graph {nodes} "edges"')
+
+        assert 'User\'s query: "graph {nodes} "edges""' in prompt
+        assert '{"plan": ["vector_search", "graph_search"]}' in prompt
+        assert prompt.endswith("Your response:")
+
+    def test_planner_prompt_examples_are_valid_plans(self):
+        """Every few-shot example in the prompt passes the planner schema."""
+        prompt = _build_planner_prompt("query")
+
+        for plan in PLANNER_EXAMPLE_PLANS:
+            example = json.dumps({"plan": plan})
+            assert example in prompt
+            assert SafeJSONParser.safe_parse_json(example)["plan"] == plan
+
     @pytest.mark.asyncio
     async def test_planner_node_single_tool(
         self, mock_ollama_client, sample_agent_state
@@ -117,6 +152,300 @@ class TestPlannerNode:
 
             assert "planning_complete" in ui_calls
 
+    @pytest.mark.parametrize(
+        "query, plan",
+        [
+            ("How is Ableton connected to Max for Live?", ["graph_search"]),
+            ("Describe the history of jazz", ["vector_search"]),
+        ],
+    )
+    def test_planner_node_keyword_route_skips_llm(self, query, plan):
+        """Test unambiguous keyword queries are planned without the LLM."""
+        with patch("src.orchestration.nodes._get_ollama_client") as mock_get_client:
+            result = planner_node(AgentState(query=query))
+
+            assert result["plan"] == plan
+            mock_get_client.assert_not_called()
+
+    def test_planner_node_ambiguous_keywords_use_llm(self, mock_ollama_client):
+        """Test queries matching both keyword groups fall through to the LLM."""
+        with patch("src.orchestration.nodes._get_ollama_client") as mock_get_client:
+            mock_get_client.return_value = mock_ollama_client
+            mock_ollama_client.generate.return_value = {
+                "response": '{"plan": ["vector_search", "graph_search"]}'
+            }
+
+            result = planner_node(
+                AgentState(query="What is the relationship between jazz and blues?")
+            )
+
+            assert result["plan"] == ["vector_search", "graph_search"]
+            mock_ollama_client.generate.assert_called_once()
+
+
+class TestAsyncLLMNodes:
+    """Test the async planner and synthesizer nodes."""
+
+    @pytest.mark.asyncio
+    async def test_planner_node_async_success(self, sample_agent_state):
+        """Test async planner returns the first valid plan."""
+        mock_client = MagicMock()
+        mock_client.generate = AsyncMock(
+            return_value={"response": '{"plan": ["graph_search"]}'}
+        )
+        with patch(
+            "src.orchestration.nodes._get_ollama_async_client",
+            return_value=mock_client,
+        ):
+            result = await planner_node_async(sample_agent_state)
+
+        assert result["plan"] == ["graph_search"]
+        mock_client.generate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_planner_node_async_speculative_retries(self, sample_agent_state):
+        """Test async planner fans out the remaining retries concurrently."""
+        mock_client = MagicMock()
+        mock_client.generate = AsyncMock(
+            side_effect=[
+                {"response": "Invalid JSON"},
+                Exception("LLM error"),
+                {"response": '{"plan": ["vector_search", "graph_search"]}'},
+            ]
+        )
+        with patch(
+            "src.orchestration.nodes._get_ollama_async_client",
+            return_value=mock_client,
+        ):
+            result = await planner_node_async(sample_agent_state)
+
+        assert result["plan"] == ["vector_search", "graph_search"]
+        assert mock_client.generate.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_planner_node_async_fallback(self, sample_agent_state):
+        """Test async planner falls back when every attempt fails."""
+        mock_client = MagicMock()
+        mock_client.generate = AsyncMock(return_value={"response": "Invalid"})
+        with patch(
+            "src.orchestration.nodes._get_ollama_async_client",
+            return_value=mock_client,
+        ):
+            result = await planner_node_async(sample_agent_state)
+
+        assert result["plan"] == ["vector_search"]
+        assert mock_client.generate.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_synthesizer_node_async(self, sample_agent_state_with_outputs):
+        """Test async synthesizer awaits the async client."""
+        async def stream():
+            for token in ("Async ", "answer"):
+                yield {"response": token}
+
+        mock_client = MagicMock()
+        mock_client.generate = AsyncMock(return_value=stream())
+        with patch(
+            "src.orchestration.nodes._get_ollama_async_client",
+            return_value=mock_client,
+        ):
+            result = await synthesizer_node_async(sample_agent_state_with_outputs)
+
+        assert result["response"] == "Async answer"
+        prompt = mock_client.generate.call_args.kwargs["prompt"]
+        assert "AI is a field of computer science..." in prompt
+
+
+class TestPlanCache:
+    """Test reuse of plans for semantically similar queries."""
+
+    @staticmethod
+    def _plan_cache(distance: float, plan: str = '["graph_search"]'):
+        cache = MagicMock()
+        cache.count.return_value = 0
+        cache.query.return_value = {
+            "distances": [[distance]],
+            "metadatas": [[{"plan": plan}]],
+        }
+        return cache
+
+    @staticmethod
+    def _embed_client():
+        client = MagicMock()
+        client.embed.return_value = {"embeddings": [[0.1, 0.2, 0.3]]}
+        return client
+
+    def test_similar_query_reuses_cached_plan(self, sample_agent_state):
+        """Test a near-duplicate query skips the planner LLM call."""
+        mock_client = MagicMock()
+        with (
+            patch(
+                "src.orchestration.nodes._get_plan_cache",
+                return_value=self._plan_cache(0.01),
+            ),
+            patch(
+                "src.orchestration.nodes.plan_embed_client", self._embed_client()
+            ),
+            patch(
+                "src.orchestration.nodes._get_ollama_client", return_value=mock_client
+            ),
+        ):
+            result = planner_node(sample_agent_state)
+
+        assert result["plan"] == ["graph_search"]
+        mock_client.generate.assert_not_called()
+
+    def test_cache_miss_stores_generated_plan(self, sample_agent_state):
+        """Test a distant match calls the LLM and caches its plan."""
+        cache = self._plan_cache(0.5)
+        mock_client = MagicMock()
+        mock_client.generate.return_value = {"response": '{"plan": ["vector_search"]}'}
+        with (
+            patch("src.orchestration.nodes._get_plan_cache", return_value=cache),
+            patch(
+                "src.orchestration.nodes.plan_embed_client", self._embed_client()
+            ),
+            patch(
+                "src.orchestration.nodes._get_ollama_client", return_value=mock_client
+            ),
+        ):
+            result = planner_node(sample_agent_state)
+
+        assert result["plan"] == ["vector_search"]
+        mock_client.generate.assert_called_once()
+        kwargs = cache.add.call_args.kwargs
+        assert kwargs["embeddings"] == [[0.1, 0.2, 0.3]]
+        assert kwargs["metadatas"] == [{"plan": '["vector_search"]'}]
+
+    def test_fallback_plan_is_not_cached(self, sample_agent_state):
+        """Test the fallback plan is never stored in the cache."""
+        cache = self._plan_cache(0.5)
+        mock_client = MagicMock()
+        mock_client.generate.return_value = {"response": "not json"}
+        with (
+            patch("src.orchestration.nodes._get_plan_cache", return_value=cache),
+            patch(
+                "src.orchestration.nodes.plan_embed_client", self._embed_client()
+            ),
+            patch(
+                "src.orchestration.nodes._get_ollama_client", return_value=mock_client
+            ),
+        ):
+            result = planner_node(sample_agent_state)
+
+        assert result["plan"] == ["vector_search"]
+        cache.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_planner_reuses_cached_plan(self, sample_agent_state):
+        """Test the async planner also consults the plan cache."""
+        mock_client = MagicMock()
+        mock_client.generate = AsyncMock()
+        with (
+            patch(
+                "src.orchestration.nodes._get_plan_cache",
+                return_value=self._plan_cache(0.0),
+            ),
+            patch(
+                "src.orchestration.nodes.plan_embed_client", self._embed_client()
+            ),
+            patch(
+                "src.orchestration.nodes._get_ollama_async_client",
+                return_value=mock_client,
+            ),
+        ):
+            result = await planner_node_async(sample_agent_state)
+
+        assert result["plan"] == ["graph_search"]
+        mock_client.generate.assert_not_called()
+
+    def test_embedding_failure_skips_lookups_for_a_while(self, sample_agent_state):
+        """Test a failed embedding is not retried on every planner call."""
+        embed_client = MagicMock()
+        embed_client.embed.side_effect = Exception("timed out")
+        mock_client = MagicMock()
+        mock_client.generate.return_value = {"response": '{"plan": ["vector_search"]}'}
+        with (
+            patch("src.orchestration.nodes.plan_embed_client", embed_client),
+            patch(
+                "src.orchestration.nodes._get_ollama_client", return_value=mock_client
+            ),
+            patch("src.orchestration.nodes.time") as mock_time,
+        ):
+            mock_time.monotonic.return_value = 100.0
+            planner_node(sample_agent_state)
+            planner_node(sample_agent_state)
+            assert embed_client.embed.call_count == 1
+            assert mock_client.generate.call_count == 2
+
+            mock_time.monotonic.return_value = 100.0 + PLAN_CACHE_RETRY_AFTER
+            planner_node(sample_agent_state)
+            assert embed_client.embed.call_count == 2
+
+
+class TestOllamaClients:
+    """Test construction of the pooled Ollama clients."""
+
+    def test_async_client_shares_connection_pool(self):
+        """Test the async client is created once with keep-alive limits."""
+        with (
+            patch("src.orchestration.nodes.OLLAMA_ASYNC_CLIENT", None),
+            patch("src.orchestration.nodes.ollama.AsyncClient") as mock_cls,
+        ):
+            first = _get_ollama_async_client()
+            second = _get_ollama_async_client()
+
+        assert first is second
+        mock_cls.assert_called_once()
+        kwargs = mock_cls.call_args.kwargs
+        assert kwargs["limits"] is OLLAMA_HTTP_LIMITS
+        assert "http2" in kwargs
+
+    def test_close_ollama_clients(self):
+        """Test pooled clients are closed and dropped."""
+        sync_client = MagicMock()
+        async_client = MagicMock()
+        async_client.close = AsyncMock()
+        with (
+            patch("src.orchestration.nodes.OLLAMA_CLIENT", sync_client),
+            patch("src.orchestration.nodes.OLLAMA_ASYNC_CLIENT", async_client),
+        ):
+            close_ollama_clients()
+
+            from src.orchestration import nodes
+
+            assert nodes.OLLAMA_CLIENT is None
+            assert nodes.OLLAMA_ASYNC_CLIENT is None
+
+        sync_client.close.assert_called_once()
+        async_client.close.assert_awaited_once()
+
+    def test_concurrent_first_calls_build_one_client(self):
+        """Test racing threads share a single lazily built client."""
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def build(**kwargs):
+            time.sleep(0.01)
+            return MagicMock()
+
+        def call():
+            barrier.wait()
+            clients.append(_get_ollama_client())
+
+        with (
+            patch("src.orchestration.nodes.OLLAMA_CLIENT", None),
+            patch("src.orchestration.nodes.ollama.Client", side_effect=build) as cls,
+        ):
+            threads = [threading.Thread(target=call) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        cls.assert_called_once()
+        assert all(client is clients[0] for client in clients)
+
 
 class TestToolExecutorNodeAsync:
     """Test the async tool executor node functionality."""
@@ -205,6 +534,35 @@ class TestToolExecutorNodeAsync:
             assert any("tool_start:graph_search" in call for call in ui_calls)
             assert any("tool_done:graph_search" in call for call in ui_calls)
 
+    @pytest.mark.asyncio
+    async def test_tool_executor_runs_duplicate_tools_once(self, sample_agent_state):
+        """Test repeated tools and their async variants share one run."""
+        sample_agent_state.plan = [
+            "vector_search",
+            "graph_search",
+            "vector_search_async",
+            "vector_search",
+        ]
+        vector_mock = MagicMock(return_value="Vector result")
+        vector_async_mock = AsyncMock(return_value="Async vector result")
+
+        with patch.dict(
+            TOOL_MAP,
+            {
+                "vector_search": vector_mock,
+                "vector_search_async": vector_async_mock,
+                "graph_search": MagicMock(return_value="Graph result"),
+            },
+        ):
+            result = await tool_executor_node_async(sample_agent_state)
+            sync_result = tool_executor_node(sample_agent_state)
+
+        expected = ["Vector result", "Graph result", "Vector result", "Vector result"]
+        assert result["tool_output"] == expected
+        assert sync_result["tool_output"] == expected
+        assert vector_mock.call_count == 2
+        vector_async_mock.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_tool_executor_empty_plan(self, sample_agent_state):
         """Test tool executor with empty plan."""
@@ -215,6 +573,70 @@ class TestToolExecutorNodeAsync:
         assert "tool_output" in result
         assert result["tool_output"] == []
 
+    @pytest.mark.asyncio
+    async def test_tool_executor_runs_tools_concurrently(
+        self, sample_agent_state_with_plan
+    ):
+        """Sync and async tools overlap and outputs keep plan order."""
+        sample_agent_state_with_plan.plan = ["vector_search", "graph_search_async"]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def sync_tool(state):
+            barrier.wait()
+            return "Sync vector result"
+
+        async def async_tool(state):
+            await asyncio.to_thread(barrier.wait)
+            return "Async graph result"
+
+        with patch.dict(
+            TOOL_MAP,
+            {"vector_search": sync_tool, "graph_search_async": async_tool},
+        ):
+            result = await tool_executor_node_async(sample_agent_state_with_plan)
+
+        assert result["tool_output"] == ["Sync vector result", "Async graph result"]
+
+    @pytest.mark.asyncio
+    async def test_tool_executor_async_tool_error(self, sample_agent_state_with_plan):
+        """A failing tool yields an error string without dropping the others."""
+        sample_agent_state_with_plan.plan = ["vector_search_async", "graph_search"]
+
+        with patch.dict(
+            TOOL_MAP,
+            {
+                "vector_search_async": AsyncMock(side_effect=Exception("boom")),
+                "graph_search": MagicMock(return_value="Graph result"),
+            },
+        ):
+            result = await tool_executor_node_async(sample_agent_state_with_plan)
+
+        assert result["tool_output"] == [
+            "Error executing vector_search_async: boom",
+            "Graph result",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_executor_reuses_background_loop(
+        self, sample_agent_state_with_plan
+    ):
+        """Async tools called from the sync executor share one background loop."""
+        sample_agent_state_with_plan.plan = ["vector_search_async"]
+        loops = []
+
+        async def fake_tool(state):
+            loops.append(asyncio.get_running_loop())
+            return "Async vector result"
+
+        with patch.dict(TOOL_MAP, {"vector_search_async": fake_tool}):
+            first = tool_executor_node(sample_agent_state_with_plan)
+            second = tool_executor_node(sample_agent_state_with_plan)
+
+        assert first["tool_output"] == ["Async vector result"]
+        assert second["tool_output"] == ["Async vector result"]
+        assert loops[0] is loops[1] is _get_background_loop()
+        assert loops[0] is not asyncio.get_running_loop()
+
 
 class TestSynthesizerNode:
     """Test the synthesizer node functionality."""
@@ -226,17 +648,21 @@ class TestSynthesizerNode:
         """Test successful synthesizer node execution."""
         with patch("src.orchestration.nodes._get_ollama_client") as mock_get_client:
             mock_get_client.return_value = mock_ollama_client
-            mock_ollama_client.generate.return_value = {
-                "response": (
-                    "Artificial Intelligence (AI) is a field of computer science..."
-                )
-            }
+            mock_ollama_client.generate.return_value = iter(
+                [
+                    {"response": "Artificial Intelligence (AI) "},
+                    {"response": "is a field of computer science..."},
+                ]
+            )
 
             result = synthesizer_node(sample_agent_state_with_outputs)
 
             assert "response" in result
-            assert "Artificial Intelligence" in result["response"]
+            assert result["response"] == (
+                "Artificial Intelligence (AI) is a field of computer science..."
+            )
             mock_ollama_client.generate.assert_called_once()
+            assert mock_ollama_client.generate.call_args.kwargs["stream"] is True
 
     @pytest.mark.asyncio
     async def test_synthesizer_node_ui_callbacks(
@@ -249,12 +675,22 @@ class TestSynthesizerNode:
             ui_calls.append(msg)
 
         sample_agent_state_with_outputs.ui = ui_callback
-        mock_ollama_client.generate.return_value = {"response": "Test response"}
+        mock_ollama_client.generate.return_value = iter(
+            [{"response": "Test "}, {"response": "response"}]
+        )
 
-        synthesizer_node(sample_agent_state_with_outputs)
+        with patch(
+            "src.orchestration.nodes._get_ollama_client",
+            return_value=mock_ollama_client,
+        ):
+            synthesizer_node(sample_agent_state_with_outputs)
 
-        assert "synth_start" in ui_calls
-        assert "Answer ready ✨" in ui_calls
+        assert ui_calls == [
+            "synth_start",
+            "token:Test ",
+            "token:response",
+            "Answer ready ✨",
+        ]
 
     @pytest.mark.asyncio
     async def test_synthesizer_node_context_handling(
@@ -263,7 +699,9 @@ class TestSynthesizerNode:
         """Test synthesizer node context handling."""
         with patch("src.orchestration.nodes._get_ollama_client") as mock_get_client:
             mock_get_client.return_value = mock_ollama_client
-            mock_ollama_client.generate.return_value = {"response": "Test response"}
+            mock_ollama_client.generate.return_value = iter(
+                [{"response": "Test response"}]
+            )
 
             synthesizer_node(sample_agent_state_with_outputs)
 
@@ -329,6 +767,50 @@ class TestToolFunctions:
             mock_neo4j_agent.query_async.assert_called_once()
 
 
+class TestToolResultCache:
+    """Test memoization of tool outputs."""
+
+    @pytest.mark.asyncio
+    async def test_graph_search_shares_cache_with_async(
+        self, mock_neo4j_agent, sample_agent_state
+    ):
+        """The constant graph query is only sent to Neo4j once."""
+        with patch(
+            "src.orchestration.nodes._get_neo4j_agent", return_value=mock_neo4j_agent
+        ):
+            first = graph_search(sample_agent_state)
+            second = await graph_search_async(AgentState(query="Other query"))
+
+            assert first == second
+            mock_neo4j_agent.query.assert_called_once()
+            mock_neo4j_agent.query_async.assert_not_called()
+
+    def test_clear_tool_caches(self, mock_neo4j_agent, sample_agent_state):
+        """Clearing the caches forces a fresh lookup."""
+        with patch(
+            "src.orchestration.nodes._get_neo4j_agent", return_value=mock_neo4j_agent
+        ):
+            graph_search(sample_agent_state)
+            clear_tool_caches()
+            graph_search(sample_agent_state)
+
+            assert mock_neo4j_agent.query.call_count == 2
+
+    def test_vector_search_leaves_caching_to_agent(
+        self, mock_chromadb_agent, sample_agent_state
+    ):
+        """Vector searches always ask the agent, whose cache ingestion
+        clears."""
+        with patch(
+            "src.orchestration.nodes._get_chromadb_agent",
+            return_value=mock_chromadb_agent,
+        ):
+            vector_search(sample_agent_state)
+            vector_search(sample_agent_state)
+
+            assert mock_chromadb_agent.similarity_search.call_count == 2
+
+
 class TestToolMap:
     """Test the TOOL_MAP configuration."""
 
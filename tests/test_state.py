@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 from src.orchestration.state import AgentState
 
 
@@ -165,3 +167,17 @@ class TestAgentState:
         # Should contain the query
         assert "Test query" in str_repr
         assert "AgentState" in str_repr or "query" in str_repr
+
+    def test_agent_state_is_slotted_dataclass(self):
+        """Test AgentState is a slotted dataclass without a per-instance dict."""
+        state = AgentState(query="Test query")
+
+        assert dataclasses.is_dataclass(state)
+        assert not hasattr(state, "__dict__")
+        assert dataclasses.asdict(state)["query"] == "Test query"
+
+    def test_agent_state_ui_excluded_from_repr(self):
+        """Test the UI callback is left out of the state repr."""
+        state = AgentState(query="Test query", ui=lambda msg: None)
+
+        assert "ui=" not in repr(state)
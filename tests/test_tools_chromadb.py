@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.tools.chromadb_agent import ChromaDBAgent
+from src.tools.chromadb_agent import (
+    ChromaDBAgent,
+    OllamaEmbeddingFunction,
+    _search_cache,
+)
 
 
 class TestChromaDBAgent:
@@ -35,6 +40,7 @@ class TestChromaDBAgent:
         # Reset the singleton and set the mock client
         ChromaDBAgent._client = mock_client
         ChromaDBAgent._embedding_function = mock_embedding
+        ChromaDBAgent._collections.clear()
 
         agent = ChromaDBAgent("test_collection")
         # Set the mock collection directly on the agent instance
@@ -134,6 +140,81 @@ class TestChromaDBAgent:
             # The mock returns ["Mock document 1", "Mock document 2"]
             assert result == ["Mock document 1", "Mock document 2"]
 
+    def test_chromadb_agent_similarity_search_many(self, mock_settings, mock_chromadb):
+        """Test batched similarity search sends all queries at once."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+            agent._collection.query.return_value = {
+                "documents": [["Doc A"], ["Doc B"]]
+            }
+
+            result = agent.similarity_search_many(["query a", "query b"])
+
+            assert result == [["Doc A"], ["Doc B"]]
+            agent._collection.query.assert_called_once_with(
+                query_texts=["query a", "query b"], n_results=5
+            )
+
+    def test_chromadb_agent_registers_embedding_function(self, mock_settings):
+        """Test the collection embeds query texts with the Ollama model."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+
+            _, kwargs = agent._client.get_collection.call_args
+            collection_embedding = kwargs["embedding_function"]
+            assert isinstance(collection_embedding, OllamaEmbeddingFunction)
+
+            embedding = agent._embedding_function
+            embedding.get_text_embedding_batch.return_value = [[0.1], [0.2]]
+            assert collection_embedding(["a", "b"]) == [[0.1], [0.2]]
+            embedding.get_text_embedding_batch.assert_called_once_with(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_chromadb_agent_async_searches_are_coalesced(
+        self, mock_settings, mock_chromadb
+    ):
+        """Test concurrent async searches share one batched lookup."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+            agent._collection.query.return_value = {
+                "documents": [["Doc A"], ["Doc B"]]
+            }
+
+            results = await asyncio.gather(
+                agent.similarity_search_async("query a"),
+                agent.similarity_search_async("query b"),
+                agent.similarity_search_async("query a"),
+            )
+
+            assert results == [["Doc A"], ["Doc B"], ["Doc A"]]
+            agent._collection.query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_chromadb_agent_async_searches_are_kept_per_loop(
+        self, mock_settings, mock_chromadb
+    ):
+        """Test searches from another event loop are batched on that loop."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+            agent._collection.query.side_effect = lambda query_texts, n_results: {
+                "documents": [[f"Doc for {query}"] for query in query_texts]
+            }
+
+            other_loop = asyncio.new_event_loop()
+            try:
+                local = asyncio.ensure_future(agent.similarity_search_async("query a"))
+                remote = await asyncio.to_thread(
+                    other_loop.run_until_complete,
+                    agent.similarity_search_async("query b"),
+                )
+                assert await local == ["Doc for query a"]
+                assert remote == ["Doc for query b"]
+            finally:
+                other_loop.close()
+
+            assert agent._pending == {}
+            assert not agent._batch_tasks
+
     def test_chromadb_agent_cached_search(self, mock_settings, mock_chromadb):
         """Test that similarity search uses caching."""
         with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
@@ -196,12 +277,116 @@ class TestChromaDBAgent:
             ):
                 agent.similarity_search("test query")
 
-    def test_chromadb_agent_lru_cache_maxsize(self, mock_settings):
-        """Test that LRU cache has correct maxsize."""
-        from src.tools.chromadb_agent import ChromaDBAgent
+    def test_chromadb_agent_probes_collection_once(self, mock_settings):
+        """Test later agents reuse the verified collection without probing."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+            collection = agent._client.get_collection.return_value
+            collection.query.reset_mock()
+
+            second = ChromaDBAgent("test_collection")
+            assert second._collection is collection
+            collection.query.assert_not_called()
+
+            # A different collection is still verified on first use
+            ChromaDBAgent("other_collection")
+            assert agent._client.get_collection.call_count == 2
+            collection.query.assert_called_once_with(
+                query_texts=["test"], n_results=1
+            )
+
+    def test_chromadb_agent_add_documents_batched(self, mock_settings):
+        """Test that inserts are chunked and invalidate cached searches."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+            agent.similarity_search("test query")
+
+            ids = [f"doc_{i}" for i in range(5)]
+            docs = [f"text {i}" for i in range(5)]
+            assert agent.add_documents(ids, docs, batch_size=2) == 5
+
+            calls = agent._collection.add.call_args_list
+            assert [call.kwargs["ids"] for call in calls] == [
+                ["doc_0", "doc_1"],
+                ["doc_2", "doc_3"],
+                ["doc_4"],
+            ]
+            assert calls[0].kwargs["embeddings"] is None
+            assert len(_search_cache) == 0
+
+    def test_chromadb_agent_add_documents_invalidates_other_agents(
+        self, mock_settings
+    ):
+        """Test documents added through one agent refresh every agent's
+        searches."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            searcher = self._setup_mock_agent(mock_embedding_class)
+            ingester = ChromaDBAgent("test_collection")
+            query = searcher._collection.query
+            searcher.similarity_search("test query")
+            searcher.similarity_search("test query")
+            searches = query.call_count
+
+            ingester.add_documents(["doc_0"], ["text 0"])
+            searcher.similarity_search("test query")
+
+            assert query.call_count == searches + 1
+
+    def test_chromadb_agent_add_documents_falls_back_per_document(
+        self, mock_settings
+    ):
+        """Test a failing batch is retried per document and counted."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+
+            def add(ids, documents, metadatas, embeddings):
+                if "doc_1" in ids:
+                    raise ValueError("bad document")
+
+            agent._collection.add.side_effect = add
+
+            ids = [f"doc_{i}" for i in range(4)]
+            docs = [f"text {i}" for i in range(4)]
+            stored = agent.add_documents(ids, docs, batch_size=2)
+
+            assert stored == 3
+            calls = agent._collection.add.call_args_list
+            assert [call.kwargs["ids"] for call in calls] == [
+                ["doc_0", "doc_1"],
+                ["doc_0"],
+                ["doc_1"],
+                ["doc_2", "doc_3"],
+            ]
+
+    def test_chromadb_agent_creates_collection_with_hnsw_params(self, mock_settings):
+        """Test new collections are created with the tuned HNSW metadata."""
+        from src.tools.chromadb_agent import HNSW_METADATA
+
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+            agent._client.get_collection.side_effect = Exception("does not exist")
+
+            agent = ChromaDBAgent("new_collection")
+
+            _, kwargs = agent._client.create_collection.call_args
+            assert kwargs["metadata"] == HNSW_METADATA
+
+    def test_chromadb_agent_ttl_cache_bounds(self, mock_settings):
+        """Test that the search cache is a bounded, expiring TTL cache."""
+        from src.tools.chromadb_agent import CACHE_MAXSIZE, CACHE_TTL
+
+        assert _search_cache.maxsize == CACHE_MAXSIZE
+        assert _search_cache.ttl == CACHE_TTL
+
+    def test_chromadb_agent_cache_normalizes_query(
+        self, mock_settings, mock_chromadb
+    ):
+        """Test that whitespace and case variants share one cache entry."""
+        with patch("src.tools.chromadb_agent.OllamaEmbedding") as mock_embedding_class:
+            agent = self._setup_mock_agent(mock_embedding_class)
+
+            first = agent.similarity_search("Test   Query")
+            second = agent.similarity_search("  test query ")
 
-        # Check that the _cached_search method has the lru_cache decorator
-        cached_search = getattr(ChromaDBAgent, "_cached_search")
-        # The cache_info method should be available if lru_cache is applied
-        assert hasattr(cached_search, "cache_info")
-        assert hasattr(cached_search, "cache_clear")
+            assert first == second
+            agent._collection.query.assert_called_once()
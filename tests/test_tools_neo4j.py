@@ -2,13 +2,67 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from neo4j.exceptions import ServiceUnavailable, TransientError
 
 from src.tools.neo4j_agent import Neo4jAgent
 
 
+def _managed_session(**kwargs) -> MagicMock:
+    """Build a session mock whose managed transactions run on the session."""
+    session = MagicMock(**kwargs)
+    session.execute_read.side_effect = lambda work, *args: work(session, *args)
+    session.execute_write.side_effect = lambda work, *args: work(session, *args)
+    return session
+
+
+def _mock_async_driver(rows: list[dict]) -> tuple[MagicMock, MagicMock]:
+    """Build an async driver mock whose session returns ``rows``."""
+
+    async def records():
+        for row in rows:
+            record = MagicMock()
+            record.data.return_value = row
+            yield record
+
+    def result(*args):
+        mock_result = MagicMock()
+        mock_result.__aiter__.side_effect = records
+        mock_result.data = AsyncMock(return_value=list(rows))
+        return mock_result
+
+    mock_session = _managed_session()
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+    mock_session.run = AsyncMock(side_effect=result)
+
+    async def execute(work, *args):
+        return await work(mock_session, *args)
+
+    mock_session.execute_read = AsyncMock(side_effect=execute)
+    mock_session.execute_write = AsyncMock(side_effect=execute)
+    mock_driver = MagicMock()
+    mock_driver.session.return_value = mock_session
+    mock_driver.close = AsyncMock()
+    return mock_driver, mock_session
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_driver():
+    """Give every test its own driver instead of the process-wide one."""
+    Neo4jAgent._shared_driver = None
+    Neo4jAgent._instance = None
+    Neo4jAgent._async_agents.clear()
+    yield
+    Neo4jAgent._shared_driver = None
+    Neo4jAgent._instance = None
+    Neo4jAgent._async_agents.clear()
+
+
 class TestNeo4jAgent:
     """Test the Neo4jAgent class."""
 
@@ -22,23 +76,43 @@ class TestNeo4jAgent:
             mock_driver.verify_connectivity.return_value = None
             mock_db.driver.return_value = mock_driver
 
-            agent = Neo4jAgent()
+            agent = Neo4jAgent(eager=True)
 
             assert agent._driver is not None
             mock_db.driver.assert_called_once_with(
                 mock_settings.neo4j_uri,
                 auth=(mock_settings.neo4j_user, mock_settings.neo4j_password),
                 max_connection_pool_size=10,
+                connection_acquisition_timeout=60.0,
+                max_connection_lifetime=3600,
             )
             mock_driver.verify_connectivity.assert_called_once()
 
+    def test_neo4j_agent_initialization_is_lazy(self, mock_settings):
+        """Test the driver is only built when the first query runs."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_driver.session.return_value = _managed_session(
+                run=MagicMock(**{"return_value.data.return_value": []})
+            )
+            mock_db.driver.return_value = mock_driver
+
+            agent = Neo4jAgent()
+            mock_db.driver.assert_not_called()
+
+            agent.query("RETURN 1")
+            mock_db.driver.assert_called_once()
+            mock_driver.verify_connectivity.assert_not_called()
+
     def test_neo4j_agent_initialization_error(self, mock_settings):
         """Test Neo4jAgent initialization with connection error."""
         with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
             mock_db.driver.side_effect = Exception("Connection failed")
 
             with pytest.raises(Exception, match="Connection failed"):
-                Neo4jAgent()
+                Neo4jAgent(eager=True)
+            with pytest.raises(Exception, match="Connection failed"):
+                Neo4jAgent().query("RETURN 1")
 
     def test_neo4j_agent_close(self, mock_settings):
         """Test Neo4jAgent close method."""
@@ -47,10 +121,50 @@ class TestNeo4jAgent:
             mock_driver.verify_connectivity.return_value = None
             mock_db.driver.return_value = mock_driver
 
-            agent = Neo4jAgent()
+            agent = Neo4jAgent(eager=True)
             agent.close()
 
-            mock_driver.close.assert_called_once()
+            # The shared driver outlives a single agent
+            assert agent._driver is None
+            mock_driver.close.assert_not_called()
+
+    def test_neo4j_agent_close_keeps_other_agents_working(self, mock_settings):
+        """Test closing one agent does not break the shared driver."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_db.driver.return_value = mock_driver
+            mock_session = _managed_session()
+            mock_session.run.return_value.data.return_value = [{"n": 1}]
+            mock_driver.session.return_value = mock_session
+
+            shared = Neo4jAgent.instance()
+            shared.query("RETURN 1 AS n")
+            Neo4jAgent().close()
+
+            assert shared.query("RETURN 1 AS n") == [{"n": 1}]
+            assert Neo4jAgent.instance() is shared
+            mock_db.driver.assert_called_once()
+            mock_driver.close.assert_not_called()
+
+    def test_neo4j_agent_shutdown_closes_shared_driver(self, mock_settings):
+        """Test shutdown closes the driver and agents reconnect afterwards."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            first_driver, second_driver = MagicMock(), MagicMock()
+            mock_db.driver.side_effect = [first_driver, second_driver]
+            for driver in (first_driver, second_driver):
+                session = _managed_session()
+                session.run.return_value.data.return_value = []
+                driver.session.return_value = session
+
+            agent = Neo4jAgent()
+            agent.query("RETURN 1")
+            Neo4jAgent.shutdown()
+            first_driver.close.assert_called_once()
+
+            agent.query("RETURN 1")
+            assert agent._driver is second_driver
+            first_driver.session.return_value.close.assert_called_once()
+            second_driver.session.assert_called_once()
 
     def test_neo4j_agent_close_with_none_driver(self, mock_settings):
         """Test Neo4jAgent close method when driver is None."""
@@ -71,13 +185,13 @@ class TestNeo4jAgent:
             mock_db.driver.return_value = mock_driver
 
             # Mock session and result
-            mock_session = MagicMock()
+            mock_session = _managed_session()
             mock_result = MagicMock()
-            mock_record = MagicMock()
-            mock_record.data.return_value = {"name": "Test Node", "label": "TestLabel"}
-            mock_result.__iter__.return_value = [mock_record]
+            mock_result.data.return_value = [
+                {"name": "Test Node", "label": "TestLabel"}
+            ]
             mock_session.run.return_value = mock_result
-            mock_driver.session.return_value.__enter__.return_value = mock_session
+            mock_driver.session.return_value = mock_session
 
             agent = Neo4jAgent()
             result = agent.query("MATCH (n) RETURN n")
@@ -93,13 +207,11 @@ class TestNeo4jAgent:
             mock_db.driver.return_value = mock_driver
 
             # Mock session and result
-            mock_session = MagicMock()
+            mock_session = _managed_session()
             mock_result = MagicMock()
-            mock_record = MagicMock()
-            mock_record.data.return_value = {"name": "Test Node"}
-            mock_result.__iter__.return_value = [mock_record]
+            mock_result.data.return_value = [{"name": "Test Node"}]
             mock_session.run.return_value = mock_result
-            mock_driver.session.return_value.__enter__.return_value = mock_session
+            mock_driver.session.return_value = mock_session
 
             agent = Neo4jAgent()
             parameters = {"name": "Test"}
@@ -118,61 +230,395 @@ class TestNeo4jAgent:
             mock_db.driver.return_value = mock_driver
 
             # Mock session and empty result
-            mock_session = MagicMock()
+            mock_session = _managed_session()
             mock_result = MagicMock()
-            mock_result.__iter__.return_value = []
+            mock_result.data.return_value = []
             mock_session.run.return_value = mock_result
-            mock_driver.session.return_value.__enter__.return_value = mock_session
+            mock_driver.session.return_value = mock_session
 
             agent = Neo4jAgent()
             result = agent.query("MATCH (n) RETURN n")
 
             assert result == []
 
+    def test_neo4j_agent_query_uses_managed_transactions(self, mock_settings):
+        """Test reads and writes go through execute_read and execute_write."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_db.driver.return_value = mock_driver
+            mock_session = _managed_session()
+            mock_session.run.return_value.data.return_value = []
+            mock_driver.session.return_value = mock_session
+
+            agent = Neo4jAgent()
+            agent.query("MATCH (n) RETURN n")
+            mock_session.execute_read.assert_called_once()
+            mock_session.execute_write.assert_not_called()
+
+            agent.query("MERGE (n:Entity {name: $name})", {"name": "x"}, write=True)
+            mock_session.execute_write.assert_called_once()
+            mock_session.run.assert_called_with(
+                "MERGE (n:Entity {name: $name})", {"name": "x"}
+            )
+
+    def test_neo4j_agent_write_retried_on_fresh_session(self, mock_settings):
+        """Test a write whose session is lost is retried on a new session."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase") as mock_db,
+            patch("time.sleep"),
+        ):
+            lost = _managed_session()
+            lost.execute_write.side_effect = ServiceUnavailable("connection lost")
+            fresh = _managed_session()
+            fresh.run.return_value.data.return_value = [{"n": 1}]
+            mock_db.driver.return_value.session.side_effect = [lost, fresh]
+
+            agent = Neo4jAgent()
+            result = agent.query("CREATE (n) RETURN 1 AS n", write=True)
+
+            assert result == [{"n": 1}]
+            lost.close.assert_called_once()
+            fresh.execute_write.assert_called_once()
+            fresh.execute_read.assert_not_called()
+
+    def test_neo4j_agent_query_does_not_retry_other_errors(self, mock_settings):
+        """Test errors other than lost connections fail on the first attempt."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_session = _managed_session()
+            mock_session.execute_read.side_effect = ValueError("syntax error")
+            mock_db.driver.return_value.session.return_value = mock_session
+
+            agent = Neo4jAgent()
+            with pytest.raises(ValueError, match="syntax error"):
+                agent.query("MATCH RETURN")
+
+            mock_session.execute_read.assert_called_once()
+
+    def test_neo4j_agent_query_leaves_transient_errors_to_driver(
+        self, mock_settings
+    ):
+        """Test transient errors are not retried again outside the driver."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_session = _managed_session()
+            mock_session.execute_read.side_effect = TransientError("deadlock")
+            mock_db.driver.return_value.session.return_value = mock_session
+
+            agent = Neo4jAgent()
+            with pytest.raises(TransientError):
+                agent.query("MATCH (n) RETURN n")
+
+            mock_session.execute_read.assert_called_once()
+
     @pytest.mark.asyncio
-    async def test_neo4j_agent_query_async(self, mock_settings):
-        """Test async query execution."""
+    async def test_neo4j_agent_query_async_write(self, mock_settings):
+        """Test async writes run in a managed write transaction."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase"),
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, mock_session = _mock_async_driver([])
+            mock_async_db.driver.return_value = mock_async_driver
+
+            agent = Neo4jAgent()
+            await agent.query_async("CREATE (n)", write=True)
+
+            mock_session.execute_write.assert_awaited_once()
+            mock_session.execute_read.assert_not_called()
+
+    def test_neo4j_agent_query_strips_cypher(self, mock_settings):
+        """Test surrounding whitespace is stripped from Cypher templates."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_session = _managed_session()
+            mock_session.run.return_value.data.return_value = []
+            mock_db.driver.return_value.session.return_value = mock_session
+
+            agent = Neo4jAgent()
+            agent.query("  MATCH (n) RETURN n\n")
+            agent.query("".join(["MATCH (n) ", "RETURN n"]))
+
+            first, second = (c.args[0] for c in mock_session.run.call_args_list)
+            assert first == second == "MATCH (n) RETURN n"
+
+    def test_neo4j_agent_query_iter_streams_records(self, mock_settings):
+        """Test query_iter yields records lazily and closes its session."""
         with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
             mock_driver = MagicMock()
-            mock_driver.verify_connectivity.return_value = None
             mock_db.driver.return_value = mock_driver
+            mock_session = _managed_session()
+            records = []
+            for name in ("a", "b", "c"):
+                record = MagicMock()
+                record.data.return_value = {"name": name}
+                records.append(record)
+            mock_session.run.return_value = iter(records)
+            mock_driver.session.return_value = mock_session
 
-            # Mock session and result
-            mock_session = MagicMock()
-            mock_result = MagicMock()
-            mock_record = MagicMock()
-            mock_record.data.return_value = {"name": "Async Node"}
-            mock_result.__iter__.return_value = [mock_record]
-            mock_session.run.return_value = mock_result
-            mock_driver.session.return_value.__enter__.return_value = mock_session
+            agent = Neo4jAgent()
+            rows = agent.query_iter("MATCH (n) RETURN n", {"limit": 3})
+
+            assert next(rows) == {"name": "a"}
+            records[1].data.assert_not_called()
+            mock_session.close.assert_not_called()
+
+            rows.close()
+            mock_session.close.assert_called_once()
+            mock_session.run.assert_called_once_with(
+                "MATCH (n) RETURN n", {"limit": 3}
+            )
+
+    def test_neo4j_agent_query_timeout(self, mock_settings):
+        """Test a timeout is attached to the managed transaction function."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_session = _managed_session()
+            mock_session.run.return_value.data.return_value = []
+            mock_db.driver.return_value.session.return_value = mock_session
+
+            agent = Neo4jAgent()
+            agent.query("MATCH (n) RETURN n", timeout=5.0)
+            agent.query("MATCH (n) RETURN n")
+
+            timed_work = mock_session.execute_read.call_args_list[0].args[0]
+            plain_work = mock_session.execute_read.call_args_list[1].args[0]
+            assert timed_work.timeout == 5.0
+            assert getattr(plain_work, "timeout", None) is None
+
+    def test_neo4j_agent_query_iter_fetch_size_and_timeout(self, mock_settings):
+        """Test query_iter passes fetch_size to the session and the timeout
+        with the query."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_db.driver.return_value = mock_driver
+            mock_session = _managed_session()
+            mock_session.run.return_value = iter([])
+            mock_driver.session.return_value = mock_session
+
+            agent = Neo4jAgent()
+            list(agent.query_iter("MATCH (n) RETURN n", fetch_size=-1, timeout=30))
+
+            mock_driver.session.assert_called_once_with(fetch_size=-1)
+            query = mock_session.run.call_args.args[0]
+            assert query.text == "MATCH (n) RETURN n"
+            assert query.timeout == 30
+
+    @pytest.mark.asyncio
+    async def test_neo4j_agent_query_iter_async(self, mock_settings):
+        """Test query_iter_async yields records from the async driver."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase"),
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, _ = _mock_async_driver([{"n": 1}, {"n": 2}])
+            mock_async_db.driver.return_value = mock_async_driver
+
+            agent = Neo4jAgent()
+            rows = [row async for row in agent.query_iter_async("MATCH (n) RETURN n")]
+
+            assert rows == [{"n": 1}, {"n": 2}]
+
+    @pytest.mark.asyncio
+    async def test_neo4j_agent_query_async(self, mock_settings):
+        """Test async query execution."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase"),
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, mock_session = _mock_async_driver(
+                [{"name": "Async Node"}]
+            )
+            mock_async_db.driver.return_value = mock_async_driver
 
             agent = Neo4jAgent()
             result = await agent.query_async("MATCH (n) RETURN n")
 
             assert result == [{"name": "Async Node"}]
+            mock_session.run.assert_awaited_once_with("MATCH (n) RETURN n", {})
 
     @pytest.mark.asyncio
     async def test_neo4j_agent_query_async_with_parameters(self, mock_settings):
         """Test async query execution with parameters."""
-        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
-            mock_driver = MagicMock()
-            mock_driver.verify_connectivity.return_value = None
-            mock_db.driver.return_value = mock_driver
-
-            # Mock session and result
-            mock_session = MagicMock()
-            mock_result = MagicMock()
-            mock_record = MagicMock()
-            mock_record.data.return_value = {"name": "Async Node"}
-            mock_result.__iter__.return_value = [mock_record]
-            mock_session.run.return_value = mock_result
-            mock_driver.session.return_value.__enter__.return_value = mock_session
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase"),
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, mock_session = _mock_async_driver(
+                [{"name": "Async Node"}]
+            )
+            mock_async_db.driver.return_value = mock_async_driver
 
             agent = Neo4jAgent()
             parameters = {"id": 123}
             result = await agent.query_async("MATCH (n {id: $id}) RETURN n", parameters)
 
             assert result == [{"name": "Async Node"}]
+            mock_session.run.assert_awaited_once_with(
+                "MATCH (n {id: $id}) RETURN n", parameters
+            )
+
+    @pytest.mark.asyncio
+    async def test_neo4j_agent_async_driver_created_once(self, mock_settings):
+        """Test the async driver is built lazily and shared across queries."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase") as mock_db,
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, _ = _mock_async_driver([])
+            mock_async_db.driver.return_value = mock_async_driver
+
+            agent = Neo4jAgent(eager=True)
+            mock_async_db.driver.assert_not_called()
+
+            await agent.query_async("MATCH (n) RETURN n")
+            await agent.query_async("MATCH (m) RETURN m")
+
+            mock_async_db.driver.assert_called_once()
+            mock_db.driver.return_value.session.assert_not_called()
+
+            await agent.aclose()
+            mock_async_driver.close.assert_awaited_once()
+            mock_db.driver.return_value.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_neo4j_agent_concurrent_queries_use_own_sessions(
+        self, mock_settings
+    ):
+        """Test concurrent async queries each run on their own session."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase"),
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, mock_session = _mock_async_driver([{"n": 1}])
+            mock_async_db.driver.return_value = mock_async_driver
+
+            agent = Neo4jAgent()
+            results = await asyncio.gather(
+                agent.query_async("MATCH (a) RETURN a"),
+                agent.query_async("MATCH (b) RETURN b", {"x": 1}),
+                agent.query_async("MATCH (c) RETURN c"),
+            )
+
+            assert results == [[{"n": 1}]] * 3
+            assert mock_async_driver.session.call_count == 3
+            assert sorted(c.args for c in mock_session.run.await_args_list) == [
+                ("MATCH (a) RETURN a", {}),
+                ("MATCH (b) RETURN b", {"x": 1}),
+                ("MATCH (c) RETURN c", {}),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_neo4j_agent_concurrent_failure_is_per_query(self, mock_settings):
+        """Test a failing async query does not fail concurrent ones."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase"),
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, mock_session = _mock_async_driver([{"n": 1}])
+            mock_async_db.driver.return_value = mock_async_driver
+            run = mock_session.run.side_effect
+
+            async def flaky_run(cypher, parameters):
+                if cypher == "BROKEN":
+                    raise Exception("syntax error")
+                return run(cypher, parameters)
+
+            mock_session.run.side_effect = flaky_run
+
+            agent = Neo4jAgent()
+            ok, failed = await asyncio.gather(
+                agent.query_async("MATCH (n) RETURN n"),
+                agent.query_async("BROKEN"),
+                return_exceptions=True,
+            )
+
+            assert ok == [{"n": 1}]
+            assert str(failed) == "syntax error"
+
+    def test_neo4j_agent_shutdown_closes_async_driver_on_its_loop(
+        self, mock_settings
+    ):
+        """Test shutdown closes async drivers on the loop that created them."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase"),
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, _ = _mock_async_driver([])
+            mock_async_db.driver.return_value = mock_async_driver
+            closed_on = []
+
+            async def close():
+                closed_on.append(asyncio.get_running_loop())
+
+            mock_async_driver.close = AsyncMock(side_effect=close)
+
+            loop = asyncio.new_event_loop()
+            worker = threading.Thread(target=loop.run_forever)
+            worker.start()
+            try:
+                agent = Neo4jAgent()
+                asyncio.run_coroutine_threadsafe(
+                    agent.query_async("MATCH (n) RETURN n"), loop
+                ).result(5)
+
+                Neo4jAgent.shutdown()
+
+                assert closed_on == [loop]
+                assert agent._async_driver is None
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                worker.join()
+                loop.close()
+
+    def test_neo4j_agent_aclose_from_other_loop(self, mock_settings):
+        """Test aclose on another loop closes the driver on its own loop."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase"),
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, _ = _mock_async_driver([])
+            mock_async_db.driver.return_value = mock_async_driver
+            closed_on = []
+
+            async def close():
+                closed_on.append(asyncio.get_running_loop())
+
+            mock_async_driver.close = AsyncMock(side_effect=close)
+
+            owner = asyncio.new_event_loop()
+            try:
+                agent = Neo4jAgent()
+                owner.run_until_complete(agent.query_async("MATCH (n) RETURN n"))
+                asyncio.run(agent.aclose())
+
+                # The owning loop had stopped, so the close ran on it directly
+                assert closed_on == [owner]
+                assert agent._async_driver is None
+            finally:
+                owner.close()
+
+    def test_neo4j_agent_query_async_other_loop_uses_sync_driver(self, mock_settings):
+        """Test calls from a loop other than the driver's use the sync driver."""
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase") as mock_db,
+            patch("src.tools.neo4j_agent.AsyncGraphDatabase") as mock_async_db,
+        ):
+            mock_async_driver, _ = _mock_async_driver([{"name": "Async Node"}])
+            mock_async_db.driver.return_value = mock_async_driver
+            threads = []
+            mock_session = _managed_session()
+            mock_session.run.side_effect = lambda *args: threads.append(
+                threading.current_thread().name
+            ) or MagicMock(**{"data.return_value": []})
+            mock_db.driver.return_value.session.return_value = mock_session
+
+            agent = Neo4jAgent()
+            assert asyncio.run(agent.query_async("MATCH (n) RETURN n")) == [
+                {"name": "Async Node"}
+            ]
+            assert asyncio.run(agent.query_async("MATCH (n) RETURN n")) == []
+
+            mock_async_db.driver.assert_called_once()
+            mock_session.run.assert_called_once_with("MATCH (n) RETURN n", {})
+            # Blocking fallback runs on the dedicated Neo4j pool
+            assert threads[0].startswith("neo4j")
 
     def test_neo4j_agent_execute_query_sync(self, mock_settings):
         """Test internal _execute_query_sync method."""
@@ -182,13 +628,11 @@ class TestNeo4jAgent:
             mock_db.driver.return_value = mock_driver
 
             # Mock session and result
-            mock_session = MagicMock()
+            mock_session = _managed_session()
             mock_result = MagicMock()
-            mock_record = MagicMock()
-            mock_record.data.return_value = {"name": "Sync Node"}
-            mock_result.__iter__.return_value = [mock_record]
+            mock_result.data.return_value = [{"name": "Sync Node"}]
             mock_session.run.return_value = mock_result
-            mock_driver.session.return_value.__enter__.return_value = mock_session
+            mock_driver.session.return_value = mock_session
 
             agent = Neo4jAgent()
             result = agent._execute_query_sync("MATCH (n) RETURN n", {"param": "value"})
@@ -212,15 +656,90 @@ class TestNeo4jAgent:
 
     def test_neo4j_agent_connection_pooling(self, mock_settings):
         """Test that Neo4jAgent uses connection pooling."""
-        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+        with (
+            patch("src.tools.neo4j_agent.GraphDatabase") as mock_db,
+            patch("src.tools.neo4j_agent.settings", mock_settings),
+        ):
             mock_driver = MagicMock()
             mock_driver.verify_connectivity.return_value = None
             mock_db.driver.return_value = mock_driver
 
-            Neo4jAgent()
+            Neo4jAgent(eager=True)
 
             # Verify that driver was created with connection pooling
             mock_db.driver.assert_called_once()
             call_args = mock_db.driver.call_args
             assert "max_connection_pool_size" in call_args.kwargs
             assert call_args.kwargs["max_connection_pool_size"] == 10
+
+    def test_neo4j_agent_query_opens_session_per_query(self, mock_settings):
+        """Test each query runs on its own session, closed afterwards."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_db.driver.return_value = mock_driver
+            sessions = []
+
+            def new_session():
+                session = _managed_session()
+                session.run.return_value.data.return_value = []
+                sessions.append(session)
+                return session
+
+            mock_driver.session.side_effect = new_session
+
+            agent = Neo4jAgent()
+            agent.query("MATCH (n) RETURN n")
+            worker = threading.Thread(target=agent.query, args=("MATCH (n) RETURN n",))
+            worker.start()
+            worker.join()
+
+            assert len(sessions) == 2
+            for session in sessions:
+                session.close.assert_called_once()
+
+    def test_neo4j_agent_closes_failed_session(self, mock_settings):
+        """Test a failing query still closes its session."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_db.driver.return_value = mock_driver
+            broken = _managed_session()
+            broken.run.side_effect = Exception("connection reset")
+            healthy = _managed_session()
+            healthy.run.return_value.data.return_value = []
+            mock_driver.session.side_effect = [broken, healthy]
+
+            agent = Neo4jAgent()
+            with pytest.raises(Exception, match="connection reset"):
+                agent._execute_query_sync("MATCH (n) RETURN n", {})
+            assert agent._execute_query_sync("MATCH (n) RETURN n", {}) == []
+
+            broken.close.assert_called_once()
+
+    def test_neo4j_agents_share_one_driver(self, mock_settings):
+        """Test agents reuse the process-wide driver and verify it once."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_driver = MagicMock()
+            mock_db.driver.return_value = mock_driver
+
+            first = Neo4jAgent(eager=True)
+            second = Neo4jAgent(eager=True)
+
+            assert first._driver is second._driver is mock_driver
+            mock_db.driver.assert_called_once()
+            mock_driver.verify_connectivity.assert_called_once()
+
+    def test_neo4j_agent_instance_is_shared(self, mock_settings):
+        """Test instance() returns one agent until shutdown."""
+        with patch("src.tools.neo4j_agent.GraphDatabase") as mock_db:
+            mock_db.driver.side_effect = lambda *args, **kwargs: MagicMock()
+
+            agent = Neo4jAgent.instance()
+            assert Neo4jAgent.instance() is agent
+            agent._ensure_driver()
+
+            Neo4jAgent.shutdown()
+            replacement = Neo4jAgent.instance()
+            replacement._ensure_driver()
+
+            assert replacement is not agent
+            assert mock_db.driver.call_count == 2
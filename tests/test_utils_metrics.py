@@ -1,6 +1,7 @@
 """Tests for the metrics collection module."""
 
 import threading
+import asyncio
 import time
 
 import pytest
@@ -187,6 +188,22 @@ class TestMetricsCollection:
         assert "error_function" in metrics["timers"]
         assert metrics["timers"]["error_function"]["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_timed_decorator_awaits_coroutines(self):
+        """Test that timed measures the awaited duration of async functions."""
+        reset_metrics()
+
+        @timed("async_function")
+        async def async_function():
+            await asyncio.sleep(0.01)
+            return "success"
+
+        assert await async_function() == "success"
+
+        metrics = get_metrics()
+        assert metrics["timers"]["async_function"]["count"] == 1
+        assert metrics["timers"]["async_function"]["avg"] >= 10
+
     def test_thread_safety(self):
         """Test that metrics collection is thread-safe."""
         reset_metrics()
@@ -4,7 +4,7 @@ import time
 
 import pytest
 
-from src.utils.retry import retry
+from src.utils.retry import retry, retry_on
 
 
 class TestRetryDecorator:
@@ -262,3 +262,37 @@ class TestRetryDecorator:
 
         assert result == "lambda_success"
         assert call_count == 2
+
+
+class TestRetryOnDecorator:
+    """Test the exception-filtered retry decorator."""
+
+    def test_retry_on_retries_listed_exceptions(self):
+        """Test that listed exceptions are retried until success."""
+        call_count = 0
+
+        @retry_on(ConnectionError)
+        def flaky_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise ConnectionError("Temporary failure")
+            return "success"
+
+        assert flaky_function() == "success"
+        assert call_count == 2
+
+    def test_retry_on_raises_other_exceptions_immediately(self):
+        """Test that unlisted exceptions are not retried."""
+        call_count = 0
+
+        @retry_on(ConnectionError)
+        def broken_function():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Permanent failure")
+
+        with pytest.raises(ValueError, match="Permanent failure"):
+            broken_function()
+
+        assert call_count == 1
@@ -157,7 +157,7 @@ def test_synthesizer_node_creates_final_response(initial_state):
 
     with patch("src.orchestration.nodes._get_ollama_client") as mock_get_client:
         mock_client = MagicMock()
-        mock_client.generate.return_value = mock_response
+        mock_client.generate.return_value = iter([mock_response])
         mock_get_client.return_value = mock_client
 
         result = synthesizer_node(initial_state)